@@ -0,0 +1,83 @@
+"""Prompt templates for WritingAgent, compiled once at import."""
+
+from __future__ import annotations
+
+from jinja2 import BaseLoader, Environment
+
+ENV = Environment(
+    loader=BaseLoader(),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+)
+
+SCENE_SRC = """Write a polished prose scene based on these inputs.
+
+SCENE PLAN:
+- Location: {{ scene_plan.get('location', 'unknown') }}
+- Characters: {{ scene_plan.get('characters_present', []) }}
+- Goal: {{ scene_plan.get('scene_goal', '') }}
+- Conflict: {{ scene_plan.get('conflict', '') }}
+- Expected outcome: {{ scene_plan.get('expected_outcome', '') }}
+- Beats: {{ scene_plan.get('beats', []) }}
+- POV: {{ scene_plan.get('pov_character', 'third person limited') }}
+
+SETTING DETAILS:
+{{ setting_text }}
+
+CHARACTER REACTIONS:
+{{ reactions_text or "No character reactions provided." }}
+
+DIALOGUE TO INCORPORATE:
+{{ dialogue_text or "Generate appropriate dialogue." }}
+
+WRITING INSTRUCTIONS:
+- Write in third person limited POV from {{ scene_plan.get('pov_character', 'the protagonist') }}'s perspective
+- Show, don't tell — use sensory details and body language
+- Weave dialogue naturally into the narrative
+- Follow the beat structure but make transitions smooth
+- Create vivid, immersive prose
+- Vary sentence length and structure for rhythm
+- End the scene with forward momentum
+
+Write the complete scene as polished prose. No meta-commentary or notes — only the story text."""
+
+REVISE_SRC = """Revise this chapter draft based on the following feedback.
+
+FEEDBACK:
+{{ feedback_text }}
+
+CURRENT DRAFT:
+{{ text }}
+
+INSTRUCTIONS:
+- Address each piece of feedback specifically
+- Maintain the overall structure and voice
+- Preserve what works well
+- Make targeted improvements, not wholesale rewrites
+
+Write the revised version. Only output the revised text, no commentary."""
+
+# Scenes are written straight into the rendered output rather than joined
+# into an intermediate string first.
+CHAPTER_SRC = """Assemble these scenes into a cohesive chapter. Add smooth transitions between scenes where needed.
+
+{{ "Chapter " ~ chapter_number ~ ": " ~ chapter_title if chapter_title else "" }}
+
+SCENES:
+{% for scene in scenes %}{{ scene }}{% if not loop.last %}{{ scene_separator }}{% endif %}{% endfor +%}
+
+INSTRUCTIONS:
+- Add brief transitions between scenes if needed
+- Ensure consistent tone throughout
+- The chapter should read as one continuous piece, not separate fragments
+- Add a chapter opening line if the first scene doesn't have one
+- Do NOT add a chapter heading — just the prose
+
+Write the complete chapter. Only output the story text."""
+
+SCENE_SEPARATOR = "\n\n---SCENE BREAK---\n\n"
+
+SCENE_TMPL = ENV.from_string(SCENE_SRC)
+REVISE_TMPL = ENV.from_string(REVISE_SRC)
+CHAPTER_TMPL = ENV.from_string(CHAPTER_SRC)
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import json
 import logging
-import re
-from abc import ABC, abstractmethod
+from abc import ABC
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, ClassVar, Optional
 
 from jinja2 import Environment, FileSystemLoader
 
@@ -19,6 +19,25 @@ from storyforge.memory.context_window import ContextWindowManager
 
 logger = logging.getLogger(__name__)
 
+# Prior messages replayed to the LLM with each generate() call
+HISTORY_WINDOW = 10
+
+EventHandlerMethod = Callable[[Any, Event], Awaitable[Optional[Event]]]
+
+
+def handles(*event_types: EventType) -> Callable[[EventHandlerMethod], EventHandlerMethod]:
+    """Register an agent method as the handler for the given event types."""
+
+    def decorator(func: EventHandlerMethod) -> EventHandlerMethod:
+        func._handles_events = event_types  # type: ignore[attr-defined]
+        return func
+
+    return decorator
+
+
+async def _ignore_event(agent: Any, event: Event) -> None:
+    return None
+
 
 @dataclass
 class AgentConfig:
@@ -37,6 +56,21 @@ class AgentConfig:
 class BaseAgent(ABC):
     """Abstract base class for all StoryForge agents."""
 
+    # Event type -> handler function, built per class from @handles methods.
+    _dispatch: ClassVar[dict[EventType, EventHandlerMethod]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Inherited entries resolve to the subclass's override, if any
+        dispatch = {
+            event_type: getattr(cls, handler.__name__)
+            for event_type, handler in cls._dispatch.items()
+        }
+        for attr in vars(cls).values():
+            for event_type in getattr(attr, "_handles_events", ()):
+                dispatch[event_type] = attr
+        cls._dispatch = dispatch
+
     def __init__(
         self,
         config: AgentConfig,
@@ -51,6 +85,8 @@ class BaseAgent(ABC):
         self.event_bus = event_bus
         self.prompt_dir = prompt_dir
         self._system_prompt: str = ""
+        # (system prompt, rendered system message) for the last prompt seen
+        self._system_content: tuple[Optional[str], str] = (None, "")
         self._conversation_history: list[dict[str, str]] = []
         self._jinja_env: Optional[Environment] = None
         if prompt_dir and prompt_dir.exists():
@@ -76,45 +112,60 @@ class BaseAgent(ABC):
         # Load system prompt
         await self._load_system_prompt()
 
-    @abstractmethod
     async def handle_event(self, event: Event) -> Optional[Event]:
         """Process an incoming event. Return a response event or None."""
-        ...
+        return await self._dispatch.get(event.event_type, _ignore_event)(self, event)
 
     async def generate(self, prompt: str, **kwargs: Any) -> str:
         """Send prompt to LLM with system prompt and return response."""
-        system_content = self._system_prompt
-        # Prepend language instruction if configured
-        language = self.config.prompt_variables.get("language", "")
-        if language and language.lower() != "english":
-            system_content = (
-                f"IMPORTANT: You MUST write ALL prose, dialogue, descriptions, "
-                f"titles, and narrative content in {language}. "
-                f"Only keep JSON keys and structural labels in English.\n\n"
-                + system_content
-            )
-        messages = [{"role": "system", "content": system_content}]
-        # Add conversation history (limited)
-        messages.extend(self._conversation_history[-10:])
-        messages.append({"role": "user", "content": prompt})
-
         response = await self.llm.generate(
-            messages=messages,
+            messages=self._request_messages(prompt),
             temperature=kwargs.get("temperature", self.config.temperature),
             max_tokens=kwargs.get("max_tokens"),
         )
 
+        self._record_exchange(prompt, response.content)
+        return response.content
+
+    def _request_messages(self, prompt: str) -> list[dict[str, str]]:
+        """The messages generate() sends for a prompt."""
+        messages = [{"role": "system", "content": self._system_message()}]
+        # Add conversation history (limited)
+        messages.extend(self._conversation_history[-HISTORY_WINDOW:])
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _record_exchange(self, prompt: str, reply: str) -> None:
+        """Append a prompt/reply pair to the history replayed by generate()."""
         # Track history (keep last 20 exchanges to bound memory usage)
         self._conversation_history.append(
             {"role": "user", "content": prompt}
         )
         self._conversation_history.append(
-            {"role": "assistant", "content": response.content}
+            {"role": "assistant", "content": reply}
         )
         if len(self._conversation_history) > 20:
             self._conversation_history = self._conversation_history[-20:]
 
-        return response.content
+    def _system_message(self) -> str:
+        """Return the system message, re-rendering only when the prompt changes.
+
+        The result is identical across calls, so providers with prompt-prefix
+        caching can reuse it.
+        """
+        if self._system_content[0] is not self._system_prompt:
+            content = self._system_prompt
+            # Prepend language instruction if configured
+            language = self.config.prompt_variables.get("language", "")
+            if language and language.lower() != "english":
+                content = (
+                    f"IMPORTANT: You MUST write ALL prose, dialogue, descriptions, "
+                    f"titles, and narrative content in {language}. "
+                    f"Only keep JSON keys and structural labels in English.\n\n"
+                    + content
+                )
+            self._system_content = (self._system_prompt, content)
+        return self._system_content[1]
 
     async def _load_system_prompt(self) -> None:
         """Render the system prompt from Jinja2 template."""
@@ -142,10 +193,22 @@ class BaseAgent(ABC):
         self._conversation_history.clear()
 
 
-def strip_json_fences(text: str) -> str:
-    """Strip markdown code fences (```json ... ```) from LLM responses."""
-    text = text.strip()
-    # Remove ```json or ``` prefix and ``` suffix
-    text = re.sub(r'^```(?:json)?\s*\n?', '', text)
-    text = re.sub(r'\n?```\s*$', '', text)
-    return text.strip()
+_JSON_DECODER = json.JSONDecoder()
+
+
+def parse_json_response(text: str) -> Any:
+    """Parse the first JSON value in an LLM response in a single pass.
+
+    Decoding starts at the first ``{`` or ``[`` and stops at the end of that
+    value, so markdown fences and any chatter around the payload are skipped
+    without a separate stripping pass.
+    """
+    starts = sorted(i for i in (text.find("{"), text.find("[")) if i != -1)
+    if not starts:
+        raise json.JSONDecodeError("No JSON value found", text, 0)
+    try:
+        return _JSON_DECODER.raw_decode(text, starts[0])[0]
+    except json.JSONDecodeError:
+        if len(starts) == 1:
+            raise
+        return _JSON_DECODER.raw_decode(text, starts[1])[0]
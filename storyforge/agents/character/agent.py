@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import Any, Optional
 
-from storyforge.agents.base import AgentConfig, BaseAgent, strip_json_fences
+from storyforge.agents.base import AgentConfig, BaseAgent, handles, parse_json_response
 from storyforge.agents.registry import AgentRegistry
 from storyforge.agents.character.types import (
     CharacterType,
@@ -49,17 +49,7 @@ class EnhancedCharacterAgent(BaseAgent):
         )
         self._system_prompt = self._build_character_system_prompt()
 
-    async def handle_event(self, event: Event) -> Optional[Event]:
-        """Handle events with type-aware processing."""
-        handlers = {
-            EventType.CHARACTER_REACTION_REQUEST: self._handle_reaction,
-            EventType.DIALOGUE_REQUEST: self._handle_dialogue,
-        }
-        handler = handlers.get(event.event_type)
-        if handler:
-            return await handler(event)
-        return None
-
+    @handles(EventType.CHARACTER_REACTION_REQUEST)
     async def _handle_reaction(self, event: Event) -> Event:
         """Generate type-aware character reaction."""
         scene_plan = event.payload.get("scene_plan", {})
@@ -86,6 +76,7 @@ class EnhancedCharacterAgent(BaseAgent):
             self.config.name,
         )
 
+    @handles(EventType.DIALOGUE_REQUEST)
     async def _handle_dialogue(self, event: Event) -> Event:
         """Generate dialogue with relationship and type awareness."""
         beat = event.payload.get("beat", "")
@@ -209,7 +200,7 @@ Respond as JSON:
 
         response = await self.generate(prompt, temperature=0.8)
         try:
-            data = json.loads(strip_json_fences(response))
+            data = parse_json_response(response)
 
             # Update emotional state if shift occurred
             if data.get("emotional_shift"):
@@ -302,7 +293,7 @@ Respond as JSON:
 
         response = await self.generate(prompt, temperature=0.85)
         try:
-            data = json.loads(strip_json_fences(response))
+            data = parse_json_response(response)
             return {
                 "character_name": self.character_sheet.name,
                 "text": data.get("text", ""),
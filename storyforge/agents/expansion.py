@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Optional
+from typing import Any
 
-from storyforge.agents.base import BaseAgent, strip_json_fences
+from storyforge.agents.base import BaseAgent, handles, parse_json_response
 from storyforge.agents.registry import AgentRegistry
 from storyforge.events.types import Event, EventType
 
@@ -17,11 +17,7 @@ logger = logging.getLogger(__name__)
 class ExpansionAgent(BaseAgent):
     """Expands extracted scene info into rich, detailed visual narratives."""
 
-    async def handle_event(self, event: Event) -> Optional[Event]:
-        if event.event_type == EventType.VISUAL_EXPAND_REQUEST:
-            return await self._handle_expand(event)
-        return None
-
+    @handles(EventType.VISUAL_EXPAND_REQUEST)
     async def _handle_expand(self, event: Event) -> Event:
         extraction = event.payload.get("extraction", {})
         expanded = await self.expand(extraction)
@@ -98,7 +94,7 @@ Respond as JSON:
 }}"""
         response = await self.generate(prompt, temperature=0.7)
         try:
-            return json.loads(strip_json_fences(response))
+            return parse_json_response(response)
         except json.JSONDecodeError:
             logger.warning("Failed to parse expansion JSON")
             return {
@@ -125,7 +121,7 @@ Create detailed scene_narrative, image_prompt, and video_prompt.
 Respond as JSON with scene_narrative, image_prompt, video_prompt, lighting, color_palette, camera_direction, mood_keywords."""
         response = await self.generate(prompt, temperature=0.7)
         try:
-            return json.loads(strip_json_fences(response))
+            return parse_json_response(response)
         except json.JSONDecodeError:
             return {
                 "scene_narrative": response,
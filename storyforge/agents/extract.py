@@ -6,9 +6,9 @@ import base64
 import json
 import logging
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any
 
-from storyforge.agents.base import BaseAgent, strip_json_fences
+from storyforge.agents.base import BaseAgent, handles, parse_json_response
 from storyforge.agents.registry import AgentRegistry
 from storyforge.events.types import Event, EventType
 
@@ -19,11 +19,7 @@ logger = logging.getLogger(__name__)
 class ExtractAgent(BaseAgent):
     """Analyzes input text/images using GPT-4o vision to extract scene data."""
 
-    async def handle_event(self, event: Event) -> Optional[Event]:
-        if event.event_type == EventType.VISUAL_EXTRACT_REQUEST:
-            return await self._handle_extract(event)
-        return None
-
+    @handles(EventType.VISUAL_EXTRACT_REQUEST)
     async def _handle_extract(self, event: Event) -> Event:
         text_input = event.payload.get("text", "")
         image_paths = event.payload.get("image_paths", [])
@@ -119,7 +115,7 @@ Extract the following in JSON format:
         )
 
         try:
-            return json.loads(strip_json_fences(response.content))
+            return parse_json_response(response.content)
         except json.JSONDecodeError:
             logger.warning("Failed to parse extraction JSON, returning raw")
             return {
@@ -5,16 +5,21 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any
 
-from storyforge.agents.base import BaseAgent, strip_json_fences
+from storyforge.agents.base import BaseAgent, handles, parse_json_response
 from storyforge.agents.registry import AgentRegistry
 from storyforge.events.types import Event, EventType
+from storyforge.utils.compat import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
+# Previous chapters quoted verbatim in the planning prompt. Older chapters are
+# folded into the "rolling_synopsis" memory entry so the prompt stays bounded.
+MAX_RECENT_SUMMARIES = 5
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ScenePlan:
     """Detailed plan for a single scene."""
 
@@ -42,7 +47,7 @@ class ScenePlan:
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ChapterOutline:
     """Complete outline for a chapter."""
 
@@ -78,8 +83,18 @@ class ChapterOutline:
             emotional_arc=data.get("emotional_arc", ""),
         )
 
+    @classmethod
+    def from_json(cls, text: str) -> "ChapterOutline":
+        """Decode an outline from an LLM response, rejecting non-object payloads."""
+        data = parse_json_response(text)
+        if not isinstance(data, dict):
+            raise ValueError(
+                f"Expected a JSON object for chapter outline, got {type(data).__name__}"
+            )
+        return cls.from_dict(data)
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PlotOutline:
     """High-level story structure."""
 
@@ -93,17 +108,7 @@ class PlotOutline:
 class PlotAgent(BaseAgent):
     """Drives narrative structure, pacing, conflict arcs, and scene planning."""
 
-    async def handle_event(self, event: Event) -> Optional[Event]:
-        handlers = {
-            EventType.CHAPTER_PLAN_REQUEST: self._handle_chapter_plan,
-            EventType.PACING_CHECK_REQUEST: self._handle_pacing_check,
-            EventType.QUALITY_CHECK_REQUEST: self._handle_quality_check,
-        }
-        handler = handlers.get(event.event_type)
-        if handler:
-            return await handler(event)
-        return None
-
+    @handles(EventType.CHAPTER_PLAN_REQUEST)
     async def _handle_chapter_plan(self, event: Event) -> Event:
         chapter_number = event.payload.get("chapter_number", 1)
         available_characters = event.payload.get("available_characters", [])
@@ -114,6 +119,7 @@ class PlotAgent(BaseAgent):
             self.config.name,
         )
 
+    @handles(EventType.PACING_CHECK_REQUEST)
     async def _handle_pacing_check(self, event: Event) -> Event:
         chapter_text = event.payload.get("chapter_text", "")
         feedback = await self.evaluate_pacing(chapter_text)
@@ -123,6 +129,7 @@ class PlotAgent(BaseAgent):
             self.config.name,
         )
 
+    @handles(EventType.QUALITY_CHECK_REQUEST)
     async def _handle_quality_check(self, event: Event) -> Event:
         chapter_text = event.payload.get("chapter_text", "")
         outline = event.payload.get("outline", {})
@@ -140,12 +147,15 @@ class PlotAgent(BaseAgent):
         # Get plot outline and previous chapter summaries
         plot_data = await self.memory.retrieve("plot_outline") or {}
         summaries = await self.memory.retrieve("chapter_summaries") or []
+        synopsis = await self.memory.retrieve("rolling_synopsis") or ""
 
-        summary_text = ""
-        if summaries:
-            summary_text = "\n".join(
-                f"Chapter {i+1}: {s}" for i, s in enumerate(summaries)
-            )
+        recent = summaries[-MAX_RECENT_SUMMARIES:]
+        first_recent = len(summaries) - len(recent) + 1
+        summary_lines = [f"Story so far: {synopsis}"] if synopsis else []
+        summary_lines.extend(
+            f"Chapter {first_recent + i}: {s}" for i, s in enumerate(recent)
+        )
+        summary_text = "\n".join(summary_lines)
 
         prev_section = f"Previous chapters:\n{summary_text}" if summary_text else "This is the first chapter."
         outline_text = json.dumps(plot_data, indent=2, ensure_ascii=False) if isinstance(plot_data, dict) else str(plot_data)
@@ -191,9 +201,8 @@ Create a detailed chapter plan. Respond as JSON:
 Include 2-4 scenes per chapter. Each scene should advance the plot and develop characters."""
         response = await self.generate(prompt, temperature=0.7)
         try:
-            data = json.loads(strip_json_fences(response))
-            return ChapterOutline.from_dict(data)
-        except json.JSONDecodeError:
+            return ChapterOutline.from_json(response)
+        except ValueError:
             # Fallback: minimal outline
             logger.warning("Failed to parse chapter plan JSON, using fallback")
             return ChapterOutline(
@@ -237,7 +246,7 @@ Respond as JSON:
 }}"""
         response = await self.generate(prompt, temperature=0.4)
         try:
-            return json.loads(strip_json_fences(response))
+            return parse_json_response(response)
         except json.JSONDecodeError as e:
             logger.warning(
                 "Failed to parse pacing evaluation JSON: %s. Response: %.200s",
@@ -266,7 +275,7 @@ List any issues:
 Respond as a JSON array of issue strings. If no issues, respond with []."""
         response = await self.generate(prompt, temperature=0.3)
         try:
-            result = json.loads(strip_json_fences(response))
+            result = parse_json_response(response)
             return result if isinstance(result, list) else []
         except json.JSONDecodeError as e:
             logger.warning(
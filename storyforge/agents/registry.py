@@ -25,12 +25,13 @@ class AgentRegistry:
     @classmethod
     def get(cls, role: str) -> Type[BaseAgent]:
         """Get an agent class by role name."""
-        if role not in cls._agent_types:
+        try:
+            return cls._agent_types[role]
+        except KeyError:
             raise ValueError(
                 f"Unknown agent role: {role}. "
                 f"Available: {list(cls._agent_types.keys())}"
-            )
-        return cls._agent_types[role]
+            ) from None
 
     @classmethod
     def list_roles(cls) -> list[str]:
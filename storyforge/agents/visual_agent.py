@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
-from storyforge.agents.base import AgentConfig, BaseAgent
+from storyforge.agents.base import AgentConfig, BaseAgent, handles
 from storyforge.agents.registry import AgentRegistry
 from storyforge.events.bus import EventBus
 from storyforge.events.types import Event, EventType
@@ -17,6 +18,48 @@ from storyforge.visual.base import GenerationStatus, VisualBackend
 
 logger = logging.getLogger(__name__)
 
+# Minimum word-set overlap between the raw and optimized image prompts for a
+# speculatively started image to be kept.
+SPECULATIVE_SIMILARITY_THRESHOLD = 0.85
+
+
+def _prompt_similarity(a: str, b: str) -> float:
+    """Jaccard similarity of the lowercased word sets of two prompts."""
+    words_a = set(a.lower().split())
+    words_b = set(b.lower().split())
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+def _discard(future: asyncio.Future) -> None:
+    """Cancel a future nobody will await, retrieving any error it ends with.
+
+    A backend call may answer cancellation by raising its own error; since
+    the future is never awaited, asyncio would log that error as never
+    retrieved.
+    """
+    future.cancel()
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+
+@dataclass
+class VisualGeneratePayload:
+    """Typed view of a VISUAL_GENERATE_REQUEST payload."""
+
+    expanded_scene: dict[str, Any] = field(default_factory=dict)
+    output_dir: str = "output/visuals"
+    scene_index: int = 0
+    generate_image: bool = True
+    generate_video: bool = True
+    image_size: Optional[str] = None
+    video_size: Optional[str] = None
+    video_duration: int = 8
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "VisualGeneratePayload":
+        return cls(**{k: v for k, v in payload.items() if k in cls.__dataclass_fields__})
+
 
 @AgentRegistry.register("visual")
 class VisualAgent(BaseAgent):
@@ -31,35 +74,25 @@ class VisualAgent(BaseAgent):
         image_backend: Optional[VisualBackend] = None,
         video_backend: Optional[VisualBackend] = None,
         prompt_dir: Optional[Path] = None,
+        speculative_images: bool = False,
     ) -> None:
         super().__init__(config, llm, memory, event_bus, prompt_dir)
         self._image_backend = image_backend
         self._video_backend = video_backend
+        self._speculative_images = speculative_images
 
-    async def handle_event(self, event: Event) -> Optional[Event]:
-        if event.event_type == EventType.VISUAL_GENERATE_REQUEST:
-            return await self._handle_generate(event)
-        return None
-
+    @handles(EventType.VISUAL_GENERATE_REQUEST)
     async def _handle_generate(self, event: Event) -> Event:
-        expanded_scene = event.payload.get("expanded_scene", {})
-        output_dir = event.payload.get("output_dir", "output/visuals")
-        scene_index = event.payload.get("scene_index", 0)
-        generate_image = event.payload.get("generate_image", True)
-        generate_video = event.payload.get("generate_video", True)
-        image_size = event.payload.get("image_size")
-        video_size = event.payload.get("video_size")
-        video_duration = event.payload.get("video_duration", 8)
-
+        request = VisualGeneratePayload.from_payload(event.payload)
         results = await self.generate_visuals(
-            expanded_scene=expanded_scene,
-            output_dir=output_dir,
-            scene_index=scene_index,
-            generate_image=generate_image,
-            generate_video=generate_video,
-            image_size=image_size,
-            video_size=video_size,
-            video_duration=video_duration,
+            expanded_scene=request.expanded_scene,
+            output_dir=request.output_dir,
+            scene_index=request.scene_index,
+            generate_image=request.generate_image,
+            generate_video=request.generate_video,
+            image_size=request.image_size,
+            video_size=request.video_size,
+            video_duration=request.video_duration,
         )
 
         return event.create_response(
@@ -86,31 +119,68 @@ class VisualAgent(BaseAgent):
         image_prompt = expanded_scene.get("image_prompt", "")
         video_prompt = expanded_scene.get("video_prompt", "")
 
-        if image_prompt:
-            image_prompt = await self._optimize_prompt(image_prompt, "image")
-        if video_prompt:
-            video_prompt = await self._optimize_prompt(video_prompt, "video")
+        # Optionally start the image from the raw prompt while the LLM optimizes
+        # it; the result is kept only if optimization barely changed the prompt.
+        speculative: Optional[asyncio.Future] = None
+        if (
+            self._speculative_images
+            and generate_image
+            and self._image_backend
+            and image_prompt
+        ):
+            speculative = asyncio.ensure_future(
+                self._image_backend.generate(prompt=image_prompt, size=image_size)
+            )
+        raw_image_prompt = image_prompt
+
+        try:
+            if image_prompt:
+                image_prompt = await self._optimize_prompt(image_prompt, "image")
+            if video_prompt:
+                video_prompt = await self._optimize_prompt(video_prompt, "video")
+        except BaseException:
+            if speculative is not None:
+                _discard(speculative)
+            raise
 
-        tasks = []
-        if generate_image and self._image_backend and image_prompt:
-            tasks.append(
-                self._generate_image(image_prompt, output_dir, scene_index, image_size)
+        if speculative is not None and (
+            _prompt_similarity(raw_image_prompt, image_prompt)
+            < SPECULATIVE_SIMILARITY_THRESHOLD
+        ):
+            _discard(speculative)
+            speculative = None
+
+        jobs: dict[str, Any] = {}
+        if speculative is not None:
+            jobs["image"] = self._generate_image(
+                raw_image_prompt, output_dir, scene_index, image_size, speculative
+            )
+        elif generate_image and self._image_backend and image_prompt:
+            jobs["image"] = self._generate_image(
+                image_prompt, output_dir, scene_index, image_size
             )
         if generate_video and self._video_backend and video_prompt:
-            tasks.append(
-                self._generate_video(
-                    video_prompt, output_dir, scene_index, video_size, video_duration
-                )
+            jobs["video"] = self._generate_video(
+                video_prompt, output_dir, scene_index, video_size, video_duration
             )
 
-        if tasks:
-            gathered = await asyncio.gather(*tasks, return_exceptions=True)
-            for item in gathered:
-                if isinstance(item, dict):
-                    results.update(item)
-                elif isinstance(item, Exception):
-                    logger.error("Visual generation failed: %s", item)
-                    results.setdefault("errors", []).append(str(item))
+        if jobs:
+            tasks = {media: asyncio.ensure_future(job) for media, job in jobs.items()}
+            try:
+                await asyncio.wait(tasks.values())
+            finally:
+                # No-op for finished tasks; stops backend work if we were cancelled
+                for task in tasks.values():
+                    task.cancel()
+            for media, task in tasks.items():
+                # exception() raises for a task that ended cancelled (e.g. a
+                # backend raised CancelledError itself)
+                error = "cancelled" if task.cancelled() else task.exception()
+                if error is None:
+                    results.update(task.result())
+                else:
+                    logger.error("Visual %s generation failed: %s", media, error)
+                    results.setdefault("errors", []).append(f"{media}: {error}")
 
         return results
 
@@ -143,8 +213,12 @@ Write ONLY the optimized prompt, nothing else."""
         output_dir: str,
         scene_index: int,
         size: Optional[str],
+        pending: Optional[asyncio.Future] = None,
     ) -> dict[str, Any]:
-        result = await self._image_backend.generate(prompt=prompt, size=size)
+        if pending is not None:
+            result = await pending
+        else:
+            result = await self._image_backend.generate(prompt=prompt, size=size)
         if result.status == GenerationStatus.COMPLETED and result.url:
             file_path = str(Path(output_dir) / f"scene_{scene_index:03d}.png")
             await self._image_backend.download(result, file_path)
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Optional
+from typing import Any
 
-from storyforge.agents.base import AgentConfig, BaseAgent, strip_json_fences
+from storyforge.agents.base import AgentConfig, BaseAgent, handles, parse_json_response
 from storyforge.agents.registry import AgentRegistry
 from storyforge.events.types import Event, EventType
 
@@ -17,18 +17,7 @@ logger = logging.getLogger(__name__)
 class WorldAgent(BaseAgent):
     """Maintains world consistency — lore, rules, setting, geography."""
 
-    async def handle_event(self, event: Event) -> Optional[Event]:
-        handlers = {
-            EventType.WORLD_QUERY: self._handle_query,
-            EventType.SETTING_VALIDATION_REQUEST: self._handle_validation,
-            EventType.LORE_CHECK: self._handle_lore_check,
-            EventType.CONSISTENCY_CHECK_REQUEST: self._handle_consistency_check,
-        }
-        handler = handlers.get(event.event_type)
-        if handler:
-            return await handler(event)
-        return None
-
+    @handles(EventType.WORLD_QUERY)
     async def _handle_query(self, event: Event) -> Event:
         query = event.payload.get("query", "")
         context = event.payload.get("context", "")
@@ -39,6 +28,7 @@ class WorldAgent(BaseAgent):
             self.config.name,
         )
 
+    @handles(EventType.SETTING_VALIDATION_REQUEST)
     async def _handle_validation(self, event: Event) -> Event:
         scene_plan = event.payload.get("scene_plan", {})
         enriched = await self.validate_and_enrich_setting(scene_plan)
@@ -48,6 +38,7 @@ class WorldAgent(BaseAgent):
             self.config.name,
         )
 
+    @handles(EventType.LORE_CHECK)
     async def _handle_lore_check(self, event: Event) -> Event:
         content = event.payload.get("content", "")
         result = await self.check_lore(content)
@@ -57,6 +48,7 @@ class WorldAgent(BaseAgent):
             self.config.name,
         )
 
+    @handles(EventType.CONSISTENCY_CHECK_REQUEST)
     async def _handle_consistency_check(self, event: Event) -> Event:
         chapter_text = event.payload.get("chapter_text", "")
         issues = await self.check_consistency(chapter_text)
@@ -106,7 +98,7 @@ Provide a JSON response with:
 Respond ONLY with valid JSON."""
         response = await self.generate(prompt, temperature=0.4)
         try:
-            return json.loads(strip_json_fences(response))
+            return parse_json_response(response)
         except json.JSONDecodeError as e:
             logger.warning(
                 "Failed to parse setting validation JSON: %s. Response: %.200s",
@@ -135,7 +127,7 @@ List any lore violations or inconsistencies. If everything is consistent, say "N
 Respond as JSON: {{"consistent": true/false, "issues": [...]}}"""
         response = await self.generate(prompt, temperature=0.3)
         try:
-            return json.loads(strip_json_fences(response))
+            return parse_json_response(response)
         except json.JSONDecodeError as e:
             logger.warning(
                 "Failed to parse lore check JSON: %s. Response: %.200s",
@@ -160,7 +152,7 @@ Respond as JSON array of strings. If no issues, respond with [].
 """
         response = await self.generate(prompt, temperature=0.3)
         try:
-            result = json.loads(strip_json_fences(response))
+            result = parse_json_response(response)
             return result if isinstance(result, list) else []
         except json.JSONDecodeError as e:
             logger.warning(
@@ -2,31 +2,99 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Optional
 
-from storyforge.agents.base import BaseAgent
+from storyforge.agents._writing_prompts import (
+    CHAPTER_TMPL,
+    REVISE_TMPL,
+    SCENE_SEPARATOR,
+    SCENE_TMPL,
+)
+from storyforge.agents.base import HISTORY_WINDOW, AgentConfig, BaseAgent, handles
 from storyforge.agents.registry import AgentRegistry
+from storyforge.events.bus import EventBus
 from storyforge.events.types import Event, EventType
+from storyforge.llm.base import LLMBackend
+from storyforge.llm.cache import ResponseCache
+from storyforge.memory.base import MemoryStore
+from storyforge.utils.retry import llm_retry
+from storyforge.utils.serialization import dumps_pretty
 
 logger = logging.getLogger(__name__)
 
+# Output budget bounds: never ask for fewer than _MIN_OUTPUT_TOKENS, and keep
+# _TOKEN_SAFETY_MARGIN spare for tokenizer differences and message framing.
+_MIN_OUTPUT_TOKENS = 512
+_TOKEN_SAFETY_MARGIN = 64
+
+_REACTION_FORMAT = (
+    "  {}:\n"
+    "    Thoughts: {}\n"
+    "    Emotional shift: {}\n"
+    "    Actions: {}\n"
+    "    Body language: {}"
+)
+_DIALOGUE_FORMAT = '  {}: "{}"{}{}'
+
+# Markers that keep frozen dicts and lists distinct from plain tuples
+_FROZEN_DICT = object()
+_FROZEN_LIST = object()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested JSON-like data into an equivalent hashable value."""
+    if isinstance(value, dict):
+        return (_FROZEN_DICT, tuple((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return (_FROZEN_LIST, tuple(_freeze(v) for v in value))
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze."""
+    if isinstance(value, tuple) and len(value) == 2:
+        if value[0] is _FROZEN_DICT:
+            return {k: _thaw(v) for k, v in value[1]}
+        if value[0] is _FROZEN_LIST:
+            return [_thaw(v) for v in value[1]]
+    return value
+
+
+@lru_cache(maxsize=256)
+def _format_frozen_setting(frozen: Any) -> str:
+    return dumps_pretty(_thaw(frozen))
+
+
+def _format_setting(setting: dict[str, Any]) -> str:
+    """Pretty-print the non-empty setting fields, memoized across scenes."""
+    return _format_frozen_setting(_freeze({k: v for k, v in setting.items() if v}))
+
 
 @AgentRegistry.register("writing")
 class WritingAgent(BaseAgent):
     """Takes structured inputs and produces polished prose."""
 
-    async def handle_event(self, event: Event) -> Optional[Event]:
-        handlers = {
-            EventType.SCENE_DRAFT_REQUEST: self._handle_scene_draft,
-            EventType.REVISION_REQUEST: self._handle_revision,
-        }
-        handler = handlers.get(event.event_type)
-        if handler:
-            return await handler(event)
-        return None
-
+    def __init__(
+        self,
+        config: AgentConfig,
+        llm: LLMBackend,
+        memory: MemoryStore,
+        event_bus: EventBus,
+        prompt_dir: Optional[Path] = None,
+        response_cache: Optional[ResponseCache] = None,
+        max_concurrent_calls: int = 8,
+    ) -> None:
+        super().__init__(config, llm, memory, event_bus, prompt_dir)
+        self._response_cache = response_cache
+        self._max_concurrent_calls = max_concurrent_calls
+        # Created on first use so it binds to the running event loop
+        self._call_slots: Optional[asyncio.Semaphore] = None
+
+    @handles(EventType.SCENE_DRAFT_REQUEST)
     async def _handle_scene_draft(self, event: Event) -> Event:
         scene_text = await self.compose_scene(
             scene_plan=event.payload.get("scene_plan", {}),
@@ -40,6 +108,7 @@ class WritingAgent(BaseAgent):
             self.config.name,
         )
 
+    @handles(EventType.REVISION_REQUEST)
     async def _handle_revision(self, event: Event) -> Event:
         revised = await self.revise(
             text=event.payload.get("chapter_text", ""),
@@ -59,93 +128,44 @@ class WritingAgent(BaseAgent):
         setting: dict[str, Any],
     ) -> str:
         """Compose a full scene from structured inputs."""
-        # Format character reactions
-        reactions_text = ""
-        if character_reactions:
-            parts = []
-            for r in character_reactions:
-                parts.append(
-                    f"  {r.get('character_name', '?')}:\n"
-                    f"    Thoughts: {r.get('internal_thoughts', '')}\n"
-                    f"    Emotional shift: {r.get('emotional_shift', '')}\n"
-                    f"    Actions: {r.get('desired_actions', [])}\n"
-                    f"    Body language: {r.get('body_language', '')}"
-                )
-            reactions_text = "\n".join(parts)
-
-        # Format dialogue
-        dialogue_text = ""
-        if dialogue_lines:
-            parts = []
-            for d in dialogue_lines:
-                line = f'  {d.get("character_name", "?")}: "{d.get("text", "")}"'
-                if d.get("tone"):
-                    line += f" ({d['tone']})"
-                if d.get("action"):
-                    line += f" [{d['action']}]"
-                parts.append(line)
-            dialogue_text = "\n".join(parts)
+        reactions_text = "\n".join(
+            _REACTION_FORMAT.format(
+                r.get("character_name", "?"),
+                r.get("internal_thoughts", ""),
+                r.get("emotional_shift", ""),
+                r.get("desired_actions", []),
+                r.get("body_language", ""),
+            )
+            for r in character_reactions
+        )
+        dialogue_text = "\n".join(
+            _DIALOGUE_FORMAT.format(
+                d.get("character_name", "?"),
+                d.get("text", ""),
+                f" ({d['tone']})" if d.get("tone") else "",
+                f" [{d['action']}]" if d.get("action") else "",
+            )
+            for d in dialogue_lines
+        )
 
         # Format setting
         setting_text = ""
         if isinstance(setting, dict):
-            setting_text = json.dumps(
-                {k: v for k, v in setting.items() if v},
-                indent=2,
-                ensure_ascii=False,
-            )
+            setting_text = _format_setting(setting)
 
-        prompt = f"""Write a polished prose scene based on these inputs.
-
-SCENE PLAN:
-- Location: {scene_plan.get('location', 'unknown')}
-- Characters: {scene_plan.get('characters_present', [])}
-- Goal: {scene_plan.get('scene_goal', '')}
-- Conflict: {scene_plan.get('conflict', '')}
-- Expected outcome: {scene_plan.get('expected_outcome', '')}
-- Beats: {scene_plan.get('beats', [])}
-- POV: {scene_plan.get('pov_character', 'third person limited')}
-
-SETTING DETAILS:
-{setting_text}
-
-CHARACTER REACTIONS:
-{reactions_text or "No character reactions provided."}
-
-DIALOGUE TO INCORPORATE:
-{dialogue_text or "Generate appropriate dialogue."}
-
-WRITING INSTRUCTIONS:
-- Write in third person limited POV from {scene_plan.get('pov_character', 'the protagonist')}'s perspective
-- Show, don't tell — use sensory details and body language
-- Weave dialogue naturally into the narrative
-- Follow the beat structure but make transitions smooth
-- Create vivid, immersive prose
-- Vary sentence length and structure for rhythm
-- End the scene with forward momentum
-
-Write the complete scene as polished prose. No meta-commentary or notes — only the story text."""
-        return await self.generate(prompt, max_tokens=self.config.max_context_tokens)
+        prompt = SCENE_TMPL.render(
+            scene_plan=scene_plan,
+            setting_text=setting_text,
+            reactions_text=reactions_text,
+            dialogue_text=dialogue_text,
+        )
+        return await self._generate_prose(prompt)
 
     async def revise(self, text: str, feedback: list[str]) -> str:
         """Revise text based on feedback."""
         feedback_text = "\n".join(f"- {f}" for f in feedback)
-        prompt = f"""Revise this chapter draft based on the following feedback.
-
-FEEDBACK:
-{feedback_text}
-
-CURRENT DRAFT:
-{text}
-
-INSTRUCTIONS:
-- Address each piece of feedback specifically
-- Maintain the overall structure and voice
-- Preserve what works well
-- Make targeted improvements, not wholesale rewrites
-
-Write the revised version. Only output the revised text, no commentary."""
-        return await self.generate(prompt, max_tokens=self.config.max_context_tokens)
+        prompt = REVISE_TMPL.render(feedback_text=feedback_text, text=text)
+        return await self._generate_prose(prompt)
 
     async def compose_chapter(
         self,
@@ -154,20 +174,55 @@ Write the revised version. Only output the revised text, no commentary."""
         chapter_number: int = 0,
     ) -> str:
         """Stitch scenes together with transitions into a full chapter."""
-        scenes_text = "\n\n---SCENE BREAK---\n\n".join(scenes)
-        prompt = f"""Assemble these scenes into a cohesive chapter. Add smooth transitions between scenes where needed.
-
-{"Chapter " + str(chapter_number) + ": " + chapter_title if chapter_title else ""}
-
-SCENES:
-{scenes_text}
-
-INSTRUCTIONS:
-- Add brief transitions between scenes if needed
-- Ensure consistent tone throughout
-- The chapter should read as one continuous piece, not separate fragments
-- Add a chapter opening line if the first scene doesn't have one
-- Do NOT add a chapter heading — just the prose
-
-Write the complete chapter. Only output the story text."""
-        return await self.generate(prompt, max_tokens=self.config.max_context_tokens)
+        prompt = CHAPTER_TMPL.render(
+            chapter_title=chapter_title,
+            chapter_number=chapter_number,
+            scenes=scenes,
+            scene_separator=SCENE_SEPARATOR,
+        )
+        return await self._generate_prose(prompt)
+
+    async def _generate_prose(self, prompt: str) -> str:
+        """Generate prose, reusing the cached response to an identical request."""
+        if self._response_cache is None:
+            return await self._generate_within_budget(prompt)
+
+        key = ResponseCache.make_key(
+            self.llm.config.provider,
+            self.llm.config.model,
+            self.config.prompt_variables.get("language", ""),
+            self._system_prompt,
+            # generate() replays this history, so it shapes the response
+            self._conversation_history[-HISTORY_WINDOW:],
+            prompt,
+            self.config.temperature,
+            self.config.max_context_tokens,
+        )
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            logger.debug("Writing response cache hit (%s)", key[:8])
+            # Keep the history identical to an uncached run
+            self._record_exchange(prompt, cached)
+            return cached
+        text = await self._generate_within_budget(prompt)
+        self._response_cache.put(key, text)
+        return text
+
+    async def _generate_within_budget(self, prompt: str) -> str:
+        """Call the LLM, holding one of the agent's concurrent-call slots."""
+        if self._call_slots is None:
+            self._call_slots = asyncio.Semaphore(self._max_concurrent_calls)
+        async with self._call_slots:
+            return await self._generate_with_retry(prompt)
+
+    @llm_retry
+    async def _generate_with_retry(self, prompt: str) -> str:
+        """Call the LLM with max_tokens capped to what the context window leaves."""
+        return await self.generate(prompt, max_tokens=await self._output_budget(prompt))
+
+    async def _output_budget(self, prompt: str) -> int:
+        """Largest output that fits beside the prompt, system prompt and history."""
+        # Counted as one request, so remote tokenizers cost one round trip
+        used = await self.llm.count_message_tokens(self._request_messages(prompt))
+        room = self.llm.context_window - used - _TOKEN_SAFETY_MARGIN
+        return min(self.config.max_context_tokens, max(_MIN_OUTPUT_TOKENS, room))
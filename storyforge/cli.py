@@ -3,40 +3,137 @@
 from __future__ import annotations
 
 import asyncio
+import errno
+import hashlib
+import mmap
+import os
+import re
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from storyforge.utils.logging import setup_logging
+from storyforge.utils.text import count_words
 
-console = Console()
+
+class _LazyConsole:
+    """Stands in for a rich Console, importing rich only on first output."""
+
+    _console = None
+
+    def __getattr__(self, name: str):
+        if self._console is None:
+            from rich.console import Console
+
+            _LazyConsole._console = Console()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
+
+# Characters not allowed in ChromaDB collection names
+_COLLECTION_NAME_INVALID_RE = re.compile(r"[^a-zA-Z0-9._-]")
+
+# Project templates for `init`, mapped to directories under examples/
+_EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+_TEMPLATE_MAP = {
+    "fantasy": "fantasy_novel",
+    "mystery": "fantasy_novel",  # reuse as starting point
+    "scifi": "fantasy_novel",
+}
+
+# Linux ioctl that makes dst share src's extents (copy-on-write clone)
+_FICLONE = 0x40049409
+
+
+def _reflink_copy(src: str, dst: str) -> str:
+    """Copy a file as a copy-on-write clone when the filesystem supports it.
+
+    Only contents are copied; a fresh project has no use for the template's
+    timestamps, so the extra chmod/utime calls of copy2 are skipped.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return shutil.copyfile(src, dst)
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS):
+            raise
+        return shutil.copyfile(src, dst)
+    return dst
+
+
+def _read_text_file(path: Path) -> str:
+    """Read a UTF-8 text file, decoding straight from a memory map.
+
+    Avoids holding an intermediate copy of the raw bytes for large inputs.
+    Newlines are normalized the same way as in text-mode reads.
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return ""
+        with mapped:
+            text = str(mapped, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def _run_async(coro):
-    """Run an async function from sync CLI."""
+    """Run an async function from sync CLI.
+
+    Uses uvloop when it is installed, unless STORYFORGE_NO_UVLOOP is set.
+    """
+    if not os.environ.get("STORYFORGE_NO_UVLOOP"):
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(coro)
     return asyncio.run(coro)
 
 
-def _inject_api_keys(config, api_keys: dict[str, str]) -> None:
+async def _generate_in_slot(
+    pipeline, ch_num: int, slots: asyncio.Semaphore, failed: list[int]
+) -> None:
+    """Generate one chapter once a slot is free, recording it in ``failed`` on error."""
+    try:
+        async with slots:
+            console.print(f"\n[bold yellow]>>> Chapter {ch_num}[/bold yellow]")
+            result = await pipeline.generate_chapter(ch_num)
+    except Exception as e:
+        # One failed chapter must not cancel the others
+        console.print(f"[red]✗ Chapter {ch_num} failed:[/red] {e}")
+        console.print_exception()
+        failed.append(ch_num)
+        return
+    word_count = count_words(result)
+    console.print(
+        f"[green]✓ Chapter {ch_num} complete[/green] "
+        f"({word_count} words)"
+    )
+
+
+def _inject_api_keys(backends_by_provider: dict[str, list], api_keys: dict[str, str]) -> None:
     """Inject runtime API keys into backend configs (never written to disk).
 
     ``api_keys`` maps provider names (e.g. "openai", "anthropic") to key
     strings.  Keys supplied here override env-var resolution so the user
     can pass them on the command line or via an interactive prompt.
     """
-    for _name, backend_cfg in config.llm_backends.items():
-        key = api_keys.get(backend_cfg.provider)
-        if key:
-            backend_cfg.api_key = key
-    # Also inject into visual backends
-    for _name, vb_cfg in config.visual_backends.items():
-        key = api_keys.get(vb_cfg.provider)
+    for provider, key in api_keys.items():
         if key:
-            vb_cfg.api_key = key
+            for backend_cfg in backends_by_provider.get(provider, ()):
+                backend_cfg.api_key = key
 
 
 def _resolve_api_keys_for_config(config, cli_api_key: str | None) -> None:
@@ -47,9 +144,18 @@ def _resolve_api_keys_for_config(config, cli_api_key: str | None) -> None:
       2. Environment variable referenced by ``api_key_env``
       3. Interactive prompt (only for providers still missing a key)
     """
-    # Collect which providers still need a key
+    # Common case: every key already came from the environment
+    if all(
+        b.api_key or b.provider == "ollama" for b in config.llm_backends.values()
+    ) and all(b.api_key for b in config.visual_backends.values()):
+        return
+
+    # Group LLM and visual backends by provider, noting which providers
+    # still need a key, in a single pass
+    backends_by_provider: dict[str, list] = {}
     providers_needing_key: dict[str, str] = {}  # provider -> env var name
-    for _name, backend_cfg in config.llm_backends.items():
+    for backend_cfg in config.llm_backends.values():
+        backends_by_provider.setdefault(backend_cfg.provider, []).append(backend_cfg)
         if backend_cfg.api_key:
             continue  # already resolved (env var or explicit)
         if backend_cfg.provider == "ollama":
@@ -57,31 +163,33 @@ def _resolve_api_keys_for_config(config, cli_api_key: str | None) -> None:
         providers_needing_key.setdefault(
             backend_cfg.provider, backend_cfg.api_key_env or ""
         )
-    # Also check visual backends
-    for _name, vb_cfg in config.visual_backends.items():
+    for vb_cfg in config.visual_backends.values():
+        backends_by_provider.setdefault(vb_cfg.provider, []).append(vb_cfg)
         if vb_cfg.api_key:
             continue
         providers_needing_key.setdefault(
             vb_cfg.provider, vb_cfg.api_key_env or ""
         )
 
-    if not providers_needing_key:
-        return  # all keys already available
-
     if cli_api_key:
         # Apply the single CLI key to all providers that need one
-        for provider in providers_needing_key:
-            _inject_api_keys(config, {provider: cli_api_key})
+        _inject_api_keys(
+            backends_by_provider,
+            dict.fromkeys(providers_needing_key, cli_api_key),
+        )
         return
 
-    # Interactive prompt for each provider still missing a key
+    # Interactive prompt for each provider still missing a key. The env var
+    # may have been exported after the config was parsed, so check it first.
     for provider, env_var in providers_needing_key.items():
-        hint = f" (or set {env_var})" if env_var else ""
-        key = click.prompt(
-            f"Enter API key for {provider}{hint}",
-            hide_input=True,
-        )
-        _inject_api_keys(config, {provider: key})
+        key = os.environ.get(env_var) if env_var else None
+        if not key:
+            hint = f" (or set {env_var})" if env_var else ""
+            key = click.prompt(
+                f"Enter API key for {provider}{hint}",
+                hide_input=True,
+            )
+        _inject_api_keys(backends_by_provider, {provider: key})
 
 
 @click.group()
@@ -137,33 +245,34 @@ def generate(
             for ch_num in chapters_to_gen:
                 console.print(f"\n[bold yellow]>>> Chapter {ch_num}[/bold yellow]")
                 result = await pipeline.generate_chapter(ch_num)
-                word_count = len(result.split())
+                word_count = count_words(result)
                 console.print(
                     f"[green]✓ Chapter {ch_num} complete[/green] "
                     f"({word_count} words)"
                 )
         else:
-            # Parallel batch mode
+            # Parallel mode: all chapters are queued up front and a finished
+            # chapter's slot is taken by the next one immediately
             console.print(
                 f"\n[bold cyan]Parallel mode:[/bold cyan] {parallel} chapters at a time"
             )
-            for batch_start in range(0, len(chapters_to_gen), parallel):
-                batch = chapters_to_gen[batch_start:batch_start + parallel]
+            slots = asyncio.Semaphore(parallel)
+            failed: list[int] = []
+
+            for finished in asyncio.as_completed(
+                [
+                    _generate_in_slot(pipeline, ch, slots, failed)
+                    for ch in chapters_to_gen
+                ]
+            ):
+                await finished
+            if failed:
                 console.print(
-                    f"\n[bold yellow]>>> Batch: Chapters "
-                    f"{batch[0]}-{batch[-1]}[/bold yellow]"
+                    f"\n[red]{len(failed)} chapter(s) failed:[/red] "
+                    f"{', '.join(str(ch) for ch in sorted(failed))}"
                 )
-
-                async def _gen_one(ch_num):
-                    result = await pipeline.generate_chapter(ch_num)
-                    word_count = len(result.split())
-                    console.print(
-                        f"[green]✓ Chapter {ch_num} complete[/green] "
-                        f"({word_count} words)"
-                    )
-                    return result
-
-                await asyncio.gather(*[_gen_one(ch) for ch in batch])
+                # Non-zero exit so scripts and CI see the failure
+                raise SystemExit(1)
 
         console.print(
             f"\n[bold green]Done![/bold green] "
@@ -184,7 +293,6 @@ def validate(project_dir: str, api_key: Optional[str], verbose: bool):
 
     async def _validate():
         from storyforge.config import load_config
-        from storyforge.llm.factory import LLMFactory
 
         try:
             config = load_config(project_path)
@@ -202,25 +310,43 @@ def validate(project_dir: str, api_key: Optional[str], verbose: bool):
 
         # Check LLM backends
         console.print("\n[bold]LLM Backends:[/bold]")
+        created: dict = {}
+        backends: dict = {}  # name -> backend, or the error creating it
+        checks: dict = {}  # id(backend) -> health check, one per instance
         for name, backend_config in config.llm_backends.items():
             try:
-                backend = LLMFactory.create_from_dict(
-                    backend_config.model_dump()
-                )
-                healthy = await backend.health_check()
-                status = "[green]✓[/green]" if healthy else "[red]✗[/red]"
-                console.print(
-                    f"  {status} {name}: {backend_config.provider}/"
-                    f"{backend_config.model} ({backend_config.tier})"
-                )
+                backend = _get_llm_backend(backend_config, created)
             except Exception as e:
-                console.print(f"  [red]✗[/red] {name}: {e}")
+                backends[name] = e
+                continue
+            backends[name] = backend
+            if id(backend) not in checks:
+                checks[id(backend)] = backend.health_check()
+        # Run every round-trip at once; report in configuration order
+        health = dict(
+            zip(checks, await asyncio.gather(*checks.values(), return_exceptions=True))
+        )
+        for name, backend_config in config.llm_backends.items():
+            backend = backends[name]
+            result = backend if isinstance(backend, Exception) else health[id(backend)]
+            if isinstance(result, Exception):
+                console.print(f"  [red]✗[/red] {name}: {result}")
+                continue
+            status = "[green]✓[/green]" if result else "[red]✗[/red]"
+            console.print(
+                f"  {status} {name}: {backend_config.provider}/"
+                f"{backend_config.model} ({backend_config.tier})"
+            )
 
         # Check character sheets
         console.print("\n[bold]Characters:[/bold]")
-        for char_config in config.agents.characters:
-            sheet_path = project_path / char_config.character_sheet
-            if sheet_path.exists():
+        sheet_paths = [
+            project_path / char_config.character_sheet
+            for char_config in config.agents.characters
+        ]
+        existing_sheets = _existing_files(sheet_paths)
+        for char_config, sheet_path in zip(config.agents.characters, sheet_paths):
+            if sheet_path in existing_sheets:
                 console.print(
                     f"  [green]✓[/green] {char_config.name} ({sheet_path})"
                 )
@@ -248,7 +374,6 @@ def export_cmd(project_dir: str, fmt: str):
 
     async def _export():
         from storyforge.config import load_config
-        from storyforge.output.formats import HtmlFormatter, MarkdownFormatter
 
         config = load_config(project_path)
         output_dir = project_path / config.output.directory
@@ -263,9 +388,13 @@ def export_cmd(project_dir: str, fmt: str):
 
         slug = config.project.name.lower().replace(" ", "_")
         if fmt == "markdown":
+            from storyforge.output.formats import MarkdownFormatter
+
             formatter = MarkdownFormatter()
             out_path = exports_dir / f"{slug}.md"
         else:
+            from storyforge.output.formats import HtmlFormatter
+
             formatter = HtmlFormatter()
             out_path = exports_dir / f"{slug}.html"
 
@@ -290,12 +419,13 @@ def status(project_dir: str):
 
     mgr = OutputManager(output_dir)
 
+    from rich.table import Table
+
     table = Table(title=f"StoryForge — {config.project.name}")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="green")
 
-    chapter_count = mgr.get_chapter_count()
-    word_count = mgr.get_total_word_count()
+    chapter_count, word_count = mgr.scan_chapters()
 
     table.add_row("Chapters generated", str(chapter_count))
     table.add_row("Target chapters", str(config.project.target_chapters))
@@ -311,7 +441,7 @@ def status(project_dir: str):
 
 
 @main.command()
-@click.argument("template", type=click.Choice(["fantasy", "mystery", "scifi"]))
+@click.argument("template", type=click.Choice(list(_TEMPLATE_MAP)))
 @click.argument("output_dir", type=click.Path())
 def init(template: str, output_dir: str):
     """Initialize a new story project from a template."""
@@ -321,16 +451,10 @@ def init(template: str, output_dir: str):
         return
 
     # Copy from examples
-    examples_dir = Path(__file__).parent.parent / "examples"
-    template_map = {
-        "fantasy": "fantasy_novel",
-        "mystery": "fantasy_novel",  # reuse as starting point
-        "scifi": "fantasy_novel",
-    }
-    template_dir = examples_dir / template_map[template]
+    template_dir = _EXAMPLES_DIR / _TEMPLATE_MAP[template]
 
-    if template_dir.exists():
-        shutil.copytree(template_dir, out_path)
+    if template_dir.is_dir():
+        shutil.copytree(template_dir, out_path, copy_function=_reflink_copy)
         console.print(
             f"[green]✓[/green] Initialized {template} project at {out_path}"
         )
@@ -381,7 +505,7 @@ def visualize(
     # Resolve text input
     text = text_input
     if text_file:
-        text = Path(text_file).read_text(encoding="utf-8")
+        text = _read_text_file(Path(text_file))
     if not text and not image_paths and not image_urls:
         console.print("[red]Error:[/red] Provide --text, --text-file, --image, or --image-url")
         return
@@ -398,10 +522,13 @@ def visualize(
         )
 
         # Apply CLI overrides before building runtime
+        overrides = {}
         if no_image:
-            config.visual_pipeline.generate_images = False
+            overrides["generate_images"] = False
         if no_video:
-            config.visual_pipeline.generate_videos = False
+            overrides["generate_videos"] = False
+        if overrides:
+            config.visual_pipeline = config.visual_pipeline.model_copy(update=overrides)
 
         runtime = await _build_visual_runtime(project_path, config)
         pipeline = runtime["pipeline"]
@@ -440,6 +567,81 @@ def visualize(
     _run_async(_visualize())
 
 
+def _get_llm_backend(backend_config, created: dict):
+    """Return the backend for a config, reusing one already built from identical settings."""
+    from storyforge.llm.factory import LLMFactory
+
+    llm_config = LLMFactory.config_from(backend_config)
+    key = tuple(vars(llm_config).values())
+    if key not in created:
+        created[key] = LLMFactory.create(llm_config)
+    return created[key]
+
+
+class _LazyBackends(dict):
+    """Named backends, each created from its config on first lookup.
+
+    Only backends that have been looked up appear when iterating.
+    """
+
+    def __init__(self, configs: dict, create) -> None:
+        super().__init__()
+        self._configs = configs
+        self._create = create
+
+    def __missing__(self, name: str):
+        backend = self[name] = self._create(self._configs[name])
+        return backend
+
+    def get(self, name, default=None):
+        return self[name] if name in self._configs else default
+
+
+def _create_llm_backends(llm_backends: dict) -> dict:
+    """Map names to LLM backends, sharing instances between identical configs.
+
+    Backends are created when first used, so unreferenced ones cost nothing.
+    Shared instances also share their client connection pool and rate limiter.
+    """
+    created: dict = {}
+    return _LazyBackends(
+        llm_backends, lambda backend_config: _get_llm_backend(backend_config, created)
+    )
+
+
+@lru_cache(maxsize=4)
+def _default_visual_backend_templates(openai_key: Optional[str]) -> dict:
+    from storyforge.config import VisualBackendConfig
+
+    return {
+        "dalle3": VisualBackendConfig(
+            provider="openai_image",
+            model="dall-e-3",
+            api_key=openai_key,
+            default_size="1024x1024",
+            default_quality="hd",
+        ),
+        "sora2": VisualBackendConfig(
+            provider="openai_video",
+            model="sora-2",
+            api_key=openai_key,
+            default_size="1280x720",
+        ),
+    }
+
+
+def _default_visual_backends(openai_key: Optional[str]) -> dict:
+    """Return the DALL-E 3 / Sora 2 backend configs used when none are configured.
+
+    The validated models are cached per key; callers get copies because
+    backend configs are mutated during API key injection.
+    """
+    return {
+        name: template.model_copy()
+        for name, template in _default_visual_backend_templates(openai_key).items()
+    }
+
+
 async def _build_visual_runtime(project_path: Path, config) -> dict:
     """Build the visual pipeline runtime from configuration."""
     from storyforge.agents.base import AgentConfig
@@ -449,7 +651,6 @@ async def _build_visual_runtime(project_path: Path, config) -> dict:
     from storyforge.events.bus import EventBus
     from storyforge.events.middleware import EventLogger
     from storyforge.events.types import EventType
-    from storyforge.llm.factory import LLMFactory
     from storyforge.memory.structured import StructuredMemory
     from storyforge.pipeline.visual import VisualPipeline
     from storyforge.visual.factory import VisualFactory
@@ -460,40 +661,23 @@ async def _build_visual_runtime(project_path: Path, config) -> dict:
     event_bus.add_middleware(EventLogger())
 
     # LLM backends
-    backends = {}
-    for name, backend_config in config.llm_backends.items():
-        backends[name] = LLMFactory.create_from_dict(backend_config.model_dump())
+    backends = _create_llm_backends(config.llm_backends)
 
     # Visual backends — auto-create defaults if not configured
     if not config.visual_backends:
-        from storyforge.config import VisualBackendConfig
-
         # Inherit the OpenAI API key from any configured LLM backend
-        openai_key = None
-        for _name, llm_cfg in config.llm_backends.items():
-            if llm_cfg.provider == "openai" and llm_cfg.api_key:
-                openai_key = llm_cfg.api_key
-                break
-
-        config.visual_backends = {
-            "dalle3": VisualBackendConfig(
-                provider="openai_image",
-                model="dall-e-3",
-                api_key=openai_key,
-                default_size="1024x1024",
-                default_quality="hd",
+        openai_key = next(
+            (
+                llm_cfg.api_key
+                for llm_cfg in config.llm_backends.values()
+                if llm_cfg.provider == "openai" and llm_cfg.api_key
             ),
-            "sora2": VisualBackendConfig(
-                provider="openai_video",
-                model="sora-2",
-                api_key=openai_key,
-                default_size="1280x720",
-            ),
-        }
+            None,
+        )
+        config.visual_backends = _default_visual_backends(openai_key)
 
-    visual_backends = {}
-    for name, vb_config in config.visual_backends.items():
-        visual_backends[name] = VisualFactory.create_from_dict(vb_config.model_dump())
+    visual_backends = _LazyBackends(config.visual_backends, VisualFactory.create_from_config)
+    default_llm_backend = next(iter(config.llm_backends))
 
     # Visual agents config (use defaults if not configured)
     va_config = config.visual_agents
@@ -507,11 +691,14 @@ async def _build_visual_runtime(project_path: Path, config) -> dict:
     if not prompt_dir.exists():
         prompt_dir = Path(__file__).parent.parent / "prompts"
 
+    prompt_subdirs = _subdir_names(prompt_dir)
+    pkg_prompt_subdirs = _subdir_names(pkg_prompt_dir)
+
     def _resolve_prompt_dir(subdir: str) -> Path | None:
         """Find a prompt subdirectory, checking project then package."""
-        if (prompt_dir / subdir).exists():
+        if subdir in prompt_subdirs:
             return prompt_dir / subdir
-        if (pkg_prompt_dir / subdir).exists():
+        if subdir in pkg_prompt_subdirs:
             return pkg_prompt_dir / subdir
         return None
 
@@ -520,7 +707,7 @@ async def _build_visual_runtime(project_path: Path, config) -> dict:
     data_dir.mkdir(parents=True, exist_ok=True)
 
     # ExtractAgent
-    extract_backend_name = va_config.extract.get("llm_backend", next(iter(backends)))
+    extract_backend_name = va_config.extract.get("llm_backend", default_llm_backend)
     extract_backend = backends[extract_backend_name]
     extract_memory = StructuredMemory(storage_path=data_dir / "extract_memory.json")
     extract_prompt_dir = _resolve_prompt_dir("extract")
@@ -539,10 +726,9 @@ async def _build_visual_runtime(project_path: Path, config) -> dict:
         event_bus=event_bus,
         prompt_dir=extract_prompt_dir,
     )
-    await extract_agent.initialize()
 
     # ExpansionAgent
-    expand_backend_name = va_config.expansion.get("llm_backend", next(iter(backends)))
+    expand_backend_name = va_config.expansion.get("llm_backend", default_llm_backend)
     expand_backend = backends[expand_backend_name]
     expand_memory = StructuredMemory(storage_path=data_dir / "expansion_memory.json")
     expand_prompt_dir = _resolve_prompt_dir("expansion")
@@ -561,11 +747,10 @@ async def _build_visual_runtime(project_path: Path, config) -> dict:
         event_bus=event_bus,
         prompt_dir=expand_prompt_dir,
     )
-    await expansion_agent.initialize()
 
     # VisualAgent
     vis_cfg = va_config.visual
-    vis_backend_name = vis_cfg.get("llm_backend", next(iter(backends)))
+    vis_backend_name = vis_cfg.get("llm_backend", default_llm_backend)
     vis_backend = backends[vis_backend_name]
     vis_memory = StructuredMemory(storage_path=data_dir / "visual_memory.json")
 
@@ -589,13 +774,19 @@ async def _build_visual_runtime(project_path: Path, config) -> dict:
         image_backend=image_backend,
         video_backend=video_backend,
         prompt_dir=vis_prompt_dir,
+        speculative_images=config.visual_pipeline.speculative_image_generation,
     )
-    await visual_agent.initialize()
 
     # Output manager
     output_dir = project_path / config.output.directory
     output_mgr = VisualOutputManager(output_dir)
-    await output_mgr.initialize()
+
+    await asyncio.gather(
+        output_mgr.initialize(),
+        extract_agent.initialize(),
+        expansion_agent.initialize(),
+        visual_agent.initialize(),
+    )
 
     # Pipeline config
     vp_config = config.visual_pipeline
@@ -623,12 +814,19 @@ async def _build_visual_runtime(project_path: Path, config) -> dict:
     }
 
 
+def _subdir_names(path: Path) -> frozenset[str]:
+    """List a directory's subdirectory names with a single scandir call."""
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(e.name for e in entries if e.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
+
 def _sanitize_collection_name(name: str) -> str:
     """Sanitize a name for use as a ChromaDB collection name (ASCII only)."""
-    import re
-    import hashlib
     # Try transliterating to ASCII-safe slug
-    safe = re.sub(r'[^a-zA-Z0-9._-]', '_', name)
+    safe = _COLLECTION_NAME_INVALID_RE.sub("_", name)
     safe = safe.strip('_') or hashlib.md5(name.encode()).hexdigest()[:16]
     # ChromaDB requires 3-512 chars, starting/ending with alphanumeric
     if len(safe) < 3:
@@ -636,6 +834,48 @@ def _sanitize_collection_name(name: str) -> str:
     return safe
 
 
+def _existing_files(paths: list[Path]) -> set[Path]:
+    """Return the given paths that are files, listing each parent directory once.
+
+    A name missing from the listing is re-checked with the filesystem, which
+    may be case-insensitive (macOS, Windows).
+    """
+    names_by_dir: dict[Path, frozenset[str]] = {}
+    for directory in {path.parent for path in paths}:
+        try:
+            with os.scandir(directory) as entries:
+                names_by_dir[directory] = frozenset(e.name for e in entries if e.is_file())
+        except (FileNotFoundError, NotADirectoryError):
+            names_by_dir[directory] = frozenset()
+    return {
+        path
+        for path in paths
+        if path.name in names_by_dir[path.parent] or path.is_file()
+    }
+
+
+def _read_character_sheet(sheet_path: Path) -> dict:
+    """Read a character sheet; runs in a worker thread."""
+    from storyforge.config import load_yaml_file
+
+    return load_yaml_file(sheet_path)
+
+
+async def _load_character_sheets(project_path: Path, characters) -> list[Optional[dict]]:
+    """Read all character sheets concurrently, off the event loop.
+
+    Returns None for characters whose sheet file does not exist.
+    """
+    paths = [project_path / char_cfg.character_sheet for char_cfg in characters]
+    existing = _existing_files(paths)
+    to_read = [path for path in dict.fromkeys(paths) if path in existing]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_read_character_sheet, path) for path in to_read)
+    )
+    sheets = dict(zip(to_read, results))
+    return [sheets.get(path) for path in paths]
+
+
 async def _build_runtime(project_path: Path, config) -> dict:
     """Build the full runtime from configuration."""
     from storyforge.agents.character import CharacterAgent, CharacterSheet
@@ -647,7 +887,7 @@ async def _build_runtime(project_path: Path, config) -> dict:
     from storyforge.events.bus import EventBus
     from storyforge.events.middleware import EventLogger
     from storyforge.events.types import EventType
-    from storyforge.llm.factory import LLMFactory
+    from storyforge.llm.cache import ResponseCache
     from storyforge.memory.structured import StructuredMemory
     from storyforge.memory.summary import MemorySummarizer
     from storyforge.memory.vector import VectorMemory
@@ -659,11 +899,11 @@ async def _build_runtime(project_path: Path, config) -> dict:
     event_bus.add_middleware(EventLogger())
 
     # Create LLM backends
-    backends = {}
-    for name, backend_config in config.llm_backends.items():
-        backends[name] = LLMFactory.create_from_dict(
-            backend_config.model_dump()
-        )
+    backends = _create_llm_backends(config.llm_backends)
+
+    # Agent memory locations
+    data_dir = project_path / "data"
+    memories_dir = data_dir / "memories"
 
     # Create output manager
     output_dir = project_path / config.output.directory
@@ -672,12 +912,12 @@ async def _build_runtime(project_path: Path, config) -> dict:
         versioning=config.output.versioning,
         save_intermediates=config.output.save_intermediates,
     )
-    await output_mgr.initialize()
 
     # Prompt templates: prefer project-level, fall back to package-level
     prompt_dir = project_path / "prompts"
     if not prompt_dir.exists():
         prompt_dir = Path(__file__).parent.parent / "prompts"
+    prompt_subdirs = _subdir_names(prompt_dir)
 
     # Language setting for all agents
     language = getattr(config.project, "language", "English")
@@ -687,7 +927,7 @@ async def _build_runtime(project_path: Path, config) -> dict:
     world_cfg = config.agents.world
     world_backend = backends[world_cfg["llm_backend"]]
     world_memory = StructuredMemory(
-        storage_path=project_path / "data" / "world_memory.json"
+        storage_path=data_dir / "world_memory.json"
     )
     # Load world bible
     world_file = config.world.get("file")
@@ -697,7 +937,7 @@ async def _build_runtime(project_path: Path, config) -> dict:
             world_data = load_yaml_file(world_path)
             await world_memory.load_from_dict(world_data)
 
-    world_prompt_dir = prompt_dir / "world" if (prompt_dir / "world").exists() else None
+    world_prompt_dir = prompt_dir / "world" if "world" in prompt_subdirs else None
     world_agent = WorldAgent(
         config=AgentConfig(
             name="world",
@@ -719,13 +959,12 @@ async def _build_runtime(project_path: Path, config) -> dict:
         event_bus=event_bus,
         prompt_dir=world_prompt_dir,
     )
-    await world_agent.initialize()
 
     # Create PlotAgent
     plot_cfg = config.agents.plot
     plot_backend = backends[plot_cfg["llm_backend"]]
     plot_memory = StructuredMemory(
-        storage_path=project_path / "data" / "plot_memory.json"
+        storage_path=data_dir / "plot_memory.json"
     )
     # Load plot outline
     plot_file = config.plot.get("file")
@@ -735,7 +974,7 @@ async def _build_runtime(project_path: Path, config) -> dict:
             plot_data = load_yaml_file(plot_path)
             await plot_memory.store("plot_outline", plot_data)
 
-    plot_prompt_dir = prompt_dir / "plot" if (prompt_dir / "plot").exists() else None
+    plot_prompt_dir = prompt_dir / "plot" if "plot" in prompt_subdirs else None
     plot_agent = PlotAgent(
         config=AgentConfig(
             name="plot",
@@ -756,16 +995,15 @@ async def _build_runtime(project_path: Path, config) -> dict:
         event_bus=event_bus,
         prompt_dir=plot_prompt_dir,
     )
-    await plot_agent.initialize()
 
     # Create WritingAgent
     writing_cfg = config.agents.writing
     writing_backend = backends[writing_cfg["llm_backend"]]
     writing_memory = StructuredMemory(
-        storage_path=project_path / "data" / "writing_memory.json"
+        storage_path=data_dir / "writing_memory.json"
     )
 
-    writing_prompt_dir = prompt_dir / "writing" if (prompt_dir / "writing").exists() else None
+    writing_prompt_dir = prompt_dir / "writing" if "writing" in prompt_subdirs else None
     writing_agent = WritingAgent(
         config=AgentConfig(
             name="writing",
@@ -784,35 +1022,37 @@ async def _build_runtime(project_path: Path, config) -> dict:
         memory=writing_memory,
         event_bus=event_bus,
         prompt_dir=writing_prompt_dir,
+        response_cache=(
+            ResponseCache(data_dir / "writing_cache.jsonl")
+            if config.pipeline.cache_writing_responses
+            else None
+        ),
+        max_concurrent_calls=config.pipeline.max_concurrent_llm_calls,
     )
-    await writing_agent.initialize()
 
     # Create CharacterAgents
-    char_prompt_dir = prompt_dir / "character" if (prompt_dir / "character").exists() else None
+    char_prompt_dir = prompt_dir / "character" if "character" in prompt_subdirs else None
     character_agents: dict[str, CharacterAgent] = {}
-    for char_cfg in config.agents.characters:
+    sheets = await _load_character_sheets(project_path, config.agents.characters)
+    for char_cfg, sheet_data in zip(config.agents.characters, sheets):
         char_backend = backends[char_cfg.llm_backend]
 
-        # Load character sheet
-        sheet_path = project_path / char_cfg.character_sheet
-        if sheet_path.exists():
-            sheet_data = load_yaml_file(sheet_path)
+        if sheet_data is not None:
             character_sheet = CharacterSheet.from_dict(sheet_data)
         else:
             character_sheet = CharacterSheet(name=char_cfg.name)
 
         # Create memory (vector for characters)
         if char_cfg.memory_type == "vector":
-            data_dir = project_path / "data" / "memories"
-            data_dir.mkdir(parents=True, exist_ok=True)
+            memories_dir.mkdir(parents=True, exist_ok=True)
             safe_name = _sanitize_collection_name(char_cfg.name)
             char_memory = VectorMemory(
                 collection_name=safe_name,
-                persist_directory=str(data_dir / safe_name),
+                persist_directory=str(memories_dir / safe_name),
             )
         else:
             char_memory = StructuredMemory(
-                storage_path=project_path / "data" / f"{char_cfg.name.lower()}_memory.json"
+                storage_path=data_dir / f"{char_cfg.name.lower()}_memory.json"
             )
 
         char_agent = CharacterAgent(
@@ -835,9 +1075,17 @@ async def _build_runtime(project_path: Path, config) -> dict:
             character_sheet=character_sheet,
             prompt_dir=char_prompt_dir,
         )
-        await char_agent.initialize()
         character_agents[char_cfg.name] = char_agent
 
+    # Agents are independent of each other, so initialize them concurrently
+    await asyncio.gather(
+        output_mgr.initialize(),
+        world_agent.initialize(),
+        plot_agent.initialize(),
+        writing_agent.initialize(),
+        *(agent.initialize() for agent in character_agents.values()),
+    )
+
     # Create summarizer
     summarizer = MemorySummarizer(llm=plot_backend)
 
@@ -852,6 +1100,11 @@ async def _build_runtime(project_path: Path, config) -> dict:
         summarizer=summarizer,
         max_revision_rounds=config.pipeline.max_revision_rounds,
         parallel_characters=config.pipeline.parallel_character_reactions,
+        response_cache=(
+            ResponseCache(data_dir / "agent_cache.jsonl")
+            if config.pipeline.cache_agent_responses
+            else None
+        ),
     )
 
     return {
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# LibYAML's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class LLMBackendConfig(BaseModel):
@@ -23,6 +28,7 @@ class LLMBackendConfig(BaseModel):
     context_window: int = 8192
     requests_per_minute: int = 60
     default_temperature: float = 0.7
+    request_timeout: float = 600.0
 
     @model_validator(mode="after")
     def resolve_api_key(self) -> "LLMBackendConfig":
@@ -40,6 +46,8 @@ class LLMBackendConfig(BaseModel):
 class SkillConfig(BaseModel):
     """Configuration for a character skill."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str = ""
     proficiency_level: int = 5
@@ -49,6 +57,8 @@ class SkillConfig(BaseModel):
 class RelationshipConfig(BaseModel):
     """Configuration for a character relationship."""
 
+    model_config = ConfigDict(frozen=True)
+
     target_character: str
     relationship_type: str = "neutral"
     trust_level: int = 0
@@ -59,6 +69,8 @@ class RelationshipConfig(BaseModel):
 class EmotionalStateConfig(BaseModel):
     """Configuration for initial emotional state."""
 
+    model_config = ConfigDict(frozen=True)
+
     current_state: str = "neutral"
     intensity: int = 5
     trigger_event: str = ""
@@ -67,6 +79,8 @@ class EmotionalStateConfig(BaseModel):
 class NarrativeWeightConfig(BaseModel):
     """Configuration for narrative weight overrides."""
 
+    model_config = ConfigDict(frozen=True)
+
     dialogue_ratio: Optional[float] = None
     internal_monologue_depth: Optional[int] = None
     scene_presence_priority: Optional[int] = None
@@ -76,6 +90,8 @@ class NarrativeWeightConfig(BaseModel):
 class CharacterAgentConfig(BaseModel):
     """Configuration for a character agent."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     llm_backend: str
     system_prompt: str = "prompts/character/system.jinja2"
@@ -103,6 +119,8 @@ class CharacterAgentConfig(BaseModel):
 class AgentsConfig(BaseModel):
     """Configuration for all agent assignments."""
 
+    model_config = ConfigDict(frozen=True)
+
     world: dict[str, Any]
     plot: dict[str, Any]
     writing: dict[str, Any]
@@ -112,15 +130,26 @@ class AgentsConfig(BaseModel):
 class PipelineConfig(BaseModel):
     """Pipeline execution settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     max_revision_rounds: int = 3
     scene_composition_timeout: int = 180
     character_reaction_timeout: int = 60
     parallel_character_reactions: bool = True
+    # Upper bound on WritingAgent requests in flight at once
+    max_concurrent_llm_calls: int = 8
+    # Reuse WritingAgent responses for byte-identical prompts across runs
+    cache_writing_responses: bool = False
+    # Replay agent responses to identical pipeline requests across runs
+    # (development aid; planning requests are never replayed)
+    cache_agent_responses: bool = False
 
 
 class OutputConfig(BaseModel):
     """Output and export settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     directory: str = "output/"
     formats: list[str] = Field(default_factory=lambda: ["markdown"])
     versioning: bool = True
@@ -130,6 +159,8 @@ class OutputConfig(BaseModel):
 class ProjectMeta(BaseModel):
     """Project metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     author: str = "StoryForge"
     genre: str = ""
@@ -161,6 +192,8 @@ class VisualBackendConfig(BaseModel):
 class VisualAgentsConfig(BaseModel):
     """Configuration for visual pipeline agents."""
 
+    model_config = ConfigDict(frozen=True)
+
     extract: dict[str, Any] = Field(
         default_factory=lambda: {"llm_backend": "openai_medium"}
     )
@@ -179,6 +212,8 @@ class VisualAgentsConfig(BaseModel):
 class VisualPipelineConfig(BaseModel):
     """Visual pipeline execution settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     generate_images: bool = True
     generate_videos: bool = True
     video_duration: int = 8
@@ -187,10 +222,17 @@ class VisualPipelineConfig(BaseModel):
     video_timeout: float = 600.0
     default_image_size: str = "1024x1024"
     default_video_size: str = "1280x720"
+    # Start image generation from the raw prompt while it is being optimized
+    speculative_image_generation: bool = False
 
 
 class ProjectConfig(BaseModel):
-    """Root configuration model for a StoryForge project."""
+    """Root configuration model for a StoryForge project.
+
+    Sections that are never changed after loading are frozen, which lets
+    load_config share them between cached loads. Backend configs stay
+    mutable for API key injection.
+    """
 
     project: ProjectMeta
     llm_backends: dict[str, LLMBackendConfig]
@@ -207,21 +249,74 @@ class ProjectConfig(BaseModel):
     )
 
 
+@lru_cache(maxsize=32)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    # mtime and size are part of the key so an edited file is parsed again.
+    # Bytes go straight to the parser, which detects the UTF-8/16 encoding.
+    with open(path, "rb") as f:
+        return yaml.load(f.read(), Loader=_YAML_LOADER)
+
+
+def _file_key(path: Path) -> tuple[str, int, int]:
+    stat = path.stat()
+    return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+
+
+def _read_yaml(path: Path) -> Any:
+    """Parse a YAML file, reusing the last parse while the file is unchanged.
+
+    Callers get their own copy, since loaded configs are mutated afterwards.
+    """
+    return copy.deepcopy(_parse_yaml_cached(*_file_key(path)))
+
+
+def _api_key_env_snapshot(raw: Any) -> tuple[tuple[str, Optional[str]], ...]:
+    """Current values of the environment variables the config takes keys from."""
+    names = set()
+    if isinstance(raw, dict):
+        for section in ("llm_backends", "visual_backends"):
+            for backend in (raw.get(section) or {}).values():
+                if isinstance(backend, dict) and backend.get("api_key_env"):
+                    names.add(backend["api_key_env"])
+    return tuple((name, os.environ.get(name)) for name in sorted(names))
+
+
+@lru_cache(maxsize=32)
+def _validate_config_cached(
+    path: str, mtime_ns: int, size: int, env: tuple[tuple[str, Optional[str]], ...]
+) -> ProjectConfig:
+    # env is part of the key because validation resolves api_key_env
+    return ProjectConfig.model_validate(_parse_yaml_cached(path, mtime_ns, size))
+
+
 def load_config(project_dir: Path) -> ProjectConfig:
-    """Load and validate a project configuration from a directory."""
+    """Load and validate a project configuration from a directory.
+
+    Validation is reused while project.yaml and the API key environment
+    variables are unchanged. Backend configs are copied per call because
+    API keys get injected into them; the rest is shared and read-only.
+    """
     config_path = project_dir / "project.yaml"
     if not config_path.exists():
         raise FileNotFoundError(f"Project config not found: {config_path}")
 
-    with open(config_path) as f:
-        raw = yaml.safe_load(f)
-
-    return ProjectConfig(**raw)
+    key = _file_key(config_path)
+    env = _api_key_env_snapshot(_parse_yaml_cached(*key))
+    config = _validate_config_cached(*key, env)
+    return config.model_copy(
+        update={
+            "llm_backends": {
+                name: backend.model_copy() for name, backend in config.llm_backends.items()
+            },
+            "visual_backends": {
+                name: backend.model_copy() for name, backend in config.visual_backends.items()
+            },
+        }
+    )
 
 
 def load_yaml_file(path: Path) -> dict[str, Any]:
     """Load a YAML file and return its contents as a dict."""
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    return _read_yaml(path) or {}
@@ -3,25 +3,44 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
-from collections import defaultdict
-from typing import Awaitable, Callable, Optional
+from collections import deque
+from typing import Awaitable, Callable, Optional, Union
 
 from storyforge.events.types import Event, EventType
 
 logger = logging.getLogger(__name__)
 
+# Most recent events kept for get_event_log(); older ones are dropped
+DEFAULT_LOG_CAPACITY = 10_000
+
 EventHandler = Callable[[Event], Awaitable[Optional[Event]]]
-Middleware = Callable[[Event], Awaitable[Optional[Event]]]
+# Middleware may be a plain function or a coroutine function
+Middleware = Callable[[Event], Union[Optional[Event], Awaitable[Optional[Event]]]]
+
+
+def _expire(future: asyncio.Future[Event], event: Event, timeout: float) -> None:
+    if not future.done():
+        future.set_exception(
+            TimeoutError(
+                f"No response for event {event.event_id} "
+                f"({event.event_type.value}) within {timeout}s"
+            )
+        )
 
 
 class EventBus:
     """Async pub/sub event bus with request-response support."""
 
-    def __init__(self) -> None:
-        self._subscribers: dict[EventType, list[EventHandler]] = defaultdict(list)
+    def __init__(self, log_capacity: int = DEFAULT_LOG_CAPACITY) -> None:
+        # Handler tuples are rebuilt on subscribe (rare) so publish (hot)
+        # reads an immutable snapshot with a single lookup. EventType is a
+        # str enum, so the key hashes via str's cached hash; an index table
+        # would need the same lookup to find its slot.
+        self._subscribers: dict[EventType, tuple[EventHandler, ...]] = {}
         self._directed_handlers: dict[str, EventHandler] = {}
-        self._event_log: list[Event] = []
+        self._event_log: deque[Event] = deque(maxlen=log_capacity)
         self._middleware: list[Middleware] = []
         self._response_futures: dict[str, asyncio.Future[Event]] = {}
 
@@ -29,7 +48,10 @@ class EventBus:
         self, event_type: EventType, handler: EventHandler
     ) -> None:
         """Register a handler for a specific event type."""
-        self._subscribers[event_type].append(handler)
+        self._subscribers[event_type] = (
+            *self._subscribers.get(event_type, ()),
+            handler,
+        )
 
     async def subscribe_directed(
         self, agent_name: str, handler: EventHandler
@@ -42,7 +64,9 @@ class EventBus:
         # Run middleware chain
         processed: Optional[Event] = event
         for mw in self._middleware:
-            processed = await mw(processed)
+            result = mw(processed)
+            # Synchronous middleware skips creating and awaiting a coroutine
+            processed = await result if inspect.isawaitable(result) else result
             if processed is None:
                 return
         event = processed
@@ -50,14 +74,12 @@ class EventBus:
         self._event_log.append(event)
 
         # Check if this event resolves a pending future
-        if (
-            event.correlation_id
-            and event.correlation_id in self._response_futures
-        ):
-            future = self._response_futures[event.correlation_id]
-            if not future.done():
-                future.set_result(event)
-            return
+        if event.correlation_id:
+            future = self._response_futures.get(event.correlation_id)
+            if future is not None:
+                if not future.done():
+                    future.set_result(event)
+                return
 
         # Directed event — send only to the target agent
         if event.target_agent and event.target_agent in self._directed_handlers:
@@ -74,18 +96,27 @@ class EventBus:
                 )
             return
 
-        # Broadcast to all subscribers of this event type
-        handlers = self._subscribers.get(event.event_type, [])
-        tasks = [handler(event) for handler in handlers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for result in results:
-            if isinstance(result, Event):
-                await self.publish(result)
-            elif isinstance(result, Exception):
-                logger.exception(
-                    "Handler error for %s: %s", event.event_type, result
-                )
+        # Broadcast to all subscribers of this event type. Many events
+        # (stage notifications, results nobody listens for) have none, so
+        # skip building and gathering an empty task list.
+        handlers = self._subscribers.get(event.event_type, ())
+        if not handlers:
+            return
+        if len(handlers) == 1:
+            # Common case: await the lone handler without gather's futures
+            await self._dispatch(handlers[0], event)
+        else:
+            await asyncio.gather(*(self._dispatch(h, event) for h in handlers))
+
+    async def _dispatch(self, handler: EventHandler, event: Event) -> None:
+        """Run one broadcast handler and republish its response right away."""
+        try:
+            result = await handler(event)
+        except Exception:
+            logger.exception("Handler error for %s", event.event_type)
+            return
+        if isinstance(result, Event):
+            await self.publish(result)
 
     async def request(
         self, event: Event, timeout: float = 60.0
@@ -95,20 +126,25 @@ class EventBus:
         future: asyncio.Future[Event] = loop.create_future()
         self._response_futures[event.event_id] = future
 
-        await self.publish(event)
-
+        timer: Optional[asyncio.TimerHandle] = None
         try:
-            return await asyncio.wait_for(future, timeout=timeout)
-        except asyncio.TimeoutError:
-            raise TimeoutError(
-                f"No response for event {event.event_id} "
-                f"({event.event_type.value}) within {timeout}s"
-            )
+            await self.publish(event)
+            # Directed handlers usually respond before publish returns
+            if future.done():
+                return future.result()
+            # A timer on the future itself avoids the wrapper task wait_for makes
+            timer = loop.call_later(timeout, _expire, future, event, timeout)
+            return await future
         finally:
+            if timer is not None:
+                timer.cancel()
             self._response_futures.pop(event.event_id, None)
 
     def add_middleware(self, middleware: Middleware) -> None:
-        """Add a middleware function to the processing chain."""
+        """Add a middleware function to the processing chain.
+
+        Middleware may return the event directly or an awaitable of it.
+        """
         self._middleware.append(middleware)
 
     def get_event_log(
@@ -116,13 +152,13 @@ class EventBus:
         event_type: Optional[EventType] = None,
         chapter: Optional[int] = None,
     ) -> list[Event]:
-        """Retrieve logged events, optionally filtered."""
-        events = self._event_log
-        if event_type is not None:
-            events = [e for e in events if e.event_type == event_type]
-        if chapter is not None:
-            events = [e for e in events if e.chapter_number == chapter]
-        return events
+        """Retrieve the most recent logged events, optionally filtered."""
+        return [
+            e
+            for e in self._event_log
+            if (event_type is None or e.event_type == event_type)
+            and (chapter is None or e.chapter_number == chapter)
+        ]
 
     def clear_log(self) -> None:
         """Clear the event log."""
@@ -2,38 +2,45 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from storyforge.events.types import Event
+from storyforge.utils.serialization import dumps_line
 
 logger = logging.getLogger(__name__)
 
+_WRITE_BUFFER_SIZE = 1 << 16
+
 
 class EventLogger:
     """Logs all events for debugging."""
 
-    async def __call__(self, event: Event) -> Optional[Event]:
+    def __call__(self, event: Event) -> Optional[Event]:
         logger.debug(
             "[%s] -> %s (id=%s, corr=%s)",
             event.source_agent,
             event.event_type.value,
-            event.event_id[:8],
-            event.correlation_id[:8] if event.correlation_id else "none",
+            event.event_id,
+            event.correlation_id or "none",
         )
         return event
 
 
 class EventFileLogger:
-    """Persists events to a JSONL file for replay/debugging."""
+    """Persists events to a JSONL file for replay/debugging.
+
+    The file stays open between events and writes are buffered; call
+    ``flush()`` or ``close()`` to make sure everything is on disk.
+    """
 
     def __init__(self, log_path: Path) -> None:
         self._log_path = log_path
         self._log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[BinaryIO] = None
 
-    async def __call__(self, event: Event) -> Optional[Event]:
+    def __call__(self, event: Event) -> Optional[Event]:
         record = {
             "event_type": event.event_type.value,
             "source_agent": event.source_agent,
@@ -45,6 +52,20 @@ class EventFileLogger:
             "timestamp": event.timestamp.isoformat(),
             "payload_keys": list(event.payload.keys()),
         }
-        with open(self._log_path, "a") as f:
-            f.write(json.dumps(record) + "\n")
+        if self._file is None:
+            # Append mode keeps concurrent writers from clobbering each other;
+            # the large buffer batches many records into each write syscall.
+            self._file = open(self._log_path, "ab", buffering=_WRITE_BUFFER_SIZE)
+        self._file.write(dumps_line(record))
         return event
+
+    def flush(self) -> None:
+        """Write buffered records to disk."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the log file; it is reopened on the next event."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
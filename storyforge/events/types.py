@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import uuid
+import itertools
+import secrets
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 
+from storyforge.utils.compat import DATACLASS_SLOTS
+
 
 class EventType(str, Enum):
     """All event types in the StoryForge pub/sub system."""
@@ -70,22 +74,90 @@ class EventType(str, Enum):
     VISUAL_GENERATE_RESULT = "visual_generate_result"
 
 
-@dataclass
+# Event ids only need to be unique within a process (they key correlation
+# futures); a random per-process tag keeps logs from different runs apart.
+_PROC_TAG = secrets.token_hex(4)
+_EVENT_COUNTER = itertools.count()
+
+
+def _next_event_id() -> str:
+    return f"{_PROC_TAG}-{next(_EVENT_COUNTER):x}"
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _datetime_to_ns(value: datetime) -> int:
+    """Nanoseconds since the epoch; naive datetimes are taken as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return (
+        (delta.days * 86_400 + delta.seconds) * 1_000_000_000
+        + delta.microseconds * 1000
+    )
+
+
+@dataclass(init=False, **DATACLASS_SLOTS)
 class Event:
-    """A single event in the pub/sub system."""
+    """A single event in the pub/sub system.
+
+    Events are published at high rates, so instances use ``__slots__`` where
+    available to keep them small and cheap to create.
+    """
 
     event_type: EventType
     payload: dict[str, Any]
     source_agent: str
     target_agent: Optional[str] = None
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    event_id: str = field(default_factory=_next_event_id)
     correlation_id: Optional[str] = None
-    timestamp: datetime = field(
-        default_factory=lambda: datetime.now(timezone.utc)
-    )
+    # Wall-clock nanoseconds; see the ``timestamp`` property for a datetime
+    timestamp_ns: int = field(default_factory=time.time_ns)
     chapter_number: Optional[int] = None
     scene_index: Optional[int] = None
 
+    def __init__(
+        self,
+        event_type: EventType,
+        payload: dict[str, Any],
+        source_agent: str,
+        target_agent: Optional[str] = None,
+        event_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
+        chapter_number: Optional[int] = None,
+        scene_index: Optional[int] = None,
+        *,
+        timestamp_ns: Optional[int] = None,
+    ) -> None:
+        # Written out so ``timestamp=`` (a datetime, as events used to
+        # store) keeps working alongside ``timestamp_ns=``
+        self.event_type = event_type
+        self.payload = payload
+        self.source_agent = source_agent
+        self.target_agent = target_agent
+        self.event_id = _next_event_id() if event_id is None else event_id
+        self.correlation_id = correlation_id
+        if timestamp_ns is None:
+            timestamp_ns = (
+                time.time_ns() if timestamp is None else _datetime_to_ns(timestamp)
+            )
+        self.timestamp_ns = timestamp_ns
+        self.chapter_number = chapter_number
+        self.scene_index = scene_index
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the event was created, as an aware UTC datetime.
+
+        Built on demand so publishing does not allocate a datetime per event.
+        """
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, timezone.utc).replace(
+            microsecond=nanos // 1000
+        )
+
     def create_response(
         self,
         event_type: EventType,
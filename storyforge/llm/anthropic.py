@@ -2,24 +2,64 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from typing import AsyncIterator, Optional
 
-from anthropic import AsyncAnthropic
-
 from storyforge.llm.base import LLMBackend, LLMConfig, LLMResponse
+from storyforge.llm.factory import LLMFactory
 from storyforge.llm.rate_limiter import TokenBucketRateLimiter
+from storyforge.utils.tokens import count_tokens_approximate, get_encoding
 
 logger = logging.getLogger(__name__)
 
+# Distinct texts whose exact token counts are remembered per backend
+_TOKEN_COUNT_CACHE_SIZE = 1024
+
+
+def _cacheable_system(system_msg: str) -> list[dict]:
+    """Mark the system prompt as a cacheable prefix.
+
+    Agents resend the same system prompt on every call, so the API can skip
+    re-processing it. Prompts below the model's minimum cacheable length are
+    simply not cached.
+    """
+    return [
+        {"type": "text", "text": system_msg, "cache_control": {"type": "ephemeral"}}
+    ]
+
+
+def _split_system(messages: list[dict[str, str]]) -> tuple[str, list[dict[str, str]]]:
+    """Separate the system prompt from the chat turns.
+
+    The API takes the system prompt as its own argument; if several are
+    given, the last one wins.
+    """
+    chat_messages = [msg for msg in messages if msg["role"] != "system"]
+    if len(chat_messages) == len(messages):
+        return "", chat_messages
+    system_msg = next(
+        msg["content"] for msg in reversed(messages) if msg["role"] == "system"
+    )
+    return system_msg, chat_messages
+
 
 class AnthropicBackend(LLMBackend):
     """Backend for Anthropic Claude models."""
 
     def __init__(self, config: LLMConfig) -> None:
+        # Imported here so loading the module doesn't pull in the SDK
+        from anthropic import AsyncAnthropic
+
         super().__init__(config)
-        self._client = AsyncAnthropic(api_key=config.api_key)
+        self._client = LLMFactory.shared_client(
+            ("anthropic", config.api_key),
+            lambda: AsyncAnthropic(api_key=config.api_key),
+        )
         self._limiter = TokenBucketRateLimiter(config.requests_per_minute)
+        self._token_counts: OrderedDict[bytes, int] = OrderedDict()
 
     async def generate(
         self,
@@ -30,13 +70,7 @@ class AnthropicBackend(LLMBackend):
     ) -> LLMResponse:
         await self._limiter.acquire()
 
-        system_msg = ""
-        chat_messages = []
-        for msg in messages:
-            if msg["role"] == "system":
-                system_msg = msg["content"]
-            else:
-                chat_messages.append(msg)
+        system_msg, chat_messages = _split_system(messages)
 
         kwargs: dict = {
             "model": self.config.model,
@@ -45,7 +79,7 @@ class AnthropicBackend(LLMBackend):
             "max_tokens": max_tokens or self.config.max_tokens,
         }
         if system_msg:
-            kwargs["system"] = system_msg
+            kwargs["system"] = _cacheable_system(system_msg)
         if stop_sequences:
             kwargs["stop_sequences"] = stop_sequences
 
@@ -68,13 +102,7 @@ class AnthropicBackend(LLMBackend):
     ) -> AsyncIterator[str]:
         await self._limiter.acquire()
 
-        system_msg = ""
-        chat_messages = []
-        for msg in messages:
-            if msg["role"] == "system":
-                system_msg = msg["content"]
-            else:
-                chat_messages.append(msg)
+        system_msg, chat_messages = _split_system(messages)
 
         kwargs: dict = {
             "model": self.config.model,
@@ -83,20 +111,63 @@ class AnthropicBackend(LLMBackend):
             "max_tokens": max_tokens or self.config.max_tokens,
         }
         if system_msg:
-            kwargs["system"] = system_msg
+            kwargs["system"] = _cacheable_system(system_msg)
 
         async with self._client.messages.stream(**kwargs) as stream:
             async for text in stream.text_stream:
                 yield text
 
     async def count_tokens(self, text: str) -> int:
+        """Count tokens with Claude's own tokenizer via the API.
+
+        Results are cached by content digest, since agents re-count the same
+        system prompts and history messages on every call. If the endpoint is
+        unreachable, fall back to a local estimate (not cached).
+        """
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        cached = self._token_counts.get(key)
+        if cached is not None:
+            self._token_counts.move_to_end(key)
+            return cached
+
+        # Not rate limited here: the counting endpoint has its own limit and
+        # must not take slots away from generation requests.
         try:
-            import tiktoken
+            result = await self._client.messages.count_tokens(
+                model=self.config.model,
+                messages=[{"role": "user", "content": text}],
+            )
+        except Exception:
+            logger.debug(
+                "Token counting endpoint failed; estimating locally", exc_info=True
+            )
+            return self._estimate_tokens(text)
+
+        self._token_counts[key] = result.input_tokens
+        if len(self._token_counts) > _TOKEN_COUNT_CACHE_SIZE:
+            self._token_counts.popitem(last=False)
+        return result.input_tokens
 
-            enc = tiktoken.get_encoding("cl100k_base")
-            return len(enc.encode(text))
-        except ImportError:
-            return len(text) // 4
+    async def count_message_tokens(self, messages: list[dict[str, str]]) -> int:
+        """Sum the cached per-message counts of a whole request.
+
+        Only texts not seen before reach the endpoint, and those are counted
+        concurrently so a request costs at most one round trip.
+        """
+        counts = await asyncio.gather(
+            *(self.count_tokens(m["content"]) for m in messages)
+        )
+        return sum(counts)
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        try:
+            enc = get_encoding("cl100k_base")
+        except Exception:
+            enc = None
+        if enc is None:
+            return count_tokens_approximate(text)
+        return len(enc.encode(text, disallowed_special=()))
 
     async def health_check(self) -> bool:
         try:
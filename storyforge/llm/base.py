@@ -41,6 +41,7 @@ class LLMConfig:
     default_temperature: float = 0.7
     requests_per_minute: int = 60
     context_window: int = 8192
+    request_timeout: float = 600.0
 
 
 class LLMBackend(ABC):
@@ -75,6 +76,17 @@ class LLMBackend(ABC):
         """Count tokens for the specific model's tokenizer."""
         ...
 
+    async def count_message_tokens(self, messages: list[dict[str, Any]]) -> int:
+        """Count the input tokens of a whole request (system, history, prompt).
+
+        Backends whose tokenizer is remote may override this to avoid serial
+        round trips.
+        """
+        total = 0
+        for message in messages:
+            total += await self.count_tokens(message["content"])
+        return total
+
     @abstractmethod
     async def health_check(self) -> bool:
         """Verify the backend is reachable and the model is available."""
@@ -0,0 +1,83 @@
+"""Exact-match cache for LLM responses, optionally persisted to disk."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """LRU cache of LLM responses keyed by a digest of the request.
+
+    When ``path`` is set, entries are appended to a JSON-lines file and loaded
+    back on first use, so re-running a project reuses earlier responses.
+    Values must be JSON-serializable.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = 1024) -> None:
+        self._path = path
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._loaded = path is None
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Digest the request parameters that determine a response."""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None on a miss."""
+        self._load()
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache a value, persisting it when the cache is file-backed."""
+        self._load()
+        self._remember(key, value)
+        if self._path is not None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"key": key, "value": value}, ensure_ascii=False))
+                f.write("\n")
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._entries)
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._path.exists():
+            return
+        line_count = 0
+        with open(self._path, encoding="utf-8") as f:
+            for line in f:
+                line_count += 1
+                try:
+                    record = json.loads(line)
+                    self._remember(record["key"], record["value"])
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    logger.warning("Skipping corrupt cache line in %s", self._path)
+        # Compact the file once superseded and evicted lines dominate it
+        if line_count > 2 * max(len(self._entries), 1):
+            with open(self._path, "w", encoding="utf-8") as f:
+                for key, value in self._entries.items():
+                    f.write(json.dumps({"key": key, "value": value}, ensure_ascii=False))
+                    f.write("\n")
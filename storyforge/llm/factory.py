@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Type
+import asyncio
+import importlib
+from typing import Any, Callable, Optional, Type
 
 from storyforge.llm.base import LLMBackend, LLMConfig, ModelTier
 
@@ -10,21 +12,26 @@ from storyforge.llm.base import LLMBackend, LLMConfig, ModelTier
 class LLMFactory:
     """Creates LLM backend instances from configuration."""
 
+    # Built-in backends as (module, class) so only the configured provider's
+    # SDK is imported; resolved classes are cached in _providers.
+    _builtin_providers: dict[str, tuple[str, str]] = {
+        "ollama": ("storyforge.llm.ollama", "OllamaBackend"),
+        "anthropic": ("storyforge.llm.anthropic", "AnthropicBackend"),
+        "openai": ("storyforge.llm.openai", "OpenAIBackend"),
+    }
     _providers: dict[str, Type[LLMBackend]] = {}
+    # SDK clients shared by backends with the same endpoint and credentials
+    _clients: dict[tuple, Any] = {}
+    _clients_loop: Optional[asyncio.AbstractEventLoop] = None
 
     @classmethod
-    def _ensure_defaults(cls) -> None:
-        if cls._providers:
-            return
-        from storyforge.llm.anthropic import AnthropicBackend
-        from storyforge.llm.ollama import OllamaBackend
-        from storyforge.llm.openai import OpenAIBackend
-
-        cls._providers = {
-            "ollama": OllamaBackend,
-            "anthropic": AnthropicBackend,
-            "openai": OpenAIBackend,
-        }
+    def _resolve_provider(cls, name: str) -> Optional[Type[LLMBackend]]:
+        provider_cls = cls._providers.get(name)
+        if provider_cls is None and name in cls._builtin_providers:
+            module_name, class_name = cls._builtin_providers[name]
+            provider_cls = getattr(importlib.import_module(module_name), class_name)
+            cls._providers[name] = provider_cls
+        return provider_cls
 
     @classmethod
     def register_provider(
@@ -33,15 +40,35 @@ class LLMFactory:
         """Register a custom LLM provider."""
         cls._providers[name] = backend_class
 
+    @classmethod
+    def shared_client(cls, key: tuple, create: Callable[[], Any]) -> Any:
+        """Return the SDK client cached under key, creating it on first use.
+
+        Backends on the same account then share one connection pool. Pools
+        are bound to the event loop that uses them, so the cache starts over
+        whenever the running loop changes.
+        """
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not cls._clients_loop:
+            cls._clients = {}
+            cls._clients_loop = loop
+        client = cls._clients.get(key)
+        if client is None:
+            client = cls._clients[key] = create()
+        return client
+
     @classmethod
     def create(cls, config: LLMConfig) -> LLMBackend:
         """Instantiate the appropriate backend from config."""
-        cls._ensure_defaults()
-        provider_cls = cls._providers.get(config.provider)
+        provider_cls = cls._resolve_provider(config.provider)
         if provider_cls is None:
+            available = {**cls._builtin_providers, **cls._providers}
             raise ValueError(
                 f"Unknown LLM provider: {config.provider}. "
-                f"Available: {list(cls._providers.keys())}"
+                f"Available: {list(available.keys())}"
             )
         return provider_cls(config)
 
@@ -61,5 +88,33 @@ class LLMFactory:
             default_temperature=config_dict.get("default_temperature", 0.7),
             requests_per_minute=config_dict.get("requests_per_minute", 60),
             context_window=config_dict.get("context_window", 8192),
+            request_timeout=config_dict.get("request_timeout", 600.0),
         )
         return cls.create(llm_config)
+
+    @staticmethod
+    def config_from(source: Any) -> LLMConfig:
+        """Build an LLMConfig from any object with backend config attributes.
+
+        Reads fields directly, so pydantic settings models need no dump first.
+        """
+        tier = getattr(source, "tier", "small")
+        if isinstance(tier, str):
+            tier = ModelTier(tier)
+        return LLMConfig(
+            provider=source.provider,
+            model=source.model,
+            tier=tier,
+            base_url=getattr(source, "base_url", None),
+            api_key=getattr(source, "api_key", None),
+            max_tokens=getattr(source, "max_tokens", 4096),
+            default_temperature=getattr(source, "default_temperature", 0.7),
+            requests_per_minute=getattr(source, "requests_per_minute", 60),
+            context_window=getattr(source, "context_window", 8192),
+            request_timeout=getattr(source, "request_timeout", 600.0),
+        )
+
+    @classmethod
+    def create_from_config(cls, source: Any) -> LLMBackend:
+        """Create backend from a config object such as LLMBackendConfig."""
+        return cls.create(cls.config_from(source))
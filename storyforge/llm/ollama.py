@@ -5,9 +5,8 @@ from __future__ import annotations
 import logging
 from typing import AsyncIterator, Optional
 
-from ollama import AsyncClient
-
 from storyforge.llm.base import LLMBackend, LLMConfig, LLMResponse
+from storyforge.llm.factory import LLMFactory
 
 logger = logging.getLogger(__name__)
 
@@ -16,9 +15,12 @@ class OllamaBackend(LLMBackend):
     """Backend for local models via Ollama."""
 
     def __init__(self, config: LLMConfig) -> None:
+        from ollama import AsyncClient
+
         super().__init__(config)
-        self._client = AsyncClient(
-            host=config.base_url or "http://localhost:11434"
+        host = config.base_url or "http://localhost:11434"
+        self._client = LLMFactory.shared_client(
+            ("ollama", host), lambda: AsyncClient(host=host)
         )
 
     async def generate(
@@ -2,39 +2,97 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from typing import Any, AsyncIterator, Optional
+from typing import Any, AsyncIterator, Optional, Union
 
-from openai import AsyncOpenAI
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from storyforge.llm.base import LLMBackend, LLMConfig, LLMResponse
+from storyforge.llm.factory import LLMFactory
 from storyforge.llm.rate_limiter import TokenBucketRateLimiter
+from storyforge.utils.serialization import dumps_line
+from storyforge.utils.tokens import (
+    count_tokens_approximate,
+    count_tokens_tiktoken_batch,
+    encoding_for_model,
+)
 
 logger = logging.getLogger(__name__)
 
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    from openai import APITimeoutError, RateLimitError
+
+    return isinstance(exc, (RateLimitError, APITimeoutError))
+
+
+# Backoff for fanned-out requests: 1s, 2s, 4s, 8s between five attempts
+_batch_retry = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=1, max=8),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+)
+
+
+_CONNECT_TIMEOUT = 5.0
+
+
+def _http_client() -> Optional[Any]:
+    """Return an HTTP/2 client for AsyncOpenAI, or None for the SDK default.
+
+    HTTP/2 multiplexes concurrent requests over one connection, but httpx
+    only supports it when the optional ``h2`` package is installed. The
+    SDK's default client keeps its own (already generous) pool limits.
+    """
+    import importlib.util
+
+    if importlib.util.find_spec("h2") is None:
+        return None
+    from openai import DefaultAsyncHttpxClient
+
+    return DefaultAsyncHttpxClient(http2=True)
+
 
 class OpenAIBackend(LLMBackend):
     """Backend for OpenAI models."""
 
     def __init__(self, config: LLMConfig) -> None:
+        from openai import AsyncOpenAI, Timeout
+
         super().__init__(config)
-        kwargs: dict = {}
-        if config.api_key:
-            kwargs["api_key"] = config.api_key
-        if config.base_url:
-            kwargs["base_url"] = config.base_url
-        self._client = AsyncOpenAI(**kwargs)
+
+        def create() -> Any:
+            # Built only on a cache miss, so reused clients don't leave an
+            # unused HTTP client behind
+            kwargs: dict = {
+                "timeout": Timeout(config.request_timeout, connect=_CONNECT_TIMEOUT),
+                "http_client": _http_client(),
+            }
+            if config.api_key:
+                kwargs["api_key"] = config.api_key
+            if config.base_url:
+                kwargs["base_url"] = config.base_url
+            return AsyncOpenAI(**kwargs)
+
+        self._client = LLMFactory.shared_client(
+            ("openai", config.api_key, config.base_url, config.request_timeout),
+            create,
+        )
         self._limiter = TokenBucketRateLimiter(config.requests_per_minute)
 
-    async def generate(
+    def _completion_kwargs(
         self,
         messages: list[dict[str, Any]],
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         stop_sequences: Optional[list[str]] = None,
-    ) -> LLMResponse:
-        await self._limiter.acquire()
-
+    ) -> dict[str, Any]:
         kwargs: dict = {
             "model": self.config.model,
             "messages": messages,
@@ -43,21 +101,126 @@ class OpenAIBackend(LLMBackend):
         }
         if stop_sequences:
             kwargs["stop"] = stop_sequences
+        return kwargs
 
+    async def generate(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        stop_sequences: Optional[list[str]] = None,
+    ) -> LLMResponse:
+        await self._limiter.acquire()
+
+        kwargs = self._completion_kwargs(
+            messages, temperature, max_tokens, stop_sequences
+        )
         response = await self._client.chat.completions.create(**kwargs)
         choice = response.choices[0]
+        usage = response.usage
+        input_tokens, output_tokens = (
+            (usage.prompt_tokens, usage.completion_tokens) if usage else (0, 0)
+        )
 
         return LLMResponse(
             content=choice.message.content or "",
             model=response.model,
-            input_tokens=response.usage.prompt_tokens if response.usage else 0,
-            output_tokens=(
-                response.usage.completion_tokens if response.usage else 0
-            ),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
             finish_reason=choice.finish_reason or "stop",
             raw_response=response,
         )
 
+    async def generate_many(
+        self,
+        requests: list[dict[str, Any]],
+        max_concurrency: int = 10,
+    ) -> list[Union[LLMResponse, BaseException]]:
+        """Run several generate() calls concurrently.
+
+        Each request is a dict of generate() keyword arguments. At most
+        ``max_concurrency`` calls are in flight, the rate limiter still paces
+        them, and rate-limit errors or timeouts are retried with backoff.
+        Results come back in request order, with the exception in place of
+        any request that ultimately failed.
+        """
+        slots = asyncio.Semaphore(max_concurrency)
+        generate = _batch_retry(self.generate)
+
+        async def run(kwargs: dict[str, Any]) -> LLMResponse:
+            async with slots:
+                return await generate(**kwargs)
+
+        return await asyncio.gather(
+            *(run(kwargs) for kwargs in requests), return_exceptions=True
+        )
+
+    async def generate_batch(
+        self,
+        requests: list[dict[str, Any]],
+        poll_interval: float = 30.0,
+    ) -> list[LLMResponse]:
+        """Run chat completions through the Batch API.
+
+        Batches cost half as much and draw on a separate rate-limit pool, but
+        may take up to 24 hours, so this suits offline bulk work only. Each
+        request is a dict of generate() keyword arguments; responses come
+        back in request order.
+        """
+        lines = [
+            dumps_line(
+                {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": _BATCH_ENDPOINT,
+                    "body": self._completion_kwargs(**kwargs),
+                }
+            )
+            for index, kwargs in enumerate(requests)
+        ]
+        input_file = await self._client.files.create(
+            file=("storyforge-batch.jsonl", b"".join(lines)), purpose="batch"
+        )
+        batch = await self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=_BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        while batch.status not in _BATCH_FINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await self._client.batches.retrieve(batch.id)
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} ended as {batch.status}")
+
+        output = await self._client.files.content(batch.output_file_id)
+        bodies: dict[str, dict] = {}
+        for line in output.text.splitlines():
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                bodies[record["custom_id"]] = response["body"]
+
+        results = []
+        for index in range(len(requests)):
+            body = bodies.get(str(index))
+            if body is None:
+                raise RuntimeError(
+                    f"OpenAI batch {batch.id} has no response for request {index}"
+                )
+            choice = body["choices"][0]
+            usage = body.get("usage") or {}
+            results.append(
+                LLMResponse(
+                    content=choice["message"].get("content") or "",
+                    model=body.get("model", self.config.model),
+                    input_tokens=usage.get("prompt_tokens", 0),
+                    output_tokens=usage.get("completion_tokens", 0),
+                    finish_reason=choice.get("finish_reason") or "stop",
+                    raw_response=body,
+                )
+            )
+        return results
+
     async def generate_stream(
         self,
         messages: list[dict[str, Any]],
@@ -74,17 +237,28 @@ class OpenAIBackend(LLMBackend):
             stream=True,
         )
         async for chunk in stream:
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+            choices = chunk.choices
+            if not choices:
+                continue
+            content = choices[0].delta.content
+            if content:
+                yield content
 
     async def count_tokens(self, text: str) -> int:
         try:
-            import tiktoken
+            enc = encoding_for_model(self.config.model)
+            if enc is not None:
+                return len(enc.encode(text, disallowed_special=()))
+        except Exception:
+            pass
+        return count_tokens_approximate(text)
 
-            enc = tiktoken.encoding_for_model(self.config.model)
-            return len(enc.encode(text))
+    async def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens for several texts with one batched encode."""
+        try:
+            return count_tokens_tiktoken_batch(texts, self.config.model)
         except Exception:
-            return len(text) // 4
+            return [count_tokens_approximate(text) for text in texts]
 
     async def health_check(self) -> bool:
         try:
@@ -23,7 +23,6 @@ class TokenBucketRateLimiter:
         self._request_tokens = float(requests_per_minute)
         self._token_tokens = float(tokens_per_minute) if tokens_per_minute else 0
         self._last_refill = time.monotonic()
-        self._lock = asyncio.Lock()
         self._acquire_timeout = acquire_timeout
 
     def _refill(self) -> None:
@@ -51,21 +50,39 @@ class TokenBucketRateLimiter:
         """
         start = time.monotonic()
         while True:
-            elapsed = time.monotonic() - start
-            if elapsed > self._acquire_timeout:
+            # No lock needed: nothing between refill and decrement awaits, so
+            # no other coroutine can interleave on the event loop.
+            self._refill()
+            has_request = self._request_tokens >= 1.0
+            has_tokens = not self._tpm or self._token_tokens >= token_count
+            if has_request and has_tokens:
+                self._request_tokens -= 1.0
+                if self._tpm and token_count:
+                    self._token_tokens -= token_count
+                return
+            wait = self._time_until_available(token_count)
+
+            remaining = self._acquire_timeout - (time.monotonic() - start)
+            if remaining <= 0:
                 raise TimeoutError(
                     f"Rate limiter timed out after {self._acquire_timeout:.0f}s "
                     f"waiting for capacity (rpm={self._rpm}, tpm={self._tpm})"
                 )
-            async with self._lock:
-                self._refill()
-                has_request = self._request_tokens >= 1.0
-                has_tokens = (
-                    not self._tpm or self._token_tokens >= token_count
-                )
-                if has_request and has_tokens:
-                    self._request_tokens -= 1.0
-                    if self._tpm and token_count:
-                        self._token_tokens -= token_count
-                    return
-            await asyncio.sleep(0.1)
+            # Sleep exactly until the bucket refills (or the timeout expires)
+            # rather than polling
+            await asyncio.sleep(min(wait, remaining))
+
+    def _time_until_available(self, token_count: int) -> float:
+        """Seconds until both buckets can cover a request, given no other callers."""
+        waits = [0.0]
+        if self._request_tokens < 1.0:
+            waits.append(_refill_time(1.0 - self._request_tokens, self._rpm))
+        if self._tpm and self._token_tokens < token_count:
+            waits.append(_refill_time(token_count - self._token_tokens, self._tpm))
+        return max(waits)
+
+
+def _refill_time(deficit: float, per_minute: int) -> float:
+    if per_minute <= 0:
+        return float("inf")
+    return deficit * 60.0 / per_minute
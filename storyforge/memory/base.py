@@ -40,3 +40,6 @@ class MemoryStore(ABC):
     async def clear(self) -> None:
         """Clear all stored data."""
         ...
+
+    async def flush(self) -> None:
+        """Persist buffered writes; stores that write through need not override."""
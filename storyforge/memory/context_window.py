@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Callable
+from itertools import accumulate
+from typing import Any, Callable, Optional
 
 
 @dataclass
@@ -27,6 +30,10 @@ class ContextBudget:
         )
 
 
+# Token counts remembered per manager, keyed by (length, hash) of the text
+_COUNT_CACHE_SIZE = 128
+
+
 class ContextWindowManager:
     """Manages context window budgets, especially for small models."""
 
@@ -34,9 +41,31 @@ class ContextWindowManager:
         self,
         max_context_tokens: int,
         token_counter: Callable[[str], int],
+        batch_token_counter: Optional[Callable[[list[str]], list[int]]] = None,
+        encoder: Optional[Any] = None,
     ) -> None:
         self._max_tokens = max_context_tokens
-        self._count = token_counter
+        self._count_uncached = token_counter
+        self._count_batch = batch_token_counter
+        # Tokenizer with encode/decode (e.g. a tiktoken encoding) for exact cuts
+        self._encoder = encoder
+        self._counts: OrderedDict[tuple[int, int], int] = OrderedDict()
+
+    def _count(self, text: str) -> int:
+        """Count tokens, reusing counts for text seen recently.
+
+        System prompts and fixed context repeat across chapters. Keying on
+        (length, hash) rather than the text avoids pinning large strings.
+        """
+        key = (len(text), hash(text))
+        cached = self._counts.get(key)
+        if cached is not None:
+            self._counts.move_to_end(key)
+            return cached
+        count = self._counts[key] = self._count_uncached(text)
+        if len(self._counts) > _COUNT_CACHE_SIZE:
+            self._counts.popitem(last=False)
+        return count
 
     def allocate_budget(
         self,
@@ -58,6 +87,10 @@ class ContextWindowManager:
         budget_tokens: int,
     ) -> list[str]:
         """Select items that fit within the budget, preserving order."""
+        if self._count_batch is not None:
+            # One batched count, then find the cutoff in the running totals
+            totals = list(accumulate(self._count_batch(items)))
+            return items[: bisect_right(totals, budget_tokens)]
         selected: list[str] = []
         used = 0
         for item in items:
@@ -71,6 +104,12 @@ class ContextWindowManager:
 
     def truncate_text(self, text: str, budget_tokens: int) -> str:
         """Hard-truncate text to fit within a token budget."""
+        if self._encoder is not None:
+            # Cut in token space, leaving one token for the ellipsis
+            ids = self._encoder.encode(text)
+            if len(ids) <= budget_tokens:
+                return text
+            return self._encoder.decode(ids[: max(0, budget_tokens - 1)]) + "..."
         # Approximate: cut at 4 chars per token
         max_chars = budget_tokens * 4
         if len(text) <= max_chars:
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional
 
 from storyforge.memory.base import MemoryStore
+from storyforge.utils.serialization import dumps_pretty, loads
+
+
+@lru_cache(maxsize=4096)
+def _split(key: str) -> tuple[str, ...]:
+    """Parse a dotted key once; pipelines look up the same paths repeatedly."""
+    return tuple(key.split("."))
 
 
 class StructuredMemory(MemoryStore):
@@ -15,22 +25,28 @@ class StructuredMemory(MemoryStore):
     def __init__(self, storage_path: Optional[Path] = None) -> None:
         self._storage_path = storage_path
         self._data: dict[str, Any] = {}
+        # Leaf keys and (path, value, lowercased value) string hits, built on
+        # first use after a change; see _index_tree()
+        self._index: Optional[tuple[list[str], list[tuple[str, str, str]]]] = None
+        # Leaf keys the sorted table was built from, and the table itself
+        self._key_order: Optional[tuple[list[str], list[tuple[str, int]]]] = None
 
     async def store(
         self, key: str, value: Any, metadata: Optional[dict] = None
     ) -> None:
         """Store with dotted key support: 'world.magic.rules'."""
-        parts = key.split(".")
+        parts = _split(key)
         target = self._data
         for part in parts[:-1]:
             if part not in target or not isinstance(target[part], dict):
                 target[part] = {}
             target = target[part]
         target[parts[-1]] = value
+        self._index = None
 
     async def retrieve(self, key: str) -> Optional[Any]:
         """Retrieve by dotted key path."""
-        parts = key.split(".")
+        parts = _split(key)
         current = self._data
         for part in parts:
             if not isinstance(current, dict) or part not in current:
@@ -41,39 +57,51 @@ class StructuredMemory(MemoryStore):
     async def search(self, query: str, top_k: int = 5) -> list[dict]:
         """Simple keyword search across all stored values."""
         query_lower = query.lower()
-        results: list[dict] = []
-
-        def _search_recursive(data: Any, path: str) -> None:
-            if isinstance(data, dict):
-                for k, v in data.items():
-                    _search_recursive(v, f"{path}.{k}" if path else k)
-            elif isinstance(data, str) and query_lower in data.lower():
-                results.append({"key": path, "content": data})
-            elif isinstance(data, list):
-                for i, item in enumerate(data):
-                    _search_recursive(item, f"{path}[{i}]")
-
-        _search_recursive(self._data, "")
-        return results[:top_k]
+        # Stop scanning once top_k hits are found
+        hits = (
+            {"key": path, "content": value}
+            for path, value, lowered in self._leaf_index()[1]
+            if query_lower in lowered
+        )
+        return list(islice(hits, max(top_k, 0)))
 
     async def list_keys(self, prefix: str = "") -> list[str]:
         """List all leaf keys, optionally filtered by prefix."""
-        keys: list[str] = []
-
-        def _collect(data: Any, path: str) -> None:
-            if isinstance(data, dict):
-                for k, v in data.items():
-                    _collect(v, f"{path}.{k}" if path else k)
-            else:
-                keys.append(path)
-
-        _collect(self._data, "")
-        if prefix:
-            keys = [k for k in keys if k.startswith(prefix)]
-        return keys
+        keys = self._leaf_index()[0]
+        if not prefix:
+            return list(keys)
+        # Binary-search the prefix range, then restore tree order
+        by_key = self._sorted_keys(keys)
+        positions = []
+        for i in range(bisect_left(by_key, (prefix,)), len(by_key)):
+            key, position = by_key[i]
+            if not key.startswith(prefix):
+                break
+            positions.append(position)
+        positions.sort()
+        return [keys[i] for i in positions]
+
+    def _sorted_keys(self, keys: list[str]) -> list[tuple[str, int]]:
+        """(key, position) pairs sorted by key, rebuilt when the index is."""
+        if self._key_order is None or self._key_order[0] is not keys:
+            self._key_order = (keys, sorted(zip(keys, range(len(keys)))))
+        return self._key_order[1]
+
+    def _leaf_index(self) -> tuple[list[str], list[tuple[str, str, str]]]:
+        """Flatten the tree once per change so lookups don't re-walk it.
+
+        Values changed in place must be written back with store() to be
+        picked up.
+        """
+        if self._index is None:
+            keys: list[str] = []
+            strings: list[tuple[str, str, str]] = []
+            _index_tree(self._data, "", keys, strings, in_list=False)
+            self._index = (keys, strings)
+        return self._index
 
     async def delete(self, key: str) -> None:
-        parts = key.split(".")
+        parts = _split(key)
         current = self._data
         for part in parts[:-1]:
             if not isinstance(current, dict) or part not in current:
@@ -81,9 +109,11 @@ class StructuredMemory(MemoryStore):
             current = current[part]
         if isinstance(current, dict):
             current.pop(parts[-1], None)
+        self._index = None
 
     async def clear(self) -> None:
         self._data.clear()
+        self._index = None
 
     async def get_section(self, section: str) -> dict:
         """Get an entire section of structured data."""
@@ -95,23 +125,53 @@ class StructuredMemory(MemoryStore):
     async def load_from_dict(self, data: dict[str, Any]) -> None:
         """Load data from a dictionary (e.g., parsed YAML)."""
         self._data = data
+        self._index = None
 
     async def save_to_disk(self) -> None:
-        """Persist to JSON file."""
+        """Persist to JSON file.
+
+        Data is serialized on the event loop (so it can't change mid-dump)
+        and written from a worker thread.
+        """
         if self._storage_path:
-            self._storage_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._storage_path, "w") as f:
-                json.dump(self._data, f, indent=2, ensure_ascii=False)
+            payload = dumps_pretty(self._data).encode("utf-8")
+            await asyncio.to_thread(_write_bytes, self._storage_path, payload)
 
     async def load_from_disk(self) -> None:
         """Load from JSON file."""
         if self._storage_path and self._storage_path.exists():
-            with open(self._storage_path) as f:
-                self._data = json.load(f)
+            self._data = loads(await asyncio.to_thread(self._storage_path.read_bytes))
+            self._index = None
 
     def to_text(self, max_length: int = 0) -> str:
         """Serialize entire memory to a readable text representation."""
-        text = json.dumps(self._data, indent=2, ensure_ascii=False)
+        text = dumps_pretty(self._data)
         if max_length and len(text) > max_length:
             text = text[:max_length] + "\n... (truncated)"
         return text
+
+
+def _index_tree(
+    data: Any,
+    path: str,
+    keys: list[str],
+    strings: list[tuple[str, str, str]],
+    in_list: bool,
+) -> None:
+    """Collect leaf keys (dicts only) and searchable strings (dicts and lists)."""
+    if isinstance(data, dict):
+        for k, v in data.items():
+            _index_tree(v, f"{path}.{k}" if path else k, keys, strings, in_list)
+        return
+    if not in_list:
+        keys.append(path)
+    if isinstance(data, str):
+        strings.append((path, data, data.lower()))
+    elif isinstance(data, list):
+        for i, item in enumerate(data):
+            _index_tree(item, f"{path}[{i}]", keys, strings, in_list=True)
+
+
+def _write_bytes(path: Path, payload: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
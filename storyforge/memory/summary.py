@@ -2,9 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from storyforge.llm.base import LLMBackend
 
 
+def _chapter_summary_messages(chapter_text: str) -> list[dict[str, str]]:
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are a precise summarizer. Create a concise summary "
+                "that captures: key plot events, character actions and "
+                "emotional changes, world details revealed, and any "
+                "unresolved threads. Use bullet points."
+            ),
+        },
+        {
+            "role": "user",
+            "content": f"Summarize this chapter:\n\n{chapter_text}",
+        },
+    ]
+
+
 class MemorySummarizer:
     """Compresses long context into summaries to fit context windows."""
 
@@ -16,33 +36,49 @@ class MemorySummarizer:
     ) -> str:
         """Create a concise chapter summary for memory."""
         response = await self._llm.generate(
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a precise summarizer. Create a concise summary "
-                        "that captures: key plot events, character actions and "
-                        "emotional changes, world details revealed, and any "
-                        "unresolved threads. Use bullet points."
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": f"Summarize this chapter:\n\n{chapter_text}",
-                },
-            ],
+            messages=_chapter_summary_messages(chapter_text),
             max_tokens=max_tokens,
             temperature=0.3,
         )
         return response.content
 
+    async def summarize_chapters_batch(
+        self,
+        chapter_texts: list[str],
+        max_tokens: int = 500,
+        use_batch: bool = False,
+    ) -> list[str]:
+        """Summarize many chapters at once, e.g. to rebuild a novel's memory.
+
+        With ``use_batch`` and a backend that supports it (OpenAI), requests
+        go through the provider's batch API: half the cost, but results may
+        take hours. Otherwise chapters are summarized concurrently.
+        """
+        if use_batch and hasattr(self._llm, "generate_batch"):
+            responses = await self._llm.generate_batch(
+                [
+                    {
+                        "messages": _chapter_summary_messages(text),
+                        "max_tokens": max_tokens,
+                        "temperature": 0.3,
+                    }
+                    for text in chapter_texts
+                ]
+            )
+            return [response.content for response in responses]
+        return list(
+            await asyncio.gather(
+                *(self.summarize_chapter(text, max_tokens) for text in chapter_texts)
+            )
+        )
+
     async def summarize_conversation(
         self, messages: list[dict[str, str]], max_tokens: int = 300
     ) -> str:
         """Summarize a conversation history to compress context."""
-        conversation = "\n".join(
-            f"{m['role']}: {m['content']}" for m in messages
-        )
+        # The transcript goes into the user turn as-is (not re-wrapped in
+        # another string), so this join is the only copy of the messages
+        conversation = "\n".join([f"{m['role']}: {m['content']}" for m in messages])
         response = await self._llm.generate(
             messages=[
                 {
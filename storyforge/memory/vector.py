@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Optional
 
@@ -17,9 +18,19 @@ class VectorMemory(MemoryStore):
         self,
         collection_name: str,
         persist_directory: str,
+        batch_size: int = 64,
     ) -> None:
         import chromadb
 
+        # Writes are buffered and upserted together: one embedding pass and
+        # one SQLite transaction per batch. Reads flush first.
+        self._batch_size = batch_size
+        self._pending: dict[str, tuple[str, dict]] = {}
+        # Held while a batch is being written so readers wait for it, and
+        # by delete/clear so an in-flight upsert can't re-add what they
+        # removed; made on first use so it binds to the running loop on 3.9
+        self._flush_lock: Optional[asyncio.Lock] = None
+
         self._client = chromadb.PersistentClient(path=persist_directory)
         self._collection = self._client.get_or_create_collection(
             name=collection_name,
@@ -28,15 +39,35 @@ class VectorMemory(MemoryStore):
     async def store(
         self, key: str, value: Any, metadata: Optional[dict] = None
     ) -> None:
-        self._collection.upsert(
-            documents=[str(value)],
-            ids=[key],
-            metadatas=[metadata or {}],
+        self._pending[key] = (str(value), metadata or {})
+        if len(self._pending) >= self._batch_size:
+            await self.flush()
+
+    def _lock(self) -> asyncio.Lock:
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        return self._flush_lock
+
+    async def flush(self) -> None:
+        """Upsert all buffered writes in one call."""
+        async with self._lock():
+            await self._flush_locked()
+
+    async def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        await asyncio.to_thread(
+            self._collection.upsert,
+            ids=list(pending),
+            documents=[document for document, _ in pending.values()],
+            metadatas=[metadata for _, metadata in pending.values()],
         )
 
     async def retrieve(self, key: str) -> Optional[Any]:
+        await self.flush()
         try:
-            result = self._collection.get(ids=[key])
+            result = await asyncio.to_thread(self._collection.get, ids=[key])
             if result["documents"]:
                 return result["documents"][0]
         except Exception as e:
@@ -44,6 +75,11 @@ class VectorMemory(MemoryStore):
         return None
 
     async def search(self, query: str, top_k: int = 5) -> list[dict]:
+        await self.flush()
+        # Embedding the query and the SQLite/HNSW lookups all block
+        return await asyncio.to_thread(self._search_sync, query, top_k)
+
+    def _search_sync(self, query: str, top_k: int) -> list[dict]:
         results = self._collection.query(
             query_texts=[query],
             n_results=top_k,
@@ -67,23 +103,30 @@ class VectorMemory(MemoryStore):
         ]
 
     async def list_keys(self, prefix: str = "") -> list[str]:
-        all_items = self._collection.get()
+        await self.flush()
+        all_items = await asyncio.to_thread(self._collection.get)
         keys = all_items["ids"]
         if prefix:
             keys = [k for k in keys if k.startswith(prefix)]
         return keys
 
     async def delete(self, key: str) -> None:
-        try:
-            self._collection.delete(ids=[key])
-        except Exception as e:
-            logger.warning("VectorMemory delete failed for key=%s: %s", key, e)
+        async with self._lock():
+            self._pending.pop(key, None)
+            try:
+                await asyncio.to_thread(self._collection.delete, ids=[key])
+            except Exception as e:
+                logger.warning("VectorMemory delete failed for key=%s: %s", key, e)
 
     async def clear(self) -> None:
-        # ChromaDB doesn't have a clear method; delete and recreate
-        name = self._collection.name
-        self._client.delete_collection(name)
-        self._collection = self._client.get_or_create_collection(name=name)
+        async with self._lock():
+            self._pending.clear()
+            # ChromaDB doesn't have a clear method; delete and recreate
+            name = self._collection.name
+            await asyncio.to_thread(self._client.delete_collection, name)
+            self._collection = await asyncio.to_thread(
+                self._client.get_or_create_collection, name=name
+            )
 
     async def store_batch(
         self,
@@ -92,8 +135,12 @@ class VectorMemory(MemoryStore):
         metadatas: Optional[list[dict]] = None,
     ) -> None:
         """Batch store multiple memories."""
-        self._collection.upsert(
-            documents=values,
-            ids=keys,
-            metadatas=metadatas or [{} for _ in keys],
-        )
+        async with self._lock():
+            # Earlier buffered writes to the same keys must not land afterwards
+            await self._flush_locked()
+            await asyncio.to_thread(
+                self._collection.upsert,
+                documents=values,
+                ids=keys,
+                metadatas=metadatas or [{} for _ in keys],
+            )
@@ -2,9 +2,23 @@
 
 from __future__ import annotations
 
+import re
+import shutil
 from abc import ABC, abstractmethod
+from html import escape
 from pathlib import Path
 
+from storyforge.output.manifest import chapter_files
+
+# Chapters are copied into exports in chunks of this many characters
+COPY_CHUNK_SIZE = 1 << 20
+
+# One line per match: surrounding whitespace (but not the newline) is
+# dropped, and an optional "## "/"# " heading marker is split off
+_LINE_RE = re.compile(
+    r"^[^\S\n]*(?P<marker>## |# )?(?P<text>.*?)[^\S\n]*$", re.MULTILINE
+)
+
 
 class ExportFormatter(ABC):
     """Abstract base for export format handlers."""
@@ -27,18 +41,19 @@ class MarkdownFormatter(ExportFormatter):
     ) -> Path:
         title = metadata.get("title", "Novel")
         author = metadata.get("author", "")
-        parts = [f"# {title}\n"]
-        if author:
-            parts.append(f"*by {author}*\n")
-        parts.append("\n---\n\n")
 
-        chapter_files = sorted(chapters_dir.glob("chapter_*.md"))
-        for chapter_file in chapter_files:
-            if "_meta" not in chapter_file.name:
-                parts.append(chapter_file.read_text(encoding="utf-8"))
-                parts.append("\n\n")
+        # Stream chapters into the output instead of joining the whole novel
+        with open(output_path, "w", encoding="utf-8") as out:
+            out.write(f"# {title}\n")
+            if author:
+                out.write(f"*by {author}*\n")
+            out.write("\n---\n\n")
+
+            for chapter_file in chapter_files(chapters_dir):
+                with open(chapter_file, encoding="utf-8") as f:
+                    shutil.copyfileobj(f, out, COPY_CHUNK_SIZE)
+                out.write("\n\n")
 
-        output_path.write_text("".join(parts), encoding="utf-8")
         return output_path
 
 
@@ -48,8 +63,8 @@ class HtmlFormatter(ExportFormatter):
     async def export(
         self, chapters_dir: Path, metadata: dict, output_path: Path
     ) -> Path:
-        title = metadata.get("title", "Novel")
-        author = metadata.get("author", "")
+        title = escape(metadata.get("title", "Novel"), quote=False)
+        author = escape(metadata.get("author", ""), quote=False)
 
         html_parts = [
             "<!DOCTYPE html>",
@@ -73,28 +88,31 @@ class HtmlFormatter(ExportFormatter):
             html_parts.append(f'<p class="author">by {author}</p>')
         html_parts.append("<hr>")
 
-        chapter_files = sorted(chapters_dir.glob("chapter_*.md"))
-        for chapter_file in chapter_files:
-            if "_meta" not in chapter_file.name:
+        # Convert and write one chapter at a time
+        with open(output_path, "w", encoding="utf-8") as out:
+            out.write("\n".join(html_parts))
+            for chapter_file in chapter_files(chapters_dir):
                 content = chapter_file.read_text(encoding="utf-8")
-                html_parts.append(self._md_to_html(content))
-                html_parts.append("<hr>")
-
-        html_parts.extend(["</body>", "</html>"])
-        output_path.write_text("\n".join(html_parts), encoding="utf-8")
+                out.write(f"\n{self._md_to_html(content)}\n<hr>")
+            out.write("\n</body>\n</html>")
         return output_path
 
     @staticmethod
     def _md_to_html(md_text: str) -> str:
         """Simple markdown-to-HTML conversion."""
-        lines = md_text.split("\n")
         html_lines = []
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("## "):
-                html_lines.append(f"<h2>{stripped[3:]}</h2>")
-            elif stripped.startswith("# "):
-                html_lines.append(f"<h1>{stripped[2:]}</h1>")
-            elif stripped:
-                html_lines.append(f"<p>{stripped}</p>")
+        for match in _LINE_RE.finditer(md_text):
+            marker, text = match.group("marker", "text")
+            if not text:
+                if marker:
+                    # A bare "#"/"##" line is text, not an empty heading
+                    html_lines.append(f"<p>{marker.rstrip()}</p>")
+                continue
+            text = escape(text, quote=False)
+            if marker == "## ":
+                html_lines.append(f"<h2>{text}</h2>")
+            elif marker == "# ":
+                html_lines.append(f"<h1>{text}</h1>")
+            else:
+                html_lines.append(f"<p>{text}</p>")
         return "\n".join(html_lines)
@@ -2,12 +2,39 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import os
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
 from storyforge.agents.plot import ChapterOutline
+from storyforge.output.formats import COPY_CHUNK_SIZE
+from storyforge.output.manifest import read_manifest, scan_chapter_dir, write_manifest
+from storyforge.utils.serialization import dumps_pretty
+from storyforge.utils.text import count_words
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    """Write data to path via a temp file, so path always gets a new inode.
+
+    Version snapshots hard-link the chapter file; writing in place would
+    change every snapshot that shares its inode.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _snapshot(source: Path, target: Path, data: bytes) -> None:
+    """Hard-link source to target, copying data where links aren't supported."""
+    try:
+        target.unlink(missing_ok=True)
+        os.link(source, target)
+    except OSError:
+        target.write_bytes(data)
 
 
 class OutputManager:
@@ -26,6 +53,8 @@ class OutputManager:
         self._versions_dir = output_dir / "versions"
         self._intermediates_dir = output_dir / "intermediates"
         self._exports_dir = output_dir / "exports"
+        # Chapter number -> manifest entry, loaded on first use
+        self._manifest: Optional[dict[int, dict[str, Any]]] = None
 
     async def initialize(self) -> None:
         """Create output directory structure."""
@@ -53,9 +82,21 @@ class OutputManager:
             chapter_number, text, outline
         )
 
-        # Save current version
+        # Regenerating identical text (dry runs, retries) rewrites nothing and
+        # adds no duplicate version snapshot
         chapter_path = self._chapters_dir / f"chapter_{chapter_number:03d}.md"
-        chapter_path.write_text(chapter_content, encoding="utf-8")
+        payload = chapter_content.encode("utf-8")
+        content_hash = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        previous = self._manifest_entries().get(chapter_number)
+        if (
+            previous is not None
+            and previous.get("content_hash") == content_hash
+            and chapter_path.exists()
+        ):
+            return chapter_path
+
+        # Save current version
+        _replace_file(chapter_path, payload)
 
         # Version snapshot
         if self._versioning:
@@ -65,13 +106,13 @@ class OutputManager:
             )
             version_dir.mkdir(parents=True, exist_ok=True)
             version_path = version_dir / f"v_{version_id}.md"
-            version_path.write_text(chapter_content, encoding="utf-8")
+            _snapshot(chapter_path, version_path, payload)
 
         # Save metadata
         meta = {
             "chapter_number": chapter_number,
             "title": outline.title if outline else f"Chapter {chapter_number}",
-            "word_count": len(text.split()),
+            "word_count": count_words(text),
             "char_count": len(text),
             "generated_at": datetime.now(timezone.utc).isoformat(),
         }
@@ -85,10 +126,21 @@ class OutputManager:
         meta_path = (
             self._chapters_dir / f"chapter_{chapter_number:03d}_meta.json"
         )
-        meta_path.write_text(
-            json.dumps(meta, indent=2, ensure_ascii=False), encoding="utf-8"
+        await asyncio.to_thread(
+            meta_path.write_bytes, dumps_pretty(meta).encode("utf-8")
         )
 
+        # Written on the loop, not a thread, so concurrent saves can't race
+        entries = self._manifest_entries()
+        entries[chapter_number] = {
+            "chapter": chapter_number,
+            "file": chapter_path.name,
+            "word_count": meta.get("word_count", 0),
+            "char_count": meta.get("char_count", 0),
+            "content_hash": content_hash,
+        }
+        write_manifest(self._chapters_dir, entries)
+
         return chapter_path
 
     async def save_intermediate(
@@ -108,50 +160,48 @@ class OutputManager:
             path.write_text(content, encoding="utf-8")
         else:
             path = inter_dir / f"{stage}.json"
-            path.write_text(
-                json.dumps(content, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            path.write_text(dumps_pretty(content), encoding="utf-8")
 
     async def export_markdown(self, title: str = "Novel") -> Path:
         """Export all chapters as a single Markdown file."""
         self._exports_dir.mkdir(parents=True, exist_ok=True)
         output_path = self._exports_dir / f"{self._slugify(title)}.md"
 
-        parts = [f"# {title}\n\n"]
+        with open(output_path, "w", encoding="utf-8") as out:
+            out.write(f"# {title}\n\n")
 
-        # Collect and sort chapter files
-        chapter_files = sorted(self._chapters_dir.glob("chapter_*.md"))
-        for chapter_file in chapter_files:
-            if "_meta" not in chapter_file.name:
-                parts.append(chapter_file.read_text(encoding="utf-8"))
-                parts.append("\n\n---\n\n")
+            entries = self._manifest_entries()
+            for number in sorted(entries):
+                chapter_file = self._chapters_dir / entries[number]["file"]
+                with open(chapter_file, encoding="utf-8") as f:
+                    shutil.copyfileobj(f, out, COPY_CHUNK_SIZE)
+                out.write("\n\n---\n\n")
 
-        output_path.write_text("".join(parts), encoding="utf-8")
         return output_path
 
+    def scan_chapters(self) -> tuple[int, int]:
+        """Return ``(chapter_count, total_word_count)`` from the manifest.
+
+        Directories saved before the manifest existed are indexed from their
+        metadata files instead; chapter text is never re-read.
+        """
+        entries = self._manifest_entries()
+        return len(entries), sum(e.get("word_count", 0) for e in entries.values())
+
+    def _manifest_entries(self) -> dict[int, dict[str, Any]]:
+        if self._manifest is None:
+            self._manifest = read_manifest(self._chapters_dir)
+            if self._manifest is None:
+                self._manifest = scan_chapter_dir(self._chapters_dir)
+        return self._manifest
+
     def get_chapter_count(self) -> int:
         """Count generated chapters."""
-        if not self._chapters_dir.exists():
-            return 0
-        return len(
-            [
-                f
-                for f in self._chapters_dir.glob("chapter_*.md")
-                if "_meta" not in f.name
-            ]
-        )
+        return self.scan_chapters()[0]
 
     def get_total_word_count(self) -> int:
         """Get total word count across all chapters."""
-        total = 0
-        for meta_file in self._chapters_dir.glob("chapter_*_meta.json"):
-            try:
-                meta = json.loads(meta_file.read_text(encoding="utf-8"))
-                total += meta.get("word_count", 0)
-            except (json.JSONDecodeError, OSError):
-                pass
-        return total
+        return self.scan_chapters()[1]
 
     def _format_chapter_markdown(
         self,
@@ -0,0 +1,78 @@
+"""Chapter manifest — a sorted index of saved chapters and their stats."""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Optional
+
+from storyforge.utils.serialization import dumps_pretty, loads
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+_CHAPTER_FILE_RE = re.compile(r"chapter_(\d+)\.md")
+
+
+def read_manifest(chapters_dir: Path) -> Optional[dict[int, dict[str, Any]]]:
+    """Load manifest entries keyed by chapter number, or None if there is none."""
+    path = chapters_dir / MANIFEST_NAME
+    try:
+        data = loads(path.read_bytes())
+        return {entry["chapter"]: entry for entry in data["chapters"]}
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError, TypeError, OSError):
+        logger.warning("Ignoring unreadable chapter manifest %s", path)
+        return None
+
+
+def write_manifest(chapters_dir: Path, entries: dict[int, dict[str, Any]]) -> None:
+    """Atomically replace the manifest with entries sorted by chapter number."""
+    path = chapters_dir / MANIFEST_NAME
+    tmp_path = path.with_name(f".{MANIFEST_NAME}.tmp")
+    payload = {"chapters": [entries[n] for n in sorted(entries)]}
+    tmp_path.write_bytes(dumps_pretty(payload).encode("utf-8"))
+    os.replace(tmp_path, path)
+
+
+def scan_chapter_dir(chapters_dir: Path) -> dict[int, dict[str, Any]]:
+    """Rebuild manifest entries from the chapter and metadata files on disk.
+
+    Used for output directories written before the manifest existed.
+    """
+    entries: dict[int, dict[str, Any]] = {}
+    try:
+        names = os.listdir(chapters_dir)
+    except FileNotFoundError:
+        return entries
+    for name in names:
+        match = _CHAPTER_FILE_RE.fullmatch(name)
+        if match is None:
+            continue
+        number = int(match.group(1))
+        entry: dict[str, Any] = {
+            "chapter": number,
+            "file": name,
+            "word_count": 0,
+            "char_count": 0,
+        }
+        try:
+            meta = loads((chapters_dir / f"{name[:-3]}_meta.json").read_bytes())
+            entry["word_count"] = meta.get("word_count", 0)
+            entry["char_count"] = meta.get("char_count", 0)
+        except (ValueError, OSError, AttributeError):
+            pass
+        entries[number] = entry
+    return entries
+
+
+def chapter_files(chapters_dir: Path) -> list[Path]:
+    """Chapter files in reading order, from the manifest when there is one."""
+    entries = read_manifest(chapters_dir)
+    if entries is None:
+        entries = scan_chapter_dir(chapters_dir)
+    return [chapters_dir / entries[n]["file"] for n in sorted(entries)]
@@ -9,16 +9,27 @@ from typing import Any, Optional
 
 from storyforge.agents.character import CharacterAgent
 from storyforge.agents.character.skills import SkillMatcher
-from storyforge.agents.plot import ChapterOutline, PlotAgent, ScenePlan
+from storyforge.agents.plot import (
+    MAX_RECENT_SUMMARIES,
+    ChapterOutline,
+    PlotAgent,
+    ScenePlan,
+)
 from storyforge.agents.world import WorldAgent
 from storyforge.agents.writing import WritingAgent
 from storyforge.events.bus import EventBus
 from storyforge.events.types import Event, EventType
+from storyforge.llm.cache import ResponseCache
+from storyforge.memory.base import MemoryStore
 from storyforge.memory.summary import MemorySummarizer
 from storyforge.output.manager import OutputManager
 
 logger = logging.getLogger(__name__)
 
+# Requests whose answers depend on agent state the payload doesn't carry:
+# a plan follows the plot agent's outline, chapter summaries and synopsis
+_UNCACHED_REQUESTS = frozenset({EventType.CHAPTER_PLAN_REQUEST})
+
 
 class ChapterPipeline:
     """Orchestrates the generation of a single chapter through all stages."""
@@ -34,6 +45,7 @@ class ChapterPipeline:
         summarizer: Optional[MemorySummarizer] = None,
         max_revision_rounds: int = 3,
         parallel_characters: bool = True,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         self._bus = event_bus
         self._world = world_agent
@@ -44,6 +56,66 @@ class ChapterPipeline:
         self._summarizer = summarizer
         self._max_revisions = max_revision_rounds
         self._parallel = parallel_characters
+        # Agent responses reused for identical requests (development reruns)
+        self._cache = response_cache
+
+    async def _request(self, event: Event, timeout: float) -> Event:
+        """Request a response from an agent, answering from the cache if set.
+
+        Cache hits skip the agent entirely, including any memory updates it
+        would have made while handling the request.
+        """
+        if self._cache is None or event.event_type in _UNCACHED_REQUESTS:
+            return await self._bus.request(event, timeout=timeout)
+        key = ResponseCache.make_key(
+            event.event_type.value,
+            event.target_agent,
+            self._agent_fingerprint(event.target_agent),
+            event.payload,
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            return Event(
+                event_type=EventType(cached["event_type"]),
+                payload=cached["payload"],
+                source_agent=event.target_agent or "cache",
+                target_agent=event.source_agent,
+                correlation_id=event.event_id,
+                chapter_number=event.chapter_number,
+                scene_index=event.scene_index,
+            )
+        response = await self._bus.request(event, timeout=timeout)
+        try:
+            self._cache.put(
+                key,
+                {"event_type": response.event_type.value, "payload": response.payload},
+            )
+        except (TypeError, ValueError):
+            logger.warning(
+                "Not caching %s response: payload is not JSON-serializable",
+                event.event_type.value,
+            )
+        return response
+
+    def _agent_fingerprint(self, target: Optional[str]) -> list[Any]:
+        """Describe the agent settings that shape its answer to a request.
+
+        Keeps a cached response from being reused after the target's model,
+        system prompt or temperature changes.
+        """
+        agent = self._characters.get(target) if target else None
+        if agent is None:
+            for candidate in (self._world, self._plot, self._writer):
+                if getattr(getattr(candidate, "config", None), "name", None) == target:
+                    agent = candidate
+                    break
+        llm_config = getattr(getattr(agent, "llm", None), "config", None)
+        return [
+            getattr(llm_config, "provider", None),
+            getattr(llm_config, "model", None),
+            getattr(agent, "_system_prompt", None),
+            getattr(getattr(agent, "config", None), "temperature", None),
+        ]
 
     def _resolve_character_name(self, name_from_plot: str) -> Optional[str]:
         """Fuzzy-match a character name from the plot agent to a registered name.
@@ -110,12 +182,7 @@ class ChapterPipeline:
             )
             for scene_idx, scene_plan in enumerate(chapter_outline.scenes)
         ]
-        scenes = await asyncio.gather(*scene_tasks)
-        scenes = list(scenes)
-        for scene_idx, scene_text in enumerate(scenes):
-            await self._save_intermediate(
-                chapter_number, f"scene_{scene_idx}_draft", scene_text
-            )
+        scenes = list(await asyncio.gather(*scene_tasks))
 
         # Stage 6: Assemble chapter (direct concatenation — skip LLM rewrite)
         logger.info("[Stage 6] Assembling chapter...")
@@ -143,13 +210,15 @@ class ChapterPipeline:
             event_type=EventType.CHAPTER_PLAN_REQUEST,
             payload={
                 "chapter_number": chapter_number,
-                "available_characters": list(self._characters.keys()),
+                # Sorted so the planning prompt (and its cache key) doesn't
+                # depend on the order characters were registered in
+                "available_characters": sorted(self._characters),
             },
             source_agent="pipeline",
             target_agent=self._plot.config.name,
             chapter_number=chapter_number,
         )
-        response = await self._bus.request(event, timeout=120.0)
+        response = await self._request(event, timeout=120.0)
         return ChapterOutline.from_dict(response.payload["outline"])
 
     async def _generate_scene(
@@ -180,6 +249,11 @@ class ChapterPipeline:
             character_reactions,
             [],  # No separate dialogue — WritingAgent generates it inline
         )
+        # Saved as soon as it's written, while other scenes are still in
+        # flight, so a later failure doesn't lose finished drafts
+        await self._save_intermediate(
+            chapter_number, f"scene_{scene_idx}_draft", scene_text
+        )
         return scene_text
 
     async def _stage_validate_world(
@@ -197,7 +271,7 @@ class ChapterPipeline:
             chapter_number=chapter_number,
             scene_index=scene_idx,
         )
-        response = await self._bus.request(event, timeout=90.0)
+        response = await self._request(event, timeout=90.0)
         return response.payload.get("enriched_setting", {})
 
     async def _stage_character_reactions(
@@ -208,8 +282,11 @@ class ChapterPipeline:
         setting: dict[str, Any],
     ) -> list[dict[str, Any]]:
         """All characters in the scene react (optionally in parallel)."""
+        # One serialized plan shared by every character's request; agents
+        # only read it
+        scene_dict = scene_plan.to_dict()
         # Detect scene types for skill activation
-        scene_types = SkillMatcher.detect_scene_type(scene_plan.to_dict())
+        scene_types = SkillMatcher.detect_scene_type(scene_dict)
         scene_type_values = [st.value for st in scene_types]
 
         tasks = []
@@ -219,7 +296,7 @@ class ChapterPipeline:
             event = Event(
                 event_type=EventType.CHARACTER_REACTION_REQUEST,
                 payload={
-                    "scene_plan": scene_plan.to_dict(),
+                    "scene_plan": scene_dict,
                     "setting": setting,
                     "scene_types": scene_type_values,
                 },
@@ -228,7 +305,7 @@ class ChapterPipeline:
                 chapter_number=chapter_number,
                 scene_index=scene_idx,
             )
-            tasks.append(self._bus.request(event, timeout=60.0))
+            tasks.append(self._request(event, timeout=60.0))
 
         if not tasks:
             return []
@@ -261,6 +338,7 @@ class ChapterPipeline:
     ) -> list[dict[str, Any]]:
         """Generate dialogue exchanges between characters."""
         dialogue_lines: list[dict[str, Any]] = []
+        scene_context = scene_plan.to_dict()
 
         for beat in scene_plan.beats:
             # Only generate dialogue for dialogue-related beats
@@ -279,7 +357,7 @@ class ChapterPipeline:
                     payload={
                         "beat": beat,
                         "previous_dialogue": dialogue_lines[-6:],
-                        "scene_context": scene_plan.to_dict(),
+                        "scene_context": scene_context,
                     },
                     source_agent="pipeline",
                     target_agent=char_name,
@@ -287,7 +365,7 @@ class ChapterPipeline:
                     scene_index=scene_idx,
                 )
                 try:
-                    response = await self._bus.request(event, timeout=30.0)
+                    response = await self._request(event, timeout=30.0)
                     dialogue_lines.append(
                         response.payload.get("dialogue", {})
                     )
@@ -322,7 +400,7 @@ class ChapterPipeline:
             chapter_number=chapter_number,
             scene_index=scene_idx,
         )
-        response = await self._bus.request(event, timeout=180.0)
+        response = await self._request(event, timeout=180.0)
         return response.payload.get("scene_text", "")
 
     async def _stage_review_and_revise(
@@ -365,8 +443,8 @@ class ChapterPipeline:
 
             # Run both checks in parallel
             consistency_resp, quality_resp = await asyncio.gather(
-                self._bus.request(consistency_event, timeout=90.0),
-                self._bus.request(quality_event, timeout=90.0),
+                self._request(consistency_event, timeout=90.0),
+                self._request(quality_event, timeout=90.0),
             )
 
             consistency_issues = consistency_resp.payload.get("issues", [])
@@ -402,7 +480,7 @@ class ChapterPipeline:
                 source_agent="pipeline",
                 target_agent=self._writer.config.name,
             )
-            revision_resp = await self._bus.request(
+            revision_resp = await self._request(
                 revision_event, timeout=180.0
             )
             current_draft = revision_resp.payload.get(
@@ -429,8 +507,10 @@ class ChapterPipeline:
         if isinstance(summaries, list):
             summaries.append(summary)
             await self._plot.memory.store("chapter_summaries", summaries)
+            await self._update_rolling_synopsis(summaries)
 
         # Store memories for each character that appeared
+        touched: dict[str, MemoryStore] = {}
         for scene in outline.scenes:
             for char_name in scene.characters_present:
                 if char_name in self._characters:
@@ -442,6 +522,25 @@ class ChapterPipeline:
                         f"Outcome: {scene.expected_outcome}",
                         metadata={"chapter": chapter_number},
                     )
+                    touched[char_name] = char_agent.memory
+        # Vector memories buffer writes; persist this chapter's in one go
+        for memory in touched.values():
+            await memory.flush()
+
+    async def _update_rolling_synopsis(self, summaries: list[str]) -> None:
+        """Fold the summary that just left the planning window into the synopsis."""
+        if self._summarizer is None or len(summaries) <= MAX_RECENT_SUMMARIES:
+            return
+        evicted = summaries[-MAX_RECENT_SUMMARIES - 1]
+        previous = await self._plot.memory.retrieve("rolling_synopsis") or ""
+        try:
+            synopsis = await self._summarizer.create_running_summary(
+                previous, evicted
+            )
+        except Exception as e:
+            logger.warning("Failed to update rolling synopsis: %s", e)
+            return
+        await self._plot.memory.store("rolling_synopsis", synopsis)
 
     async def _save_intermediate(
         self, chapter_number: int, stage: str, content: Any
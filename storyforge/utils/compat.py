@@ -0,0 +1,10 @@
+"""Compatibility helpers for the range of supported Python versions."""
+
+from __future__ import annotations
+
+import sys
+
+# Keyword arguments for @dataclass that add __slots__ where supported (3.10+).
+DATACLASS_SLOTS: dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
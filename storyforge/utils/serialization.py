@@ -0,0 +1,41 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize with two-space indentation, keeping non-ASCII text as-is."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; the stdlib handles those
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize compactly to UTF-8 bytes terminated by a newline (JSONL)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    line = json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n"
+    return line.encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,8 @@
+"""Text measurement utilities."""
+
+from __future__ import annotations
+
+
+def count_words(text: str) -> int:
+    """Count whitespace-separated words, as ``str.split()`` does."""
+    return len(text.split())
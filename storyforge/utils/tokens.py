@@ -2,18 +2,62 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any, Optional
+
 
 def count_tokens_approximate(text: str) -> int:
     """Approximate token count using chars/4 heuristic."""
     return len(text) // 4
 
 
-def count_tokens_tiktoken(text: str, model: str = "gpt-4") -> int:
-    """Count tokens using tiktoken."""
+@lru_cache(maxsize=4)
+def get_encoding(name: str) -> Optional[Any]:
+    """Return a cached tiktoken encoding, or None if tiktoken is unavailable.
+
+    Loading an encoding builds its BPE tables, so each one is created once
+    per process; a missing tiktoken is likewise only discovered once.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding(name)
+
+
+@lru_cache(maxsize=8)
+def encoding_for_model(model: str) -> Optional[Any]:
+    """Return the cached tiktoken encoding for a model, or None without tiktoken.
+
+    Models tiktoken doesn't know fall back to ``cl100k_base``.
+    """
     try:
         import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return get_encoding("cl100k_base")
 
-        enc = tiktoken.encoding_for_model(model)
-        return len(enc.encode(text))
-    except (ImportError, KeyError):
+
+def count_tokens_tiktoken(text: str, model: str = "gpt-4") -> int:
+    """Count tokens using tiktoken.
+
+    Special-token markers such as ``<|endoftext|>`` in the text are counted
+    as ordinary text instead of raising.
+    """
+    enc = encoding_for_model(model)
+    if enc is None:
         return count_tokens_approximate(text)
+    return len(enc.encode(text, disallowed_special=()))
+
+
+def count_tokens_tiktoken_batch(texts: list[str], model: str = "gpt-4") -> list[int]:
+    """Count tokens for many texts in one call to tiktoken's parallel encoder."""
+    enc = encoding_for_model(model)
+    if enc is None:
+        return [count_tokens_approximate(text) for text in texts]
+    return [
+        len(tokens) for tokens in enc.encode_batch(texts, disallowed_special=())
+    ]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Type
+from typing import Any, Type
 
 from storyforge.visual.base import VisualBackend, VisualConfig
 
@@ -54,3 +54,18 @@ class VisualFactory:
             default_style=config_dict.get("default_style", "natural"),
         )
         return cls.create(visual_config)
+
+    @classmethod
+    def create_from_config(cls, source: Any) -> VisualBackend:
+        """Create backend from a config object such as VisualBackendConfig."""
+        visual_config = VisualConfig(
+            provider=source.provider,
+            model=source.model,
+            api_key=getattr(source, "api_key", None),
+            base_url=getattr(source, "base_url", None),
+            requests_per_minute=getattr(source, "requests_per_minute", 10),
+            default_size=getattr(source, "default_size", "1024x1024"),
+            default_quality=getattr(source, "default_quality", "standard"),
+            default_style=getattr(source, "default_style", "natural"),
+        )
+        return cls.create(visual_config)
@@ -0,0 +1,29 @@
+"""Test doubles shared across test packages."""
+
+from storyforge.llm.base import LLMBackend, LLMConfig, LLMResponse
+
+
+class RecordingLLM(LLMBackend):
+    """Backend that records requests and replies with a fixed response."""
+
+    def __init__(self, reply: str = "", context_window: int = 8192) -> None:
+        super().__init__(
+            LLMConfig(provider="fake", model="fake", context_window=context_window)
+        )
+        self.reply = reply
+        self.prompts: list[str] = []
+        self.max_tokens: list = []
+
+    async def generate(self, messages, temperature=None, max_tokens=None, stop_sequences=None):
+        self.prompts.append(messages[-1]["content"])
+        self.max_tokens.append(max_tokens)
+        return LLMResponse(self.reply, "fake", 0, 0, "stop")
+
+    async def generate_stream(self, messages, temperature=None, max_tokens=None):
+        yield self.reply
+
+    async def count_tokens(self, text):
+        return len(text) // 4
+
+    async def health_check(self):
+        return True
@@ -0,0 +1,28 @@
+"""Tests for parsing JSON out of LLM responses."""
+
+import json
+
+import pytest
+
+from storyforge.agents.base import parse_json_response
+
+
+def test_plain_object():
+    assert parse_json_response('{"score": 7}') == {"score": 7}
+
+
+def test_fenced_object():
+    assert parse_json_response('```json\n{"issues": []}\n```') == {"issues": []}
+
+
+def test_array_with_surrounding_text():
+    assert parse_json_response('Here you go:\n["a", "b"]\nThanks') == ["a", "b"]
+
+
+def test_skips_bracketed_prose_before_object():
+    assert parse_json_response('[Note] {"valid": true}') == {"valid": True}
+
+
+def test_no_json_raises():
+    with pytest.raises(json.JSONDecodeError):
+        parse_json_response("no structured output here")
@@ -0,0 +1,73 @@
+"""Tests for PlotAgent chapter planning."""
+
+import pytest
+
+from storyforge.agents.base import AgentConfig
+from storyforge.agents.plot import MAX_RECENT_SUMMARIES, PlotAgent
+from storyforge.events.bus import EventBus
+from storyforge.events.types import Event, EventType
+from storyforge.memory.structured import StructuredMemory
+from tests.fakes import RecordingLLM
+
+
+def _make_agent(reply: str) -> tuple[PlotAgent, RecordingLLM, StructuredMemory]:
+    llm = RecordingLLM(reply)
+    memory = StructuredMemory()
+    agent = PlotAgent(
+        config=AgentConfig(name="plot", role="plot", llm_backend_id="fake"),
+        llm=llm,
+        memory=memory,
+        event_bus=EventBus(),
+    )
+    return agent, llm, memory
+
+
+@pytest.mark.asyncio
+async def test_plan_chapter_keeps_recent_summaries_only():
+    agent, llm, memory = _make_agent('{"number": 9, "title": "Nine", "scenes": []}')
+    await memory.store("chapter_summaries", [f"summary {n}" for n in range(1, 9)])
+    await memory.store("rolling_synopsis", "the early chapters")
+
+    outline = await agent.plan_chapter(9)
+
+    prompt = llm.prompts[0]
+    assert outline.title == "Nine"
+    assert "Story so far: the early chapters" in prompt
+    assert "Chapter 1: summary 1" not in prompt
+    first_kept = 9 - MAX_RECENT_SUMMARIES
+    assert f"Chapter {first_kept}: summary {first_kept}" in prompt
+    assert "Chapter 8: summary 8" in prompt
+
+
+@pytest.mark.asyncio
+async def test_plan_chapter_falls_back_on_non_object_response():
+    agent, _, _ = _make_agent('["not an outline"]')
+
+    outline = await agent.plan_chapter(2)
+
+    assert outline.number == 2
+    assert len(outline.scenes) == 1
+
+
+@pytest.mark.asyncio
+async def test_handle_event_dispatches_registered_handler():
+    agent, _, _ = _make_agent('{"number": 1, "title": "One", "scenes": []}')
+    event = Event(
+        event_type=EventType.CHAPTER_PLAN_REQUEST,
+        payload={"chapter_number": 1},
+        source_agent="pipeline",
+    )
+
+    response = await agent.handle_event(event)
+
+    assert response.event_type == EventType.CHAPTER_PLAN_READY
+    assert response.payload["outline"]["title"] == "One"
+
+
+@pytest.mark.asyncio
+async def test_handle_event_ignores_unhandled_types():
+    agent, llm, _ = _make_agent("{}")
+    event = Event(event_type=EventType.WORLD_QUERY, payload={}, source_agent="x")
+
+    assert await agent.handle_event(event) is None
+    assert llm.prompts == []
@@ -1,8 +1,10 @@
 """Tests for Plot agent data classes (ScenePlan, ChapterOutline)."""
 
+import sys
+
 import pytest
 
-from storyforge.agents.plot import ScenePlan, ChapterOutline
+from storyforge.agents.plot import ChapterOutline, PlotOutline, ScenePlan
 
 
 class TestScenePlan:
@@ -141,3 +143,29 @@ class TestChapterOutline:
         }
         outline = ChapterOutline.from_dict(data)
         assert outline.scenes == []
+
+    def test_from_json(self):
+        outline = ChapterOutline.from_json(
+            '{"number": 2, "title": "Crossing", "scenes": [{"location": "river",'
+            ' "characters_present": [], "scene_goal": "cross", "conflict": "current",'
+            ' "expected_outcome": "reach the far bank"}]}'
+        )
+        assert outline.number == 2
+        assert outline.scenes[0].location == "river"
+
+    def test_from_json_rejects_non_object(self):
+        with pytest.raises(ValueError):
+            ChapterOutline.from_json('["not", "an", "outline"]')
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+def test_plan_dataclasses_use_slots():
+    plan = ScenePlan(
+        location="inn",
+        characters_present=[],
+        scene_goal="rest",
+        conflict="none",
+        expected_outcome="rested",
+    )
+    assert not hasattr(plan, "__dict__")
+    assert not hasattr(PlotOutline(premise="p"), "__dict__")
@@ -0,0 +1,83 @@
+"""Tests for VisualAgent scene generation."""
+
+import asyncio
+import gc
+from types import SimpleNamespace
+
+import pytest
+
+from storyforge.agents.base import AgentConfig
+from storyforge.agents.visual_agent import VisualAgent
+from storyforge.events.bus import EventBus
+from storyforge.memory.structured import StructuredMemory
+from tests.fakes import RecordingLLM
+
+
+class _YieldingLLM(RecordingLLM):
+    """Lets other tasks run while the prompt is being "optimized"."""
+
+    async def generate(self, messages, temperature=None, max_tokens=None, stop_sequences=None):
+        await asyncio.sleep(0)
+        return await super().generate(messages, temperature, max_tokens, stop_sequences)
+
+
+def _make_agent(image_backend, reply="a completely different optimized prompt"):
+    return VisualAgent(
+        config=AgentConfig(name="visual", role="visual", llm_backend_id="fake"),
+        llm=_YieldingLLM(reply),
+        memory=StructuredMemory(),
+        event_bus=EventBus(),
+        image_backend=image_backend,
+        speculative_images=True,
+    )
+
+
+class TestSpeculativeImage:
+    @pytest.mark.asyncio
+    async def test_rejected_failed_speculation_is_not_reported(self, tmp_path):
+        unretrieved = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: unretrieved.append(context))
+
+        calls = []
+
+        async def generate(prompt, size=None):
+            calls.append(prompt)
+            if len(calls) > 1:
+                raise RuntimeError("backend down")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                # Backends may turn cancellation into their own error
+                raise RuntimeError("request aborted") from None
+
+        agent = _make_agent(SimpleNamespace(generate=generate))
+        results = await agent.generate_visuals(
+            {"image_prompt": "a lighthouse at dusk"},
+            str(tmp_path),
+            generate_video=False,
+        )
+        await asyncio.sleep(0)
+        gc.collect()
+
+        assert results["errors"] == ["image: backend down"]
+        assert unretrieved == []
+
+
+
+class TestJobResults:
+    @pytest.mark.asyncio
+    async def test_cancelled_job_is_recorded_as_error(self, tmp_path):
+        async def generate(prompt, size=None):
+            raise asyncio.CancelledError()
+
+        agent = _make_agent(SimpleNamespace(generate=generate))
+        agent._speculative_images = False
+
+        results = await agent.generate_visuals(
+            {"image_prompt": "a lighthouse at dusk"},
+            str(tmp_path),
+            generate_video=False,
+        )
+
+        assert results["errors"] == ["image: cancelled"]
@@ -0,0 +1,148 @@
+"""Tests for WritingAgent generation settings."""
+
+import asyncio
+
+import pytest
+
+from storyforge.agents.base import AgentConfig
+from storyforge.agents.writing import WritingAgent
+from storyforge.events.bus import EventBus
+from storyforge.llm.cache import ResponseCache
+from storyforge.memory.structured import StructuredMemory
+from tests.fakes import RecordingLLM
+
+
+def _make_agent(
+    llm: RecordingLLM, max_output: int = 4096, cache: ResponseCache = None
+) -> WritingAgent:
+    return WritingAgent(
+        config=AgentConfig(
+            name="writing",
+            role="writing",
+            llm_backend_id="fake",
+            max_context_tokens=max_output,
+        ),
+        llm=llm,
+        memory=StructuredMemory(),
+        event_bus=EventBus(),
+        response_cache=cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_short_prompt_keeps_configured_output_limit():
+    llm = RecordingLLM("revised", context_window=100_000)
+    agent = _make_agent(llm)
+
+    await agent.revise("A short draft.", ["tighten"])
+
+    assert llm.max_tokens == [4096]
+
+
+@pytest.mark.asyncio
+async def test_long_prompt_shrinks_output_to_fit_context():
+    llm = RecordingLLM("revised", context_window=8192)
+    agent = _make_agent(llm)
+    draft = "word " * 5_000  # 25k chars, ~6.2k tokens with the fake counter
+
+    await agent.revise(draft, ["tighten"])
+
+    (budget,) = llm.max_tokens
+    assert 512 <= budget < 4096
+    assert budget + len(llm.prompts[0]) // 4 <= 8192
+
+
+@pytest.mark.asyncio
+async def test_budget_never_drops_below_floor():
+    llm = RecordingLLM("revised", context_window=1024)
+    agent = _make_agent(llm)
+
+    await agent.revise("word " * 5_000, [])
+
+    assert llm.max_tokens == [512]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_bounded():
+    class SlowLLM(RecordingLLM):
+        in_flight = 0
+        peak = 0
+
+        async def generate(self, messages, temperature=None, max_tokens=None, stop_sequences=None):
+            SlowLLM.in_flight += 1
+            SlowLLM.peak = max(SlowLLM.peak, SlowLLM.in_flight)
+            await asyncio.sleep(0.01)
+            SlowLLM.in_flight -= 1
+            return await super().generate(messages, temperature, max_tokens, stop_sequences)
+
+    agent = WritingAgent(
+        config=AgentConfig(name="writing", role="writing", llm_backend_id="fake"),
+        llm=SlowLLM("ok"),
+        memory=StructuredMemory(),
+        event_bus=EventBus(),
+        max_concurrent_calls=2,
+    )
+
+    await asyncio.gather(*(agent.revise(f"draft {i}", []) for i in range(6)))
+
+    assert SlowLLM.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_budget_counts_each_request_once():
+    class CountingLLM(RecordingLLM):
+        counted = []
+
+        async def count_message_tokens(self, messages):
+            CountingLLM.counted.append([m["role"] for m in messages])
+            return await super().count_message_tokens(messages)
+
+    agent = _make_agent(CountingLLM("ok"))
+    agent._system_prompt = "You are a novelist."
+
+    await agent.revise("draft one", [])
+    await agent.revise("draft two", [])
+
+    assert CountingLLM.counted == [
+        ["system", "user"],
+        ["system", "user", "assistant", "user"],
+    ]
+
+
+def test_system_message_tracks_prompt_and_language():
+    agent = _make_agent(RecordingLLM())
+    agent.config.prompt_variables["language"] = "French"
+    agent._system_prompt = "You are a novelist."
+
+    first = agent._system_message()
+    assert first.startswith("IMPORTANT:") and first.endswith("You are a novelist.")
+    assert agent._system_message() is first
+
+    agent._system_prompt = "You are an editor."
+    assert agent._system_message().endswith("You are an editor.")
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_hit_leaves_history_as_a_miss_would(self):
+        cache = ResponseCache()
+        cold = _make_agent(RecordingLLM("scene"), cache=cache)
+        await cold.revise("draft", [])
+
+        warm_llm = RecordingLLM("scene")
+        warm = _make_agent(warm_llm, cache=cache)
+        await warm.revise("draft", [])
+
+        assert warm_llm.prompts == []
+        assert warm._conversation_history == cold._conversation_history
+
+    @pytest.mark.asyncio
+    async def test_same_prompt_after_different_history_misses(self):
+        cache = ResponseCache()
+        llm = RecordingLLM("scene")
+        agent = _make_agent(llm, cache=cache)
+
+        await agent.revise("draft", [])
+        await agent.revise("draft", [])
+
+        assert len(llm.prompts) == 2
@@ -0,0 +1,43 @@
+"""Tests for the precompiled WritingAgent prompt templates."""
+
+from storyforge.agents._writing_prompts import (
+    CHAPTER_TMPL,
+    REVISE_TMPL,
+    SCENE_SEPARATOR,
+    SCENE_TMPL,
+)
+
+
+def test_scene_prompt_uses_defaults_for_missing_plan_fields():
+    prompt = SCENE_TMPL.render(
+        scene_plan={"location": "Harbor"},
+        setting_text="",
+        reactions_text="",
+        dialogue_text="",
+    )
+    assert "- Location: Harbor" in prompt
+    assert "- POV: third person limited" in prompt
+    assert "No character reactions provided." in prompt
+    assert "from the protagonist's perspective" in prompt
+
+
+def test_revise_prompt_includes_feedback_and_draft():
+    prompt = REVISE_TMPL.render(feedback_text="- tighten pacing", text="Draft.")
+    assert "FEEDBACK:\n- tighten pacing\n\nCURRENT DRAFT:\nDraft.\n" in prompt
+
+
+def test_chapter_prompt_heading_only_with_title():
+    with_title = CHAPTER_TMPL.render(chapter_title="Dawn", chapter_number=2, scenes=["s"])
+    without_title = CHAPTER_TMPL.render(chapter_title="", chapter_number=2, scenes=["s"])
+    assert "\n\nChapter 2: Dawn\n\n" in with_title
+    assert "Chapter 2" not in without_title
+
+
+def test_chapter_prompt_separates_scenes():
+    prompt = CHAPTER_TMPL.render(
+        chapter_title="",
+        chapter_number=1,
+        scenes=["one", "two"],
+        scene_separator=SCENE_SEPARATOR,
+    )
+    assert "SCENES:\none\n\n---SCENE BREAK---\n\ntwo\n\nINSTRUCTIONS:" in prompt
@@ -0,0 +1,187 @@
+"""Tests for CLI helpers."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from storyforge.cli import (
+    _existing_files,
+    _generate_in_slot,
+    _LazyBackends,
+    _load_character_sheets,
+    _read_text_file,
+    _resolve_api_keys_for_config,
+    _sanitize_collection_name,
+)
+
+
+def _backend(provider: str, api_key=None, api_key_env=None) -> SimpleNamespace:
+    return SimpleNamespace(provider=provider, api_key=api_key, api_key_env=api_key_env)
+
+
+class TestResolveApiKeys:
+    def test_cli_key_applies_to_every_backend_of_missing_provider(self):
+        writer = _backend("openai")
+        critic = _backend("openai", api_key="sk-env")
+        local = _backend("ollama")
+        images = _backend("openai")
+        config = SimpleNamespace(
+            llm_backends={"writer": writer, "critic": critic, "local": local},
+            visual_backends={"images": images},
+        )
+
+        _resolve_api_keys_for_config(config, "sk-cli")
+
+        assert writer.api_key == critic.api_key == images.api_key == "sk-cli"
+        assert local.api_key is None
+
+    def test_resolved_keys_are_left_alone(self):
+        writer = _backend("anthropic", api_key="sk-env")
+        config = SimpleNamespace(llm_backends={"writer": writer}, visual_backends={})
+
+        _resolve_api_keys_for_config(config, "sk-cli")
+
+        assert writer.api_key == "sk-env"
+
+    def test_prompts_once_per_provider(self, monkeypatch):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        prompts = []
+        monkeypatch.setattr(
+            "storyforge.cli.click.prompt",
+            lambda text, **kwargs: prompts.append(text) or "sk-typed",
+        )
+        first = _backend("anthropic", api_key_env="ANTHROPIC_API_KEY")
+        second = _backend("anthropic")
+        config = SimpleNamespace(
+            llm_backends={"first": first, "second": second}, visual_backends={}
+        )
+
+        _resolve_api_keys_for_config(config, None)
+
+        assert prompts == ["Enter API key for anthropic (or set ANTHROPIC_API_KEY)"]
+        assert first.api_key == second.api_key == "sk-typed"
+
+    def test_env_var_set_after_load_skips_prompt(self, monkeypatch):
+        monkeypatch.setattr(
+            "storyforge.cli.click.prompt",
+            lambda *args, **kwargs: pytest.fail("should not prompt"),
+        )
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-late")
+        writer = _backend("openai", api_key_env="OPENAI_API_KEY")
+        config = SimpleNamespace(llm_backends={"writer": writer}, visual_backends={})
+
+        _resolve_api_keys_for_config(config, None)
+
+        assert writer.api_key == "sk-late"
+
+
+class TestLazyBackends:
+    def test_creates_each_backend_once_on_first_use(self):
+        created = []
+        backends = _LazyBackends(
+            {"a": "cfg-a", "b": "cfg-b"}, lambda cfg: created.append(cfg) or cfg.upper()
+        )
+
+        assert backends["a"] == "CFG-A"
+        assert backends["a"] == "CFG-A"
+        assert created == ["cfg-a"]
+        assert backends.get("b") == "CFG-B"
+        assert backends.get("missing") is None
+
+    def test_unknown_name_raises(self):
+        with pytest.raises(KeyError):
+            _LazyBackends({}, str)["missing"]
+
+
+class TestSanitizeCollectionName:
+    def test_ascii_names(self):
+        assert _sanitize_collection_name("Kael") == "Kael"
+        assert _sanitize_collection_name("Mira Voss") == "Mira_Voss"
+        assert _sanitize_collection_name("Li") == "Li_col"
+
+    def test_non_ascii_name_is_stable(self):
+        # Collections persist on disk, so the fallback digest must not change
+        assert _sanitize_collection_name("凯尔") == "192b12040c126d1e"
+
+
+class TestReadTextFile:
+    def test_matches_text_mode_read(self, tmp_path):
+        path = tmp_path / "chapter.txt"
+        path.write_bytes("Première ligne\r\nsecond\rthird\n".encode("utf-8"))
+        assert _read_text_file(path) == path.read_text(encoding="utf-8")
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert _read_text_file(path) == ""
+
+
+class TestGenerateInSlot:
+    @pytest.mark.asyncio
+    async def test_failure_is_recorded_without_cancelling_peers(self, monkeypatch):
+        tracebacks = []
+        monkeypatch.setattr(
+            "storyforge.cli.console",
+            SimpleNamespace(
+                print=lambda *args, **kwargs: None,
+                print_exception=lambda: tracebacks.append(1),
+            ),
+        )
+
+        async def generate_chapter(ch_num):
+            if ch_num == 2:
+                raise RuntimeError("model unavailable")
+            return "some words here"
+
+        pipeline = SimpleNamespace(generate_chapter=generate_chapter)
+        slots = asyncio.Semaphore(2)
+        failed: list[int] = []
+
+        await asyncio.gather(
+            *(_generate_in_slot(pipeline, ch, slots, failed) for ch in (1, 2, 3))
+        )
+
+        assert failed == [2]
+        assert tracebacks == [1]
+
+
+def test_existing_files(tmp_path):
+    (tmp_path / "characters").mkdir()
+    (tmp_path / "characters" / "kael.yaml").write_text("name: Kael\n")
+    (tmp_path / "characters" / "nested.yaml").mkdir()
+    present = tmp_path / "characters" / "kael.yaml"
+    paths = [
+        present,
+        tmp_path / "characters" / "sera.yaml",
+        tmp_path / "characters" / "nested.yaml",
+        tmp_path / "missing" / "voss.yaml",
+    ]
+
+    assert _existing_files(paths) == {present}
+
+
+def test_existing_files_defers_to_case_insensitive_filesystems(tmp_path, monkeypatch):
+    (tmp_path / "elena.yaml").write_text("name: Elena\n")
+    requested = tmp_path / "Elena.yaml"
+    # Pretend the filesystem matches names case-insensitively
+    monkeypatch.setattr(
+        type(requested), "is_file", lambda self: self.name.lower() == "elena.yaml"
+    )
+
+    assert _existing_files([requested]) == {requested}
+
+
+class TestLoadCharacterSheets:
+    @pytest.mark.asyncio
+    async def test_sheets_follow_cast_order(self, tmp_path):
+        (tmp_path / "kael.yaml").write_text("name: Kael\n")
+        (tmp_path / "sera.yaml").write_text("name: Sera\n")
+        characters = [
+            SimpleNamespace(character_sheet=name)
+            for name in ("kael.yaml", "missing.yaml", "sera.yaml", "kael.yaml")
+        ]
+
+        sheets = await _load_character_sheets(tmp_path, characters)
+
+        assert sheets == [{"name": "Kael"}, None, {"name": "Sera"}, {"name": "Kael"}]
@@ -6,6 +6,7 @@ from pathlib import Path
 
 import pytest
 import yaml
+from pydantic import ValidationError
 
 from storyforge.config import (
     LLMBackendConfig,
@@ -105,6 +106,61 @@ class TestLoadConfig:
         with pytest.raises(FileNotFoundError, match="Project config not found"):
             load_config(tmp_path)
 
+    def _write_env_key_config(self, tmp_path):
+        config_data = {
+            "project": {"name": "Test Novel"},
+            "llm_backends": {
+                "test_backend": {
+                    "provider": "openai",
+                    "model": "gpt-4o-mini",
+                    "tier": "small",
+                    "api_key_env": "STORYFORGE_TEST_KEY",
+                },
+            },
+            "agents": {
+                "world": {"type": "world", "llm_backend": "test_backend"},
+                "plot": {"type": "plot", "llm_backend": "test_backend"},
+                "writing": {"type": "writing", "llm_backend": "test_backend"},
+            },
+        }
+        (tmp_path / "project.yaml").write_text(yaml.dump(config_data))
+
+    def test_injected_keys_do_not_leak_between_loads(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("STORYFORGE_TEST_KEY", "sk-env")
+        self._write_env_key_config(tmp_path)
+
+        first = load_config(tmp_path)
+        first.llm_backends["test_backend"].api_key = "sk-injected"
+
+        assert load_config(tmp_path).llm_backends["test_backend"].api_key == "sk-env"
+
+    def test_env_change_is_picked_up(self, tmp_path, monkeypatch):
+        self._write_env_key_config(tmp_path)
+        monkeypatch.setenv("STORYFORGE_TEST_KEY", "sk-old")
+        assert load_config(tmp_path).llm_backends["test_backend"].api_key == "sk-old"
+
+        monkeypatch.setenv("STORYFORGE_TEST_KEY", "sk-new")
+        assert load_config(tmp_path).llm_backends["test_backend"].api_key == "sk-new"
+
+    def test_loaded_sections_are_read_only(self, tmp_path):
+        config_data = {
+            "project": {"name": "Test Novel"},
+            "llm_backends": {
+                "b": {"provider": "ollama", "model": "llama3.1:8b", "tier": "small"},
+            },
+            "agents": {
+                "world": {"llm_backend": "b"},
+                "plot": {"llm_backend": "b"},
+                "writing": {"llm_backend": "b"},
+            },
+        }
+        (tmp_path / "project.yaml").write_text(yaml.dump(config_data))
+        cfg = load_config(tmp_path)
+
+        with pytest.raises(ValidationError):
+            cfg.visual_pipeline.generate_images = False
+        cfg.llm_backends["b"].api_key = "injected"
+
 
 class TestLoadYamlFile:
     def test_load_valid(self, tmp_path):
@@ -122,3 +178,16 @@ class TestLoadYamlFile:
         path.write_text("")
         result = load_yaml_file(path)
         assert result == {}
+
+    def test_returns_independent_copies(self, tmp_path):
+        path = tmp_path / "test.yaml"
+        path.write_text("items: [a]\n")
+        load_yaml_file(path)["items"].append("b")
+        assert load_yaml_file(path) == {"items": ["a"]}
+
+    def test_reloads_after_edit(self, tmp_path):
+        path = tmp_path / "test.yaml"
+        path.write_text("key: old\n")
+        assert load_yaml_file(path) == {"key": "old"}
+        path.write_text("key: newer\n")
+        assert load_yaml_file(path) == {"key": "newer"}
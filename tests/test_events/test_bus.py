@@ -0,0 +1,162 @@
+"""Tests for the event bus."""
+
+import json
+
+import pytest
+
+from storyforge.events.bus import EventBus
+from storyforge.events.middleware import EventFileLogger
+from storyforge.events.types import Event, EventType
+
+
+def _event(event_type: EventType, chapter: int) -> Event:
+    return Event(event_type=event_type, payload={}, source_agent="test", chapter_number=chapter)
+
+
+class TestEventLog:
+    @pytest.mark.asyncio
+    async def test_filters_by_type_and_chapter(self):
+        bus = EventBus()
+        await bus.publish(_event(EventType.SCENE_DRAFT_READY, 1))
+        await bus.publish(_event(EventType.SCENE_DRAFT_READY, 2))
+        await bus.publish(_event(EventType.REVISION_READY, 2))
+
+        assert len(bus.get_event_log()) == 3
+        assert len(bus.get_event_log(event_type=EventType.SCENE_DRAFT_READY)) == 2
+        (event,) = bus.get_event_log(event_type=EventType.SCENE_DRAFT_READY, chapter=2)
+        assert event.chapter_number == 2
+
+    @pytest.mark.asyncio
+    async def test_keeps_only_most_recent_events(self):
+        bus = EventBus(log_capacity=2)
+        for chapter in range(1, 4):
+            await bus.publish(_event(EventType.CHAPTER_ASSEMBLED, chapter))
+
+        assert [e.chapter_number for e in bus.get_event_log()] == [2, 3]
+
+
+class TestMiddleware:
+    @pytest.mark.asyncio
+    async def test_sync_and_async_middleware_run_in_order(self):
+        calls = []
+
+        def sync_mw(event):
+            calls.append("sync")
+            return event
+
+        async def async_mw(event):
+            calls.append("async")
+            return event
+
+        bus = EventBus()
+        bus.add_middleware(async_mw)
+        bus.add_middleware(sync_mw)
+        await bus.publish(_event(EventType.CHAPTER_ASSEMBLED, 1))
+
+        assert calls == ["async", "sync"]
+        assert len(bus.get_event_log()) == 1
+
+    @pytest.mark.asyncio
+    async def test_plain_callable_returning_awaitable_is_awaited(self):
+        async def tag(event):
+            event.payload["tagged"] = True
+            return event
+
+        bus = EventBus()
+        bus.add_middleware(lambda event: tag(event))
+        await bus.publish(_event(EventType.CHAPTER_ASSEMBLED, 1))
+
+        (logged,) = bus.get_event_log()
+        assert logged.payload["tagged"] is True
+
+    @pytest.mark.asyncio
+    async def test_middleware_can_drop_events(self):
+        bus = EventBus()
+        bus.add_middleware(lambda event: None)
+        await bus.publish(_event(EventType.CHAPTER_ASSEMBLED, 1))
+
+        assert bus.get_event_log() == []
+
+    @pytest.mark.asyncio
+    async def test_file_logger_writes_jsonl(self, tmp_path):
+        log_path = tmp_path / "events.jsonl"
+        file_logger = EventFileLogger(log_path)
+        bus = EventBus()
+        bus.add_middleware(file_logger)
+        await bus.publish(_event(EventType.CHAPTER_ASSEMBLED, 1))
+        await bus.publish(_event(EventType.CHAPTER_ASSEMBLED, 2))
+        file_logger.close()
+
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert [r["chapter_number"] for r in records] == [1, 2]
+
+
+class TestBroadcast:
+    @pytest.mark.asyncio
+    async def test_single_handler_response_is_republished(self):
+        bus = EventBus()
+        seen = []
+
+        async def reply(event):
+            return event.create_response(EventType.SCENE_DRAFT_READY, {}, "writer")
+
+        async def record(event):
+            seen.append(event)
+
+        await bus.subscribe(EventType.SCENE_DRAFT_REQUEST, reply)
+        await bus.subscribe(EventType.SCENE_DRAFT_READY, record)
+        await bus.publish(_event(EventType.SCENE_DRAFT_REQUEST, 3))
+
+        assert [e.chapter_number for e in seen] == [3]
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_are_logged_not_raised(self):
+        bus = EventBus()
+        calls = []
+
+        async def broken(event):
+            raise RuntimeError("boom")
+
+        async def healthy(event):
+            calls.append(event)
+
+        await bus.subscribe(EventType.CHAPTER_ASSEMBLED, broken)
+        await bus.publish(_event(EventType.CHAPTER_ASSEMBLED, 1))
+        await bus.subscribe(EventType.CHAPTER_ASSEMBLED, healthy)
+        await bus.publish(_event(EventType.CHAPTER_ASSEMBLED, 2))
+
+        assert [e.chapter_number for e in calls] == [2]
+
+
+def test_event_ids_are_unique_and_share_a_process_tag():
+    first = _event(EventType.CHAPTER_ASSEMBLED, 1)
+    second = _event(EventType.CHAPTER_ASSEMBLED, 1)
+
+    assert first.event_id != second.event_id
+    assert first.event_id.split("-")[0] == second.event_id.split("-")[0]
+
+
+class TestRequest:
+    @pytest.mark.asyncio
+    async def test_returns_directed_response(self):
+        bus = EventBus()
+
+        async def plot(event):
+            return event.create_response(EventType.SCENE_PLAN_READY, {"ok": True}, "plot")
+
+        await bus.subscribe_directed("plot", plot)
+        request = _event(EventType.SCENE_PLAN_REQUEST, 1)
+        request.target_agent = "plot"
+
+        response = await bus.request(request, timeout=1.0)
+
+        assert response.payload == {"ok": True}
+        assert bus._response_futures == {}
+
+    @pytest.mark.asyncio
+    async def test_times_out_without_response(self):
+        bus = EventBus()
+
+        with pytest.raises(TimeoutError, match="scene_plan_request"):
+            await bus.request(_event(EventType.SCENE_PLAN_REQUEST, 1), timeout=0.01)
+        assert bus._response_futures == {}
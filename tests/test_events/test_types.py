@@ -0,0 +1,28 @@
+"""Tests for Event."""
+
+from datetime import datetime, timedelta, timezone
+
+from storyforge.events.types import Event, EventType
+
+
+class TestTimestamp:
+    def test_is_aware_utc_matching_timestamp_ns(self):
+        before = datetime.now(timezone.utc)
+        event = Event(EventType.WORLD_QUERY, {}, "pipeline")
+
+        stamp = event.timestamp
+
+        assert stamp.tzinfo is timezone.utc
+        assert stamp.timestamp() == event.timestamp_ns // 1000 / 1_000_000
+        assert before - timedelta(seconds=1) <= stamp <= datetime.now(timezone.utc)
+
+    def test_datetime_constructor_keyword_still_works(self):
+        when = datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+
+        event = Event(EventType.WORLD_QUERY, {}, "pipeline", timestamp=when)
+
+        assert event.timestamp == when
+        assert event.timestamp_ns == int(when.timestamp()) * 10**9 + 123456000
+        assert Event(
+            EventType.WORLD_QUERY, {}, "pipeline", timestamp=when.replace(tzinfo=None)
+        ).timestamp == when
@@ -0,0 +1,100 @@
+"""Tests for the Anthropic backend."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from storyforge.llm.anthropic import AnthropicBackend, _split_system
+from storyforge.llm.base import LLMConfig
+
+
+class _CountingMessages:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+        self.systems = []
+
+    async def count_tokens(self, model, messages, system=""):
+        self.calls += 1
+        self.systems.append(system)
+        if self.fail:
+            raise ConnectionError("offline")
+        words = sum(len(m["content"].split()) for m in messages)
+        return SimpleNamespace(input_tokens=words + len(system.split()))
+
+
+def _backend(messages: _CountingMessages) -> AnthropicBackend:
+    backend = AnthropicBackend(
+        LLMConfig(provider="anthropic", model="claude-test", api_key="sk-test")
+    )
+    backend._client = SimpleNamespace(messages=messages)
+    return backend
+
+
+class TestCountTokens:
+    @pytest.mark.asyncio
+    async def test_repeated_text_is_counted_once(self):
+        messages = _CountingMessages()
+        backend = _backend(messages)
+
+        assert await backend.count_tokens("a system prompt") == 3
+        assert await backend.count_tokens("a system prompt") == 3
+        assert await backend.count_tokens("another") == 1
+        assert messages.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_estimate_when_endpoint_fails(self, monkeypatch):
+        monkeypatch.setattr("storyforge.llm.anthropic.get_encoding", lambda name: None)
+        messages = _CountingMessages(fail=True)
+        backend = _backend(messages)
+
+        assert await backend.count_tokens("x" * 40) == 10
+        assert await backend.count_tokens("x" * 40) == 10
+        assert messages.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_counting_does_not_use_generation_rate_limiter(self):
+        backend = _backend(_CountingMessages())
+        acquired = []
+
+        async def acquire(token_count=1):
+            acquired.append(token_count)
+
+        backend._limiter.acquire = acquire
+
+        await backend.count_tokens("counted")
+        await backend.count_message_tokens([{"role": "user", "content": "hi"}])
+
+        assert acquired == []
+
+    @pytest.mark.asyncio
+    async def test_request_reuses_cached_message_counts(self):
+        messages = _CountingMessages()
+        backend = _backend(messages)
+        history = [
+            {"role": "system", "content": "You are a novelist."},
+            {"role": "user", "content": "Write a scene."},
+            {"role": "assistant", "content": "Rain fell."},
+        ]
+
+        first = await backend.count_message_tokens(
+            history + [{"role": "user", "content": "Now revise it."}]
+        )
+        second = await backend.count_message_tokens(
+            history + [{"role": "user", "content": "Shorter, please."}]
+        )
+
+        assert first == 4 + 3 + 2 + 3
+        assert second == 4 + 3 + 2 + 2
+        assert messages.calls == 5
+
+
+def test_split_system():
+    messages = [
+        {"role": "system", "content": "You are a novelist."},
+        {"role": "user", "content": "Write."},
+        {"role": "assistant", "content": "Once upon a time"},
+    ]
+
+    assert _split_system(messages) == ("You are a novelist.", messages[1:])
+    assert _split_system(messages[1:]) == ("", messages[1:])
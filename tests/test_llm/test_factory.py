@@ -0,0 +1,66 @@
+"""Tests for the LLM backend factory."""
+
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+from storyforge.config import LLMBackendConfig
+from storyforge.llm.base import LLMConfig, ModelTier
+from storyforge.llm.factory import LLMFactory
+
+
+def test_config_from_settings_model():
+    backend_config = LLMBackendConfig(
+        provider="ollama", model="llama3.1:8b", tier="medium", max_tokens=2048
+    )
+
+    llm_config = LLMFactory.config_from(backend_config)
+
+    assert llm_config.provider == "ollama"
+    assert llm_config.tier is ModelTier.MEDIUM
+    assert llm_config.max_tokens == 2048
+    assert llm_config.context_window == 8192
+
+
+class TestSharedClient:
+    def test_backends_with_same_key_share_a_client(self):
+        created = []
+
+        def create():
+            created.append(object())
+            return created[-1]
+
+        first = LLMFactory.shared_client(("test", "sk-a"), create)
+        assert LLMFactory.shared_client(("test", "sk-a"), create) is first
+        assert LLMFactory.shared_client(("test", "sk-b"), create) is not first
+        assert len(created) == 2
+
+    def test_new_event_loop_gets_fresh_clients(self):
+        async def in_loop():
+            client = LLMFactory.shared_client(("test", "loop"), object)
+            assert LLMFactory.shared_client(("test", "loop"), object) is client
+            return client
+
+        outside = LLMFactory.shared_client(("test", "loop"), object)
+
+        assert asyncio.run(in_loop()) is not outside
+
+
+class TestProviders:
+    def test_unknown_provider_lists_builtins(self):
+        with pytest.raises(ValueError, match="anthropic"):
+            LLMFactory.create(LLMConfig(provider="nope", model="m"))
+
+    def test_only_configured_provider_is_imported(self):
+        code = (
+            "import sys\n"
+            "from storyforge.llm.base import LLMConfig\n"
+            "from storyforge.llm.factory import LLMFactory\n"
+            "LLMFactory.create(LLMConfig(provider='ollama', model='llama3'))\n"
+            "assert 'storyforge.llm.ollama' in sys.modules\n"
+            "assert 'storyforge.llm.anthropic' not in sys.modules\n"
+            "assert 'storyforge.llm.openai' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,195 @@
+"""Tests for the OpenAI backend."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+import tiktoken
+
+from storyforge.llm.base import LLMConfig, LLMResponse
+from storyforge.llm.openai import OpenAIBackend
+
+
+class TestHttpClient:
+    def test_client_uses_configured_timeout(self):
+        backend = OpenAIBackend(
+            LLMConfig(
+                provider="openai",
+                model="gpt-test",
+                api_key="sk-timeout-test",
+                request_timeout=42.0,
+            )
+        )
+
+        assert backend._client.timeout.read == 42.0
+        assert backend._client.timeout.connect == 5.0
+
+    def test_shared_client_builds_no_extra_http_client(self, monkeypatch):
+        built = []
+        monkeypatch.setattr(
+            "storyforge.llm.openai._http_client", lambda: built.append(1)
+        )
+        config = LLMConfig(
+            provider="openai", model="gpt-test", api_key="sk-shared-http-test"
+        )
+
+        first = OpenAIBackend(config)
+        second = OpenAIBackend(config)
+
+        assert first._client is second._client
+        assert built == [1]
+
+
+class TestCountTokens:
+    @pytest.mark.asyncio
+    async def test_special_token_text_does_not_raise(self, monkeypatch):
+        enc = tiktoken.Encoding(
+            "bytes",
+            pat_str=r"\S+|\s+",
+            mergeable_ranks={bytes([i]): i for i in range(256)},
+            special_tokens={"<|endoftext|>": 256},
+        )
+        monkeypatch.setattr("storyforge.llm.openai.encoding_for_model", lambda m: enc)
+        backend = OpenAIBackend(
+            LLMConfig(provider="openai", model="gpt-test", api_key="sk-test")
+        )
+
+        assert await backend.count_tokens("<|endoftext|>") == 13
+
+
+class TestGenerateMany:
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency_and_keeps_order(self):
+        backend = OpenAIBackend(
+            LLMConfig(provider="openai", model="gpt-test", api_key="sk-test")
+        )
+        in_flight = 0
+        peak = 0
+
+        async def generate(messages, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if messages == "bad":
+                raise ValueError("bad request")
+            return LLMResponse(messages, "gpt-test", 1, 1, "stop")
+
+        backend.generate = generate
+        requests = [{"messages": m} for m in ("a", "b", "bad", "c", "d")]
+
+        results = await backend.generate_many(requests, max_concurrency=2)
+
+        assert [r.content for r in results[:2] + results[3:]] == ["a", "b", "c", "d"]
+        assert isinstance(results[2], ValueError)
+        assert peak == 2
+
+
+class _FakeBatchClient:
+    """Minimal stand-in for the files/batches parts of AsyncOpenAI."""
+
+    def __init__(self):
+        self.uploaded = b""
+        self.files = SimpleNamespace(create=self._upload, content=self._download)
+        self.batches = SimpleNamespace(create=self._create, retrieve=self._retrieve)
+        self.polls = 0
+
+    async def _upload(self, file, purpose):
+        self.uploaded = file[1]
+        return SimpleNamespace(id="file-in")
+
+    async def _create(self, input_file_id, endpoint, completion_window):
+        return SimpleNamespace(id="batch-1", status="in_progress", output_file_id=None)
+
+    async def _retrieve(self, batch_id):
+        self.polls += 1
+        return SimpleNamespace(id=batch_id, status="completed", output_file_id="file-out")
+
+    async def _download(self, file_id):
+        lines = []
+        # Answer out of order, as the Batch API may
+        for line in reversed(self.uploaded.decode().splitlines()):
+            request = json.loads(line)
+            text = request["body"]["messages"][-1]["content"].upper()
+            lines.append(json.dumps({
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": {
+                    "model": "gpt-test",
+                    "choices": [{"message": {"content": text}, "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": 3, "completion_tokens": 2},
+                }},
+            }))
+        return SimpleNamespace(text="\n".join(lines))
+
+
+class TestGenerateBatch:
+    @pytest.mark.asyncio
+    async def test_results_follow_request_order(self):
+        backend = OpenAIBackend(
+            LLMConfig(provider="openai", model="gpt-test", api_key="sk-test")
+        )
+        client = backend._client = _FakeBatchClient()
+        requests = [
+            {"messages": [{"role": "user", "content": text}]} for text in ("one", "two")
+        ]
+
+        responses = await backend.generate_batch(requests, poll_interval=0)
+
+        assert [r.content for r in responses] == ["ONE", "TWO"]
+        assert responses[0].input_tokens == 3
+        assert client.polls == 1
+
+
+class TestGenerate:
+    @pytest.mark.asyncio
+    async def test_response_without_usage(self):
+        backend = OpenAIBackend(
+            LLMConfig(provider="openai", model="gpt-test", api_key="sk-test")
+        )
+        reply = SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    message=SimpleNamespace(content=None), finish_reason=None
+                )
+            ],
+            model="gpt-test",
+            usage=None,
+        )
+
+        async def create(**kwargs):
+            return reply
+
+        backend._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        response = await backend.generate([{"role": "user", "content": "hi"}])
+
+        assert (response.content, response.finish_reason) == ("", "stop")
+        assert (response.input_tokens, response.output_tokens) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_stream_skips_empty_chunks(self):
+        backend = OpenAIBackend(
+            LLMConfig(provider="openai", model="gpt-test", api_key="sk-test")
+        )
+
+        def chunk(content):
+            delta = SimpleNamespace(content=content)
+            return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+        async def stream():
+            for item in (chunk("Hel"), SimpleNamespace(choices=[]), chunk(None), chunk("lo")):
+                yield item
+
+        async def create(**kwargs):
+            return stream()
+
+        backend._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+        parts = [part async for part in backend.generate_stream([])]
+
+        assert parts == ["Hel", "lo"]
@@ -79,3 +79,16 @@ async def test_zero_token_count():
         tokens_per_minute=1000,
     )
     await limiter.acquire(token_count=0)  # Should succeed
+
+
+@pytest.mark.asyncio
+async def test_waits_only_until_refill():
+    """A blocked acquire should resume as soon as a slot refills."""
+    limiter = TokenBucketRateLimiter(requests_per_minute=3000)  # one per 20ms
+    limiter._request_tokens = 0.0
+
+    start = time.monotonic()
+    await limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    assert 0.015 <= elapsed < 0.08  # polling at 100ms would overshoot
@@ -0,0 +1,35 @@
+"""Tests for the LLM response cache."""
+
+from storyforge.llm.cache import ResponseCache
+
+
+class TestResponseCache:
+    def test_miss_then_hit(self):
+        cache = ResponseCache()
+        key = ResponseCache.make_key("model", "prompt", 0.8)
+        assert cache.get(key) is None
+        cache.put(key, "prose")
+        assert cache.get(key) == "prose"
+
+    def test_key_depends_on_every_part(self):
+        assert ResponseCache.make_key("m", "p", 0.8) != ResponseCache.make_key("m", "p", 0.7)
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert len(cache) == 2
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.jsonl"
+        ResponseCache(path).put("k", {"text": "scene"})
+        assert ResponseCache(path).get("k") == {"text": "scene"}
+
+    def test_skips_corrupt_lines(self, tmp_path):
+        path = tmp_path / "cache.jsonl"
+        path.write_text('not json\n{"key": "k", "value": "v"}\n', encoding="utf-8")
+        assert ResponseCache(path).get("k") == "v"
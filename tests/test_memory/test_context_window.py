@@ -75,3 +75,51 @@ class TestContextWindowManager:
         result = self.mgr.truncate_text(text, budget_tokens=10)
         assert len(result) == 43  # 10*4 + len("...")
         assert result.endswith("...")
+
+    def test_fit_to_budget_with_batch_counter(self):
+        batches = []
+
+        def count_batch(texts):
+            batches.append(texts)
+            return [len(text) // 4 for text in texts]
+
+        mgr = ContextWindowManager(
+            max_context_tokens=1000,
+            token_counter=lambda text: pytest.fail("should count in a batch"),
+            batch_token_counter=count_batch,
+        )
+        items = ["a" * 40, "b" * 40, "c" * 40, "d"]
+
+        assert mgr.fit_to_budget(items, budget_tokens=20) == items[:2]
+        assert mgr.fit_to_budget(items, budget_tokens=5) == []
+        assert len(batches) == 2
+
+    def test_repeated_text_is_counted_once(self):
+        calls = []
+        mgr = ContextWindowManager(
+            max_context_tokens=1000,
+            token_counter=lambda text: calls.append(text) or len(text) // 4,
+        )
+
+        for _ in range(3):
+            budget = mgr.allocate_budget(system_prompt="s" * 400, fixed_context="f" * 40)
+
+        assert budget.system_prompt_tokens == 100
+        assert calls == ["s" * 400, "f" * 40]
+
+    def test_truncate_text_with_encoder(self):
+        class WordEncoder:
+            def encode(self, text):
+                return text.split(" ")
+
+            def decode(self, ids):
+                return " ".join(ids)
+
+        mgr = ContextWindowManager(
+            max_context_tokens=1000,
+            token_counter=lambda text: len(text) // 4,
+            encoder=WordEncoder(),
+        )
+
+        assert mgr.truncate_text("one two three", budget_tokens=3) == "one two three"
+        assert mgr.truncate_text("one two three four", budget_tokens=3) == "one two..."
@@ -0,0 +1,69 @@
+"""Tests for StructuredMemory."""
+
+import pytest
+
+from storyforge.memory.structured import StructuredMemory
+
+
+class TestPersistence:
+    @pytest.mark.asyncio
+    async def test_round_trips_through_disk(self, tmp_path):
+        path = tmp_path / "data" / "world.json"
+        memory = StructuredMemory(storage_path=path)
+        await memory.store("world.places.harbor", "Ærwyn docks")
+        await memory.store("world.magic.rules", ["no resurrection"])
+        await memory.save_to_disk()
+
+        restored = StructuredMemory(storage_path=path)
+        await restored.load_from_disk()
+
+        assert await restored.retrieve("world.places.harbor") == "Ærwyn docks"
+        assert restored.to_text() == memory.to_text()
+        assert "Ærwyn" in path.read_text(encoding="utf-8")
+
+
+class TestIndex:
+    @pytest.mark.asyncio
+    async def test_search_and_keys_follow_mutations(self):
+        memory = StructuredMemory()
+        await memory.load_from_dict({"places": {"harbor": "Dark Harbor"}})
+        assert await memory.search("harbor") == [
+            {"key": "places.harbor", "content": "Dark Harbor"}
+        ]
+
+        await memory.store("places.lists", ["a harbor town", "forest"])
+        await memory.delete("places.harbor")
+
+        assert await memory.search("harbor") == [
+            {"key": "places.lists[0]", "content": "a harbor town"}
+        ]
+        assert await memory.list_keys("places") == ["places.lists"]
+
+    @pytest.mark.asyncio
+    async def test_search_returns_first_top_k_hits_in_order(self):
+        memory = StructuredMemory()
+        await memory.load_from_dict({f"n{i}": f"Harbor {i}" for i in range(10)})
+
+        hits = await memory.search("HARBOR", top_k=3)
+
+        assert [hit["key"] for hit in hits] == ["n0", "n1", "n2"]
+        assert await memory.search("harbor", top_k=0) == []
+
+    @pytest.mark.asyncio
+    async def test_prefixed_keys_keep_tree_order(self):
+        memory = StructuredMemory()
+        await memory.load_from_dict(
+            {"world": {"zeta": 1, "alpha": 2}, "wor": 3, "worlds": {"b": 4}}
+        )
+
+        assert await memory.list_keys("world") == [
+            "world.zeta",
+            "world.alpha",
+            "worlds.b",
+        ]
+        await memory.store("world.beta", 5)
+        assert await memory.list_keys("world.") == [
+            "world.zeta",
+            "world.alpha",
+            "world.beta",
+        ]
@@ -0,0 +1,56 @@
+"""Tests for MemorySummarizer."""
+
+import pytest
+
+from storyforge.llm.base import LLMResponse
+from storyforge.memory.summary import MemorySummarizer
+from tests.fakes import RecordingLLM
+
+
+class _BatchLLM(RecordingLLM):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    async def generate_batch(self, requests):
+        self.batches.append(requests)
+        return [
+            LLMResponse(f"summary {i}", "fake", 0, 0, "stop")
+            for i in range(len(requests))
+        ]
+
+
+class TestSummarizeChaptersBatch:
+    @pytest.mark.asyncio
+    async def test_uses_batch_api_when_requested(self):
+        llm = _BatchLLM()
+        summaries = await MemorySummarizer(llm).summarize_chapters_batch(
+            ["chapter one", "chapter two"], use_batch=True
+        )
+
+        assert summaries == ["summary 0", "summary 1"]
+        assert len(llm.batches) == 1
+        assert llm.prompts == []
+
+    @pytest.mark.asyncio
+    async def test_defaults_to_concurrent_calls(self):
+        llm = _BatchLLM()
+        llm.reply = "short"
+        summaries = await MemorySummarizer(llm).summarize_chapters_batch(["a", "b"])
+
+        assert summaries == ["short", "short"]
+        assert llm.batches == []
+        assert len(llm.prompts) == 2
+
+
+class TestSummarizeConversation:
+    @pytest.mark.asyncio
+    async def test_sends_transcript_as_one_user_turn(self):
+        llm = RecordingLLM(reply="short")
+        messages = [
+            {"role": "user", "content": "Where is Kael?"},
+            {"role": "assistant", "content": "At the harbor."},
+        ]
+
+        assert await MemorySummarizer(llm).summarize_conversation(messages) == "short"
+        assert llm.prompts == ["user: Where is Kael?\nassistant: At the harbor."]
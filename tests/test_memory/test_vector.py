@@ -0,0 +1,86 @@
+"""Tests for VectorMemory write buffering."""
+
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("chromadb")
+
+from storyforge.memory.vector import VectorMemory
+
+
+class _FakeCollection:
+    name = "kael"
+
+    def __init__(self):
+        self.upserts = []
+        self.docs = {}
+        # Set to block upserts until the test releases them
+        self.upsert_started = threading.Event()
+        self.release_upsert = None
+
+    def upsert(self, ids, documents, metadatas):
+        self.upsert_started.set()
+        if self.release_upsert is not None:
+            self.release_upsert.wait(timeout=5)
+        self.upserts.append(list(ids))
+        self.docs.update(zip(ids, documents))
+
+    def delete(self, ids):
+        for key in ids:
+            self.docs.pop(key, None)
+
+    def get(self, ids=None):
+        keys = ids if ids is not None else list(self.docs)
+        found = [k for k in keys if k in self.docs]
+        return {"ids": found, "documents": [self.docs[k] for k in found]}
+
+
+@pytest.fixture
+def memory(tmp_path):
+    mem = VectorMemory("kael", str(tmp_path / "kael"), batch_size=3)
+    mem._collection = _FakeCollection()
+    return mem
+
+
+class TestWriteBuffering:
+    @pytest.mark.asyncio
+    async def test_writes_are_upserted_together(self, memory):
+        await memory.store("a", "first")
+        await memory.store("b", "second")
+        assert memory._collection.upserts == []
+
+        await memory.flush()
+        assert memory._collection.upserts == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes(self, memory):
+        for key in "abc":
+            await memory.store(key, key)
+        assert memory._collection.upserts == [["a", "b", "c"]]
+
+    @pytest.mark.asyncio
+    async def test_reads_see_buffered_writes(self, memory):
+        await memory.store("a", "first")
+        await memory.store("a", "revised")
+
+        assert await memory.retrieve("a") == "revised"
+        assert await memory.list_keys() == ["a"]
+
+
+class TestDeleteDuringFlush:
+    @pytest.mark.asyncio
+    async def test_delete_waits_for_in_flight_upsert(self, memory):
+        collection = memory._collection
+        collection.release_upsert = threading.Event()
+        await memory.store("a", "first")
+
+        flushing = asyncio.create_task(memory.flush())
+        await asyncio.to_thread(collection.upsert_started.wait, 5)
+        deleting = asyncio.create_task(memory.delete("a"))
+        await asyncio.sleep(0.01)
+        collection.release_upsert.set()
+        await asyncio.gather(flushing, deleting)
+
+        assert "a" not in collection.docs
@@ -0,0 +1,19 @@
+"""Tests for export formatters."""
+
+from storyforge.output.formats import HtmlFormatter
+
+
+class TestMdToHtml:
+    def test_headings_and_paragraphs(self):
+        md = "## Chapter 1: Dawn\n\n  First line.  \r\n# Part One\n##\n"
+        assert HtmlFormatter._md_to_html(md) == (
+            "<h2>Chapter 1: Dawn</h2>\n"
+            "<p>First line.</p>\n"
+            "<h1>Part One</h1>\n"
+            "<p>##</p>"
+        )
+
+    def test_text_is_escaped(self):
+        assert HtmlFormatter._md_to_html("Salt & <iron>") == (
+            "<p>Salt &amp; &lt;iron&gt;</p>"
+        )
@@ -0,0 +1,99 @@
+"""Tests for the output manager."""
+
+import pytest
+
+from storyforge.output.manager import OutputManager
+from storyforge.output.manifest import MANIFEST_NAME, chapter_files, read_manifest
+
+
+class TestScanChapters:
+    def test_missing_directory(self, tmp_path):
+        assert OutputManager(tmp_path / "output").scan_chapters() == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_counts_chapters_and_words(self, tmp_path):
+        mgr = OutputManager(tmp_path / "output", versioning=False)
+        await mgr.initialize()
+        await mgr.save_chapter(1, "one two three")
+        await mgr.save_chapter(2, "four five")
+
+        assert mgr.scan_chapters() == (2, 5)
+        assert mgr.get_chapter_count() == 2
+        assert mgr.get_total_word_count() == 5
+
+
+class TestExportMarkdown:
+    @pytest.mark.asyncio
+    async def test_concatenates_chapters_in_order(self, tmp_path):
+        mgr = OutputManager(tmp_path / "output", versioning=False)
+        await mgr.initialize()
+        await mgr.save_chapter(2, "Second.")
+        await mgr.save_chapter(1, "First.")
+
+        text = (await mgr.export_markdown("My Book")).read_text(encoding="utf-8")
+
+        assert text.startswith("# My Book\n\n## Chapter 1: Chapter 1\n\nFirst.\n")
+        assert text.index("First.") < text.index("Second.")
+        assert text.endswith("Second.\n\n\n---\n\n")
+
+
+class TestManifest:
+    @pytest.mark.asyncio
+    async def test_saves_keep_manifest_sorted(self, tmp_path):
+        mgr = OutputManager(tmp_path / "output", versioning=False)
+        await mgr.initialize()
+        await mgr.save_chapter(10, "ten")
+        await mgr.save_chapter(9, "nine nine")
+
+        files = [p.name for p in chapter_files(tmp_path / "output" / "chapters")]
+
+        assert files == ["chapter_009.md", "chapter_010.md"]
+        assert OutputManager(tmp_path / "output").scan_chapters() == (2, 3)
+
+    @pytest.mark.asyncio
+    async def test_directories_without_manifest_are_indexed(self, tmp_path):
+        mgr = OutputManager(tmp_path / "output", versioning=False)
+        await mgr.initialize()
+        await mgr.save_chapter(1, "one two")
+        await mgr.save_chapter(2, "three")
+        (tmp_path / "output" / "chapters" / MANIFEST_NAME).unlink()
+
+        legacy = OutputManager(tmp_path / "output", versioning=False)
+        assert legacy.scan_chapters() == (2, 3)
+        await legacy.save_chapter(3, "four five six")
+        assert read_manifest(tmp_path / "output" / "chapters").keys() == {1, 2, 3}
+
+
+class TestUnchangedContent:
+    @pytest.mark.asyncio
+    async def test_identical_chapter_is_not_rewritten(self, tmp_path):
+        mgr = OutputManager(tmp_path / "output")
+        await mgr.initialize()
+        path = await mgr.save_chapter(1, "same words")
+        mtime = path.stat().st_mtime_ns
+
+        assert await mgr.save_chapter(1, "same words") == path
+        assert path.stat().st_mtime_ns == mtime
+        versions = list((tmp_path / "output" / "versions" / "chapter_001").iterdir())
+        assert len(versions) == 1
+
+        await mgr.save_chapter(1, "different words")
+        assert "different" in path.read_text(encoding="utf-8")
+
+    @pytest.mark.asyncio
+    async def test_rewrite_leaves_version_snapshot_intact(self, tmp_path):
+        mgr = OutputManager(tmp_path / "output")
+        await mgr.initialize()
+        await mgr.save_chapter(1, "first draft")
+        version = next((tmp_path / "output" / "versions" / "chapter_001").iterdir())
+        # Keep the second snapshot from replacing the first one's name
+        version = version.rename(version.with_name("v_old.md"))
+
+        await mgr.save_chapter(1, "second draft")
+
+        assert "first draft" in version.read_text(encoding="utf-8")
+        assert sorted(p.name for p in (tmp_path / "output" / "chapters").iterdir()) == [
+            "chapter_001.md",
+            "chapter_001_meta.json",
+            MANIFEST_NAME,
+        ]
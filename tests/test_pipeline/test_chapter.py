@@ -0,0 +1,215 @@
+"""Tests for ChapterPipeline."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from storyforge.agents.plot import ScenePlan
+from storyforge.events.bus import EventBus
+from storyforge.events.types import Event, EventType
+from storyforge.llm.cache import ResponseCache
+from storyforge.pipeline.chapter import ChapterPipeline
+
+
+def _pipeline(bus, cache=None, characters=None, agent=None):
+    agent = agent or SimpleNamespace(config=SimpleNamespace(name="world"))
+    return ChapterPipeline(
+        event_bus=bus,
+        world_agent=agent,
+        character_agents=characters or {},
+        plot_agent=agent,
+        writing_agent=agent,
+        output_manager=None,
+        response_cache=cache,
+    )
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_repeated_request_is_answered_from_cache(self, tmp_path):
+        bus = EventBus()
+        calls = []
+
+        async def handler(event):
+            calls.append(event.payload)
+            return Event(
+                event_type=EventType.SETTING_VALIDATION_RESULT,
+                payload={"enriched_setting": {"place": "harbor"}},
+                source_agent="world",
+                target_agent="pipeline",
+                correlation_id=event.event_id,
+            )
+
+        await bus.subscribe_directed("world", handler)
+        path = tmp_path / "agent_cache.jsonl"
+
+        def request():
+            return Event(
+                event_type=EventType.SETTING_VALIDATION_REQUEST,
+                payload={"scene_plan": {"location": "harbor"}},
+                source_agent="pipeline",
+                target_agent="world",
+            )
+
+        first = await _pipeline(bus, ResponseCache(path))._request(request(), 1.0)
+        # A fresh cache reloads the response written by the first run
+        second = await _pipeline(bus, ResponseCache(path))._request(request(), 1.0)
+
+        assert len(calls) == 1
+        assert second.payload == first.payload
+        assert second.event_type == EventType.SETTING_VALIDATION_RESULT
+
+    @pytest.mark.asyncio
+    async def test_changed_agent_settings_miss_the_cache(self):
+        bus = EventBus()
+        calls = []
+
+        async def handler(event):
+            calls.append(event.payload)
+            return Event(
+                event_type=EventType.SETTING_VALIDATION_RESULT,
+                payload={"enriched_setting": {"take": len(calls)}},
+                source_agent="world",
+                correlation_id=event.event_id,
+            )
+
+        await bus.subscribe_directed("world", handler)
+        cache = ResponseCache()
+
+        def world(model, temperature):
+            return SimpleNamespace(
+                config=SimpleNamespace(name="world", temperature=temperature),
+                llm=SimpleNamespace(
+                    config=SimpleNamespace(provider="openai", model=model)
+                ),
+                _system_prompt="You keep the world consistent.",
+            )
+
+        async def request(agent):
+            event = Event(
+                event_type=EventType.SETTING_VALIDATION_REQUEST,
+                payload={"scene_plan": {"location": "harbor"}},
+                source_agent="pipeline",
+                target_agent="world",
+            )
+            return await _pipeline(bus, cache, agent=agent)._request(event, 1.0)
+
+        await request(world("gpt-4o", 0.7))
+        await request(world("gpt-4o", 0.7))
+        await request(world("gpt-4o-mini", 0.7))
+        await request(world("gpt-4o", 0.2))
+
+        assert len(calls) == 3
+
+
+class TestStagePlan:
+    @pytest.mark.asyncio
+    async def test_characters_are_offered_in_sorted_order(self):
+        bus = EventBus()
+        seen = []
+
+        async def handler(event):
+            seen.append(event.payload["available_characters"])
+            return Event(
+                event_type=EventType.CHAPTER_PLAN_READY,
+                payload={"outline": {"number": 1, "title": "Start"}},
+                source_agent="world",
+                correlation_id=event.event_id,
+            )
+
+        await bus.subscribe_directed("world", handler)
+        pipeline = _pipeline(bus, characters={"Sera": None, "Kael": None})
+
+        outline = await pipeline._stage_plan(1)
+
+        assert seen == [["Kael", "Sera"]]
+        assert outline.title == "Start"
+
+    @pytest.mark.asyncio
+    async def test_plans_are_never_replayed_from_cache(self):
+        bus = EventBus()
+        calls = []
+
+        async def handler(event):
+            calls.append(event.event_id)
+            return Event(
+                event_type=EventType.CHAPTER_PLAN_READY,
+                payload={"outline": {"number": 1, "title": f"Take {len(calls)}"}},
+                source_agent="world",
+                correlation_id=event.event_id,
+            )
+
+        await bus.subscribe_directed("world", handler)
+        pipeline = _pipeline(bus, ResponseCache())
+
+        await pipeline._stage_plan(1)
+        outline = await pipeline._stage_plan(1)
+
+        assert len(calls) == 2
+        assert outline.title == "Take 2"
+
+
+class TestGenerateScene:
+    @pytest.mark.asyncio
+    async def test_draft_is_saved_when_its_scene_finishes(self):
+        saved = []
+
+        async def save_intermediate(chapter_number, stage, content):
+            saved.append((chapter_number, stage, content))
+
+        pipeline = _pipeline(EventBus())
+        pipeline._output = SimpleNamespace(save_intermediate=save_intermediate)
+
+        async def validate(*args):
+            return {}
+
+        async def react(*args):
+            return []
+
+        async def compose(chapter_number, scene_idx, *args):
+            return f"scene {scene_idx} text"
+
+        pipeline._stage_validate_world = validate
+        pipeline._stage_character_reactions = react
+        pipeline._stage_compose_scene = compose
+
+        text = await pipeline._generate_scene(2, 1, None, None)
+
+        assert text == "scene 1 text"
+        assert saved == [(2, "scene_1_draft", "scene 1 text")]
+
+
+class TestCharacterReactions:
+    @pytest.mark.asyncio
+    async def test_characters_share_one_serialized_plan(self):
+        bus = EventBus()
+        plans = []
+
+        def responder(name):
+            async def handler(event):
+                plans.append(event.payload["scene_plan"])
+                return Event(
+                    event_type=EventType.CHARACTER_REACTION,
+                    payload={"reaction": {"name": name}},
+                    source_agent=name,
+                    correlation_id=event.event_id,
+                )
+
+            return handler
+
+        for name in ("Kael", "Sera"):
+            await bus.subscribe_directed(name, responder(name))
+        pipeline = _pipeline(bus, characters={"Kael": None, "Sera": None})
+        plan = ScenePlan(
+            location="harbor",
+            characters_present=["Kael", "Sera"],
+            scene_goal="meet",
+            conflict="",
+            expected_outcome="",
+            beats=[],
+        )
+
+        reactions = await pipeline._stage_character_reactions(1, 0, plan, {})
+
+        assert reactions == [{"name": "Kael"}, {"name": "Sera"}]
+        assert plans[0] is plans[1]
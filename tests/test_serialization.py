@@ -0,0 +1,31 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+
+from storyforge.utils import serialization
+from storyforge.utils.serialization import dumps_line, dumps_pretty
+
+
+def test_matches_stdlib_pretty_output():
+    data = {"mood": "dark", "places": ["Ærwyn", "harbor"], "nested": {"depth": 2}}
+    assert dumps_pretty(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def test_falls_back_without_orjson(monkeypatch):
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert dumps_pretty({"a": [1]}) == '{\n  "a": [\n    1\n  ]\n}'
+
+
+def test_handles_values_orjson_rejects():
+    assert dumps_pretty({"big": 2**70}) == '{\n  "big": 1180591620717411303424\n}'
+
+
+def test_dumps_line_is_one_compact_utf8_line():
+    data = {"place": "Ærwyn", "keys": ["a", "b"]}
+    line = dumps_line(data)
+    assert line == '{"place":"Ærwyn","keys":["a","b"]}\n'.encode("utf-8")
+
+
+def test_dumps_line_without_orjson(monkeypatch):
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert dumps_line({"place": "Ærwyn"}) == '{"place":"Ærwyn"}\n'.encode("utf-8")
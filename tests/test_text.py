@@ -0,0 +1,12 @@
+"""Tests for text measurement utilities."""
+
+import pytest
+
+from storyforge.utils.text import count_words
+
+
+@pytest.mark.parametrize(
+    "text", ["", "   ", "one", "one two", "  lead and trail  ", "tabs\tand\nnewlines\r\nhere"]
+)
+def test_count_words_matches_split(text):
+    assert count_words(text) == len(text.split())
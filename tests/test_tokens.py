@@ -0,0 +1,26 @@
+"""Tests for token counting utilities."""
+
+import pytest
+import tiktoken
+
+from storyforge.utils import tokens
+
+
+@pytest.fixture
+def byte_encoding(monkeypatch):
+    """A tiny offline encoding: one token per byte plus <|endoftext|>."""
+    enc = tiktoken.Encoding(
+        "bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={"<|endoftext|>": 256},
+    )
+    monkeypatch.setattr(tokens, "encoding_for_model", lambda model: enc)
+    return enc
+
+
+def test_special_token_text_is_counted_as_text(byte_encoding):
+    text = "end <|endoftext|>"
+
+    assert tokens.count_tokens_tiktoken(text) == len(text)
+    assert tokens.count_tokens_tiktoken_batch([text, "ab"]) == [len(text), 2]